@@ -10,13 +10,28 @@ except importlib.metadata.PackageNotFoundError as e:  # pragma: no cover
     warnings.warn(f"Could not determine version of {__name__}\n{e!s}", stacklevel=2)
     __version__ = "unknown"
 
-from .api import compare_schemas, compare_tables, inspect, inspect_table
+from .analysis.query_log import QueryLog
+from .api import (
+    compare_schemas,
+    compare_schemas_async,
+    compare_tables,
+    compare_tables_async,
+    inspect,
+    inspect_async,
+    inspect_table,
+)
+from .cache import ResultCache
 from .config import Config
 
 __all__ = [
     "compare_schemas",
+    "compare_schemas_async",
     "compare_tables",
+    "compare_tables_async",
     "inspect",
+    "inspect_async",
     "inspect_table",
     "Config",
+    "QueryLog",
+    "ResultCache",
 ]
@@ -4,8 +4,25 @@
 
 # used to register dialects into sqlalchemy's registry on initial load
 from . import dialects  # noqa
+from .asynchronous import (
+    AsyncQueryInspection,
+    AsyncSchemaComparison,
+    AsyncTableComparison,
+)
+from .connection import ConnectionScope
 from .query_inspection import QueryInspection
 from .schema_comparison import SchemaComparison
 from .table_comparison import TableComparison
+from .timeout import StatementTimeoutError, cancel_statements
 
-__all__ = ["QueryInspection", "SchemaComparison", "TableComparison"]
+__all__ = [
+    "AsyncQueryInspection",
+    "AsyncSchemaComparison",
+    "AsyncTableComparison",
+    "ConnectionScope",
+    "QueryInspection",
+    "SchemaComparison",
+    "StatementTimeoutError",
+    "TableComparison",
+    "cancel_statements",
+]
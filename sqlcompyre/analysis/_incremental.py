@@ -0,0 +1,160 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import contextlib
+import datetime as dt
+import decimal
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+
+class IncrementalState:
+    """Per-key state of a table comparison, persisted in a local SQLite database.
+
+    For every key found in at least one of the compared tables, the state records whether the
+    key is present in the "left" and "right" table and, for joined rows, whether the row and
+    each compared column are equal. Along with the per-key state, the state stores the
+    watermarks up to which rows have been compared.
+    """
+
+    def __init__(self, path: Path, n_columns: int):
+        """
+        Args:
+            path: The path of the SQLite database to persist the state in.
+            n_columns: The number of compared columns.
+        """
+        self.path = path
+        self.n_columns = n_columns
+
+    def watermarks(self) -> tuple[Any, Any] | None:
+        """Obtain the watermarks of the "left" and "right" table up to which rows have been
+        compared or ``None`` if no state has been recorded yet."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT left_watermark, right_watermark FROM meta"
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return _decode_watermark(row[0]), _decode_watermark(row[1])
+        except (KeyError, TypeError, ValueError):
+            # The state was persisted in an unknown format and must be recomputed
+            return None
+
+    def update(self, rows: Iterable[Sequence[Any]], full: bool) -> None:
+        """Update the state of the provided keys along with the watermarks.
+
+        Args:
+            rows: The rows providing the state of individual keys: the (serialized) key, the
+                watermark of the key in the left and right table, whether the key is present
+                in the left table, whether it is present in the right table, whether the
+                joined row is unequal and whether each compared column is equal.
+            full: Whether the rows provide the state of all keys. If so, the state of keys
+                not contained in ``rows`` is dropped and the watermarks are reset.
+        """
+        watermarks = list((None, None) if full else (self.watermarks() or (None, None)))
+
+        def state_rows() -> Iterator[Sequence[Any]]:
+            for key, left_watermark, right_watermark, *flags in rows:
+                for i, watermark in enumerate([left_watermark, right_watermark]):
+                    if watermark is not None and (
+                        watermarks[i] is None or watermark > watermarks[i]
+                    ):
+                        watermarks[i] = watermark
+                yield key, *flags
+
+        placeholders = ", ".join(["?"] * (4 + self.n_columns))
+        with self._connect() as conn:
+            if full:
+                conn.execute("DELETE FROM state")
+            conn.executemany(
+                f"INSERT OR REPLACE INTO state VALUES ({placeholders})", state_rows()
+            )
+            conn.execute("DELETE FROM meta")
+            conn.execute(
+                "INSERT INTO meta VALUES (?, ?)",
+                (_encode_watermark(watermarks[0]), _encode_watermark(watermarks[1])),
+            )
+
+    def totals(self) -> tuple[int, int, int, int, list[int]]:
+        """Aggregate the state of all keys.
+
+        Returns:
+            The number of rows in the left and right table, the number of joined (unequal)
+            rows and the number of equal values per compared column.
+        """
+        equal_columns = "".join(
+            f", COALESCE(SUM(in_left * in_right * c{i}), 0)"
+            for i in range(self.n_columns)
+        )
+        with self._connect() as conn:
+            n_left, n_right, n_joined, n_joined_unequal, *n_equal = conn.execute(
+                "SELECT COALESCE(SUM(in_left), 0), COALESCE(SUM(in_right), 0), "
+                "COALESCE(SUM(in_left * in_right), 0), "
+                f"COALESCE(SUM(in_left * in_right * is_unequal), 0){equal_columns} "
+                "FROM state"
+            ).fetchone()
+        return n_left, n_right, n_joined, n_joined_unequal, n_equal
+
+    # ---------------------------------------------------------------------------------------------
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path)
+        try:
+            # Run all statements within a single transaction
+            with conn:
+                columns = "".join(f", c{i} INTEGER" for i in range(self.n_columns))
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, in_left INTEGER, "
+                    f"in_right INTEGER, is_unequal INTEGER{columns})"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS meta "
+                    "(left_watermark TEXT, right_watermark TEXT)"
+                )
+                yield conn
+        finally:
+            conn.close()
+
+
+# -------------------------------------------------------------------------------------------------
+
+_WATERMARK_TYPES: dict[str, type] = {
+    "datetime": dt.datetime,
+    "date": dt.date,
+    "time": dt.time,
+    "decimal": decimal.Decimal,
+    "int": int,
+    "float": float,
+    "str": str,
+}
+
+
+def _encode_watermark(value: Any) -> str:
+    if value is None:
+        return json.dumps(None)
+    # Subclasses must be matched before their base classes (e.g. datetime before date)
+    for name, type_ in _WATERMARK_TYPES.items():
+        if isinstance(value, type_) and not isinstance(value, bool):
+            serialized = (
+                value.isoformat() if hasattr(value, "isoformat") else str(value)
+            )
+            return json.dumps({"type": name, "value": serialized})
+    raise ValueError(
+        f"Watermarks of type '{type(value).__name__}' are not supported for incremental "
+        "comparisons."
+    )
+
+
+def _decode_watermark(encoded: str) -> Any:
+    value = json.loads(encoded)
+    if value is None:
+        return None
+    type_ = _WATERMARK_TYPES[value["type"]]
+    if hasattr(type_, "fromisoformat"):
+        return type_.fromisoformat(value["value"])
+    return type_(value["value"])
@@ -0,0 +1,187 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import operator
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import sqlalchemy as sa
+
+#: A function that checks which of the "left" values of a column equal the corresponding
+#: "right" values.
+Comparator = Callable[[Sequence[Any], Sequence[Any]], list[bool]]
+
+
+@dataclass
+class MergeJoinStatistics:
+    """Statistics obtained from merge-joining two sorted streams of rows."""
+
+    #: The number of rows in the "left" stream.
+    n_left: int
+    #: The number of rows in the "right" stream.
+    n_right: int
+    #: The number of rows that could be joined.
+    n_joined: int
+    #: The number of joined rows for which at least one value differs.
+    n_joined_unequal: int
+    #: The number of joined rows for which the values are equal, one entry per compared column.
+    n_equal: list[int]
+
+
+def exact_comparator(lhs: Sequence[Any], rhs: Sequence[Any]) -> list[bool]:
+    """Compare two columns of values for equality, considering two NULL values to be
+    equal."""
+    return list(map(operator.eq, lhs, rhs))
+
+
+def float_comparator(precision: float) -> Comparator:
+    """Obtain a comparator that considers two floating point values to be equal if their
+    absolute difference is below the precision."""
+
+    def compare(lhs: Sequence[Any], rhs: Sequence[Any]) -> list[bool]:
+        return [
+            (a is b) if a is None or b is None else abs(a - b) < precision
+            for a, b in zip(lhs, rhs)
+        ]
+
+    return compare
+
+
+def stream_rows(
+    engine: sa.Engine, query: sa.Select, batch_size: int
+) -> Iterator[sa.Row]:
+    """Stream the results of a query via a server-side cursor.
+
+    Args:
+        engine: The engine to use for connecting to the database.
+        query: The query whose results to stream.
+        batch_size: The number of rows to fetch from the database at once.
+
+    Returns:
+        An iterator over all rows returned by the query. At most ``batch_size`` rows are kept
+        in memory at any time.
+    """
+    with engine.connect() as conn:
+        result = conn.execution_options(yield_per=batch_size).execute(query)
+        for partition in result.partitions():
+            yield from partition
+
+
+def merge_join(
+    left: Iterator[Sequence[Any]],
+    right: Iterator[Sequence[Any]],
+    n_keys: int,
+    comparators: list[Comparator],
+    batch_size: int = 10_000,
+) -> MergeJoinStatistics:
+    """Merge-join two streams of rows that are sorted by their keys.
+
+    Each row must provide ``n_keys`` key values followed by one value per comparator. Rows
+    whose key contains a NULL value never join, mirroring SQL semantics. The values of joined
+    rows are collected in batches and compared column by column.
+
+    Args:
+        left: The rows of the "left" table, sorted ascendingly by their keys.
+        right: The rows of the "right" table, sorted ascendingly by their keys.
+        n_keys: The number of key values at the beginning of each row.
+        comparators: The comparators to use for the remaining values of each row.
+        batch_size: The number of joined rows to compare at once.
+
+    Returns:
+        The statistics obtained from joining the two streams.
+
+    Raises:
+        ValueError: If the keys of a stream are not unique or not sorted in the order that
+            Python uses for comparing the keys.
+    """
+    left_stream = _KeyedStream(left, n_keys, "left")
+    right_stream = _KeyedStream(right, n_keys, "right")
+    n_joined = 0
+    n_joined_unequal = 0
+    n_equal = [0] * len(comparators)
+    left_values: list[Sequence[Any]] = []
+    right_values: list[Sequence[Any]] = []
+
+    def compare_batch() -> None:
+        nonlocal n_joined_unequal
+        if len(left_values) == 0:
+            return
+        # Transpose the rows such that each comparator is applied to an entire column
+        equal = [
+            comparator(lhs, rhs)
+            for comparator, lhs, rhs in zip(
+                comparators, zip(*left_values), zip(*right_values)
+            )
+        ]
+        for i, column_equal in enumerate(equal):
+            n_equal[i] += sum(column_equal)
+        if len(equal) > 0:
+            n_joined_unequal += len(left_values) - sum(map(all, zip(*equal)))
+        left_values.clear()
+        right_values.clear()
+
+    lhs, rhs = left_stream.next(), right_stream.next()
+    while lhs is not None and rhs is not None:
+        if lhs[0] < rhs[0]:
+            lhs = left_stream.next()
+        elif rhs[0] < lhs[0]:
+            rhs = right_stream.next()
+        else:
+            n_joined += 1
+            left_values.append(lhs[1])
+            right_values.append(rhs[1])
+            if len(left_values) >= batch_size:
+                compare_batch()
+            lhs, rhs = left_stream.next(), right_stream.next()
+    compare_batch()
+
+    # Consume the remainder of both streams to obtain the full counts
+    left_stream.exhaust()
+    right_stream.exhaust()
+    return MergeJoinStatistics(
+        n_left=left_stream.count,
+        n_right=right_stream.count,
+        n_joined=n_joined,
+        n_joined_unequal=n_joined_unequal,
+        n_equal=n_equal,
+    )
+
+
+# -------------------------------------------------------------------------------------------------
+
+
+class _KeyedStream:
+    """Iterator over rows which splits off keys and validates their order."""
+
+    def __init__(self, rows: Iterator[Sequence[Any]], n_keys: int, name: str):
+        self.rows = rows
+        self.n_keys = n_keys
+        self.name = name
+        self.count = 0
+        self._previous_key: tuple[Any, ...] | None = None
+
+    def next(self) -> tuple[tuple[Any, ...], Sequence[Any]] | None:
+        for row in self.rows:
+            self.count += 1
+            key = tuple(row[: self.n_keys])
+            if any(k is None for k in key):
+                # Keys with NULL values can never be joined
+                continue
+            if self._previous_key is not None and not (self._previous_key < key):
+                if self._previous_key == key:
+                    raise ValueError(
+                        f"The join columns are not unique in the {self.name} table."
+                    )
+                raise ValueError(
+                    f"The rows of the {self.name} table are not sorted consistently with "
+                    "Python's ordering of the join column values. Consider using join columns "
+                    "whose ordering does not depend on a collation."
+                )
+            self._previous_key = key
+            return key, row[self.n_keys :]
+        return None
+
+    def exhaust(self) -> None:
+        for _ in self.rows:
+            self.count += 1
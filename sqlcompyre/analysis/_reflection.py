@@ -0,0 +1,344 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import re
+import threading
+import weakref
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, cast
+
+import sqlalchemy as sa
+
+from sqlcompyre.cache import ResultCache
+
+from .dialects import DialectProtocol
+from .dialects._reflection import ReflectedColumn, build_tables
+
+# Tables are shared across reflections on the same engine for as long as the version of
+# their schema is unchanged. For each engine, we store the shared metadata along with the
+# versions of the schemas whose tables it contains.
+_shared_metadata: weakref.WeakKeyDictionary[
+    sa.Engine, tuple[sa.MetaData, dict[str | None, str]]
+] = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def reflect(
+    engine: sa.Engine,
+    schema: str | None,
+    views: bool,
+    cache: ResultCache | None = None,
+    only: list[str] | None = None,
+) -> list[sa.Table]:
+    """Reflect the tables of a schema.
+
+    If the database provides a version of the schema (see
+    :meth:`~sqlcompyre.analysis.dialects.DialectProtocol.get_schema_version`), reflected
+    tables are added to metadata that is shared across all reflections on the same engine
+    and are not reflected again until the version of the schema changes. Otherwise, tables
+    are reflected anew on every call.
+
+    Args:
+        engine: The engine to use for connecting to the database.
+        schema: The schema whose tables to reflect or ``None`` for the default schema.
+        views: Whether to reflect views in addition to tables.
+        cache: An optional on-disk cache for the reflected table definitions.
+        only: The names of the tables to reflect. If not provided, all tables of the schema
+            are reflected. Names of tables that do not exist are ignored.
+
+    Returns:
+        The reflected tables.
+    """
+    version = _schema_version(engine, schema)
+    if version is None:
+        return _reflect(engine, schema, sa.MetaData(), views, only)
+
+    with _lock:
+        meta, versions = _shared_metadata.setdefault(engine, (sa.MetaData(), {}))
+        if versions.get(schema) != version:
+            # The definitions of the tables might have changed
+            for table in [t for t in meta.tables.values() if t.schema == schema]:
+                meta.remove(table)
+            versions[schema] = version
+        missing = (
+            [name for name in only if _key(schema, name) not in meta.tables]
+            if only is not None
+            else None
+        )
+
+    tables: list[sa.Table] = []
+    if missing is None or len(missing) > 0:
+        # Reflect into separate metadata such that concurrent reflections do not block each
+        # other and only the reflected tables are stored in the cache
+        reflected = _load(engine, schema, views, cache, version, missing)
+        with _lock:
+            # Just like for reflection, tables already present in `meta` are not redefined
+            tables = [table.to_metadata(meta) for table in reflected]
+    if only is None:
+        return tables
+    with _lock:
+        return [
+            meta.tables[key]
+            for name in only
+            if (key := _key(schema, name)) in meta.tables
+        ]
+
+
+def table_names(engine: sa.Engine, schema: str | None, views: bool) -> list[str]:
+    """Obtain the names of the tables of a schema without reflecting the tables.
+
+    Args:
+        engine: The engine to use for connecting to the database.
+        schema: The schema whose table names to obtain or ``None`` for the default schema.
+        views: Whether to include the names of views.
+
+    Returns:
+        The names of the tables.
+    """
+    inspector = sa.inspect(engine)
+    names = inspector.get_table_names(schema)
+    if views:
+        names += inspector.get_view_names(schema)
+    return names
+
+
+class LazyTables(Mapping[str, sa.Table]):
+    """A mapping from names to tables that are reflected only once they are first
+    accessed."""
+
+    def __init__(
+        self,
+        engine: sa.Engine,
+        names: dict[str, tuple[str | None, str]],
+        cache: ResultCache | None = None,
+    ):
+        """
+        Args:
+            engine: The engine to use for reflecting the tables.
+            names: A mapping from the keys of the mapping to the schemas and names of the
+                tables.
+            cache: An optional on-disk cache for the reflected table definitions.
+        """
+        self.engine = engine
+        self.names = names
+        self.cache = cache
+        self._tables: dict[str, sa.Table] = {}
+
+    def __getitem__(self, key: str) -> sa.Table:
+        if key not in self._tables:
+            schema, name = self.names[key]
+            tables = reflect(self.engine, schema, True, self.cache, only=[name])
+            if len(tables) == 0:
+                raise KeyError(key)
+            self._tables[key] = tables[0]
+        return self._tables[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def load(self, keys: Iterable[str]) -> None:
+        """Reflect the tables with the provided keys upfront, with a single reflection per
+        schema.
+
+        Args:
+            keys: The keys of the tables to reflect.
+        """
+        pending: dict[str | None, dict[str, str]] = {}
+        for key in keys:
+            if key not in self._tables:
+                schema, name = self.names[key]
+                pending.setdefault(schema, {})[name] = key
+        for schema, keys_by_name in pending.items():
+            tables = reflect(
+                self.engine, schema, True, self.cache, only=list(keys_by_name)
+            )
+            for table in tables:
+                self._tables[keys_by_name[table.name]] = table
+
+    def placeholder(self, key: str) -> sa.Table:
+        """Obtain a table without columns that merely references the table with the
+        provided key, e.g. for querying the catalog of the database.
+
+        Args:
+            key: The key of the table.
+
+        Returns:
+            The reflected table if it has already been accessed, a table without columns
+            otherwise.
+        """
+        if key in self._tables:
+            return self._tables[key]
+        schema, name = self.names[key]
+        return sa.Table(name, sa.MetaData(), schema=schema)
+
+
+# -------------------------------------------------------------------------------------------------
+
+
+def _load(
+    engine: sa.Engine,
+    schema: str | None,
+    views: bool,
+    cache: ResultCache | None,
+    version: str,
+    only: list[str] | None,
+) -> list[sa.Table]:
+    key = ResultCache.key(
+        result="reflection",
+        url=engine.url.render_as_string(hide_password=True),
+        schema=schema,
+        views=views,
+        version=version,
+        only=sorted(only) if only is not None else None,
+    )
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            tables = _from_description(engine.dialect, schema, cached)
+            if tables is not None:
+                return tables
+
+    tables = _reflect(engine, schema, sa.MetaData(), views, only)
+    if cache is not None:
+        description = _to_description(engine.dialect, tables)
+        if description is not None:
+            cache.set(key, description)
+    return tables
+
+
+def _to_description(
+    dialect: sa.Dialect, tables: list[sa.Table]
+) -> dict[str, Any] | None:
+    """Describe the columns and primary keys of the provided tables in a JSON-serializable
+    way or return ``None`` if the type of any column cannot be restored from its
+    description."""
+    columns = []
+    for table in tables:
+        for column in table.columns:
+            try:
+                type_ = column.type.compile(dialect=dialect)
+            except sa.exc.CompileError:
+                return None
+            restored = _parse_type(dialect, type_)
+            if (
+                restored is None
+                or restored.compile(dialect=dialect) != type_
+                or restored._type_affinity is not column.type._type_affinity
+            ):
+                return None
+            columns.append(
+                {
+                    "table": table.name,
+                    "name": column.name,
+                    "type": type_,
+                    "nullable": column.nullable,
+                }
+            )
+    return {
+        "columns": columns,
+        "primary_keys": {
+            table.name: [c.name for c in table.primary_key] for table in tables
+        },
+    }
+
+
+def _from_description(
+    dialect: sa.Dialect, schema: str | None, description: dict[str, Any]
+) -> list[sa.Table] | None:
+    """Restore tables from the description obtained from :meth:`_to_description` or return
+    ``None`` if the description is invalid."""
+    columns = []
+    try:
+        for column in description["columns"]:
+            type_ = _parse_type(dialect, column["type"])
+            if type_ is None:
+                return None
+            columns.append(
+                ReflectedColumn(
+                    table=column["table"],
+                    name=column["name"],
+                    type=type_,
+                    nullable=column["nullable"],
+                )
+            )
+        return build_tables(sa.MetaData(), schema, columns, description["primary_keys"])
+    except (KeyError, TypeError):
+        return None
+
+
+def _parse_type(dialect: sa.Dialect, type_: str) -> sa.types.TypeEngine | None:
+    """Parse a type as compiled by the provided dialect, e.g. ``VARCHAR(50) COLLATE x`` or
+    ``TIMESTAMP WITH TIME ZONE``."""
+    collation = None
+    if " COLLATE " in type_:
+        type_, collation = type_.split(" COLLATE ", 1)
+        collation = collation.strip('"')
+    match = re.fullmatch(r"([^(]+)(?:\(([^)]*)\))?(.*)", type_)
+    if match is None:
+        return None
+    name = " ".join(part.strip() for part in [match[1], match[3]] if part.strip())
+
+    # Prefer the dialect's names (as used for reflection) over the generic SQL types
+    ischema_names = getattr(dialect, "ischema_names", {})
+    type_cls = next(
+        (
+            ischema_names[candidate]
+            for candidate in [name.lower(), name.upper(), name]
+            if candidate in ischema_names
+        ),
+        getattr(sa.types, name.upper().replace(" ", "_"), None),
+    )
+    if not isinstance(type_cls, type) or not issubclass(type_cls, sa.types.TypeEngine):
+        return None
+
+    kwargs: dict[str, Any] = {}
+    if collation is not None:
+        kwargs["collation"] = collation
+    if "WITH TIME ZONE" in name.upper():
+        kwargs["timezone"] = True
+    try:
+        args = [
+            None if arg.strip().lower() == "max" else int(arg)
+            for arg in (match[2].split(",") if match[2] else [])
+        ]
+        return type_cls(*args, **kwargs)
+    except (TypeError, ValueError):
+        return None
+
+
+def _reflect(
+    engine: sa.Engine,
+    schema: str | None,
+    meta: sa.MetaData,
+    views: bool,
+    only: list[str] | None,
+) -> list[sa.Table]:
+    # Prefer reflecting all tables with a few bulk queries as `MetaData.reflect` issues
+    # multiple queries per table for some database systems
+    try:
+        return cast(DialectProtocol, engine.dialect).reflect_tables(
+            engine, schema, meta, views, only=only
+        )
+    except NotImplementedError:
+        names = set(only) if only is not None else None
+        meta.reflect(
+            bind=engine,
+            schema=schema,
+            views=views,
+            only=(lambda name, _: name in names) if names is not None else None,
+        )
+        return [t for t in meta.tables.values() if t.schema == schema]
+
+
+def _schema_version(engine: sa.Engine, schema: str | None) -> str | None:
+    try:
+        return cast(DialectProtocol, engine.dialect).get_schema_version(engine, schema)
+    except NotImplementedError:
+        return None
+
+
+def _key(schema: str | None, name: str) -> str:
+    return f"{schema}.{name}" if schema is not None else name
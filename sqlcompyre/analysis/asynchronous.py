@@ -0,0 +1,269 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from sqlcompyre.report import Report
+from sqlcompyre.results import ColumnMatches, Counts, Names, RowMatches
+
+from .query_inspection import QueryInspection
+from .schema_comparison import SchemaComparison
+from .table_comparison import TableComparison, _to_fraction_same
+
+T = TypeVar("T")
+
+
+class AsyncTableComparison:
+    """Compare the content of two SQL database tables from within an asyncio event loop.
+
+    All statistics are exposed as coroutines. Independent queries (e.g. the row counts of the
+    two tables) are run concurrently, each on its own connection. If the comparison is
+    configured to compute statistics jointly, from a cache, on a sample, within a single
+    transaction or with a timeout, statistics are instead computed one after the other by the
+    underlying synchronous comparison.
+
+    Note:
+        This class should never be initialized directly. Use the
+        :meth:`~sqlcompyre.api.compare_tables_async` function instead.
+    """
+
+    def __init__(self, engine: AsyncEngine, comparison: TableComparison):
+        """
+        Args:
+            engine: The engine to use for connecting to the database.
+            comparison: A table comparison bound to the synchronous facade of ``engine`` which
+                is used to build the queries.
+        """
+        self.engine = engine
+        self._comparison = comparison
+        self._results: dict[str, asyncio.Future[Any]] = {}
+        self._sync_lock = asyncio.Lock()
+
+    @property
+    def column_names(self) -> Names:
+        """A comparison between the column names of the two tables."""
+        return self._comparison.column_names
+
+    async def join_columns(self) -> list[str]:
+        """The columns used for joining the two tables."""
+        return await self._memoize(
+            "join_columns",
+            lambda: self._compute_synchronously(lambda c: c.join_columns),
+        )
+
+    async def row_counts(self) -> Counts:
+        """A comparison between the number of rows in each table."""
+        return await self._memoize("row_counts", self._compute_row_counts)
+
+    async def row_matches(self) -> RowMatches:
+        """A comparison between the contents of the individual rows in the two tables."""
+        return await self._memoize("row_matches", self._compute_row_matches)
+
+    async def column_matches(self) -> ColumnMatches:
+        """A comparison between the column values of the two tables."""
+        return await self._memoize("column_matches", self._compute_column_matches)
+
+    async def close(self) -> None:
+        """Drop all temporary tables and release the connection held by the underlying
+        comparison, see :meth:`TableComparison.close`."""
+        await self._compute_synchronously(lambda c: c.close())
+
+    async def __aenter__(self) -> "AsyncTableComparison":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def _computed_synchronously(self) -> bool:
+        """Whether statistics must be computed by the synchronous comparison as they depend
+        on options that the concurrent queries do not account for."""
+        comparison = self._comparison
+        return (
+            comparison._statistics_computed_jointly
+            or comparison.sample_fraction is not None
+            or comparison.cache is not None
+            or comparison.scope.isolation_level is not None
+            or comparison.timeout is not None
+        )
+
+    async def _compute_synchronously(self, fn: Callable[[TableComparison], T]) -> T:
+        # The synchronous comparison is not safe to use concurrently, e.g. as it may share a
+        # single connection among its queries
+        async with self._sync_lock:
+            return await _run_sync(self.engine, lambda _: fn(self._comparison))
+
+    async def _compute_row_counts(self) -> Counts:
+        if self._computed_synchronously:
+            return await self._compute_synchronously(lambda c: c.row_counts)
+        with self._comparison.query_log.record("row_counts"):
+            left, right = await asyncio.gather(
+                _count_rows(self.engine, self._comparison.left_table),
+                _count_rows(self.engine, self._comparison.right_table),
+            )
+        return Counts(left=left, right=right)
+
+    async def _compute_row_matches(self) -> RowMatches:
+        if self._computed_synchronously:
+            return await self._compute_synchronously(lambda c: c.row_matches)
+        with self._comparison.query_log.record("row_matches"):
+            await self.join_columns()
+            row_counts, n_joined, n_joined_unequal = await asyncio.gather(
+                self.row_counts(),
+                _count_rows(self.engine, self._comparison._inner_join()),
+                _count_rows(
+                    self.engine,
+                    self._comparison._row_match_queries["joined_unequal"].subquery(),
+                ),
+            )
+        return self._comparison._to_row_matches(
+            row_counts.left, row_counts.right, n_joined, n_joined_unequal
+        )
+
+    async def _compute_column_matches(self) -> ColumnMatches:
+        if self._computed_synchronously:
+            return await self._compute_synchronously(lambda c: c.column_matches)
+        with self._comparison.query_log.record("column_matches"):
+            await self.join_columns()
+            query = self._comparison._fraction_same_query
+            if query is None:
+                return ColumnMatches(fraction_same={}, mismatch_selects={})
+            async with self.engine.connect() as conn:
+                row = (await conn.execute(query)).one()
+        return ColumnMatches(
+            fraction_same=_to_fraction_same(row),
+            mismatch_selects=self._comparison._mismatch_selects,
+        )
+
+    def _memoize(self, name: str, compute: Callable[[], Awaitable[T]]) -> Awaitable[T]:
+        # Store the future rather than the result such that concurrent callers share a single
+        # computation
+        if name not in self._results:
+            self._results[name] = asyncio.ensure_future(compute())
+        return self._results[name]
+
+    def __repr__(self) -> str:
+        return f"Async{self._comparison!r}"
+
+
+# ----------------------------------------- INSPECTION ------------------------------------------ #
+
+
+class AsyncQueryInspection:
+    """Inspect the results of a SQL query from within an asyncio event loop.
+
+    Note:
+        This class should never be initialized directly. Use the
+        :meth:`~sqlcompyre.api.inspect_async` function instead.
+    """
+
+    def __init__(self, engine: AsyncEngine, inspection: QueryInspection):
+        """
+        Args:
+            engine: The engine to use for connecting to the database.
+            inspection: A query inspection bound to the synchronous facade of ``engine`` which
+                is used to build the queries.
+        """
+        self.engine = engine
+        self.query = inspection.query
+        self._inspection = inspection
+
+    async def row_count(self) -> int:
+        """Get the number of rows returned by the query."""
+        return await _count_rows(self.engine, self.query)
+
+    async def distinct_row_count(self, *columns: str) -> int:
+        """Get the number of rows with distinct values wrt. to the provided column(s).
+
+        Args:
+            columns: The set of columns to compute the number of distinct values for. If no
+                columns are provided, the number of distinct rows (across all columns) is computed.
+
+        Returns:
+            The number of distinct rows.
+        """
+        query = self._inspection._distinct_row_count_query(*columns)
+        async with self.engine.connect() as conn:
+            return (await conn.execute(query)).scalar_one()
+
+
+# -------------------------------------- SCHEMA COMPARISON -------------------------------------- #
+
+
+class AsyncSchemaComparison:
+    """Compare two database schemas from within an asyncio event loop.
+
+    Note:
+        This class should never be initialized directly. Use the
+        :meth:`~sqlcompyre.api.compare_schemas_async` function instead.
+    """
+
+    def __init__(self, engine: AsyncEngine, comparison: SchemaComparison):
+        """
+        Args:
+            engine: The engine to use for connecting to the database.
+            comparison: A schema comparison bound to the synchronous facade of ``engine``.
+        """
+        self.engine = engine
+        self._comparison = comparison
+
+    @property
+    def table_counts(self) -> Counts:
+        """A comparison between the number of tables in each schema."""
+        return self._comparison.table_counts
+
+    @property
+    def table_names(self) -> Names:
+        """A comparison between the table names in each schema."""
+        return self._comparison.table_names
+
+    async def summary_report(self) -> Report:
+        """Generate a report that summarizes the schema comparison."""
+        return await _run_sync(self.engine, lambda _: self._comparison.summary_report())
+
+    def compare_matched_table(
+        self,
+        name: str,
+        join_columns: list[str] | None = None,
+        ignore_columns: list[str] | None = None,
+        column_name_mapping: dict[str, str] | None = None,
+        infer_primary_keys: bool = False,
+    ) -> AsyncTableComparison:
+        """A full comparison between the tables in "left" and "right" schema with the
+        specified name. See :meth:`SchemaComparison.compare_matched_table` for a description
+        of all parameters.
+
+        Returns:
+            The full comparison between the tables.
+        """
+        comparison = self._comparison.compare_matched_table(
+            name,
+            join_columns=join_columns,
+            ignore_columns=ignore_columns,
+            column_name_mapping=column_name_mapping,
+            infer_primary_keys=infer_primary_keys,
+        )
+        return AsyncTableComparison(self.engine, comparison)
+
+
+# ----------------------------------------------------------------------------------------------- #
+
+
+async def _run_sync(engine: AsyncEngine, fn: Callable[[sa.Connection], T]) -> T:
+    """Run a function that requires synchronous access to the database. Within ``fn``, the
+    synchronous facade of ``engine`` may also be used."""
+    async with engine.connect() as conn:
+        return await conn.run_sync(fn)
+
+
+async def _count_rows(engine: AsyncEngine, table: sa.FromClause) -> int:
+    async with engine.connect() as conn:
+        result = await conn.execute(sa.select(sa.func.count()).select_from(table))
+        return result.scalar_one()
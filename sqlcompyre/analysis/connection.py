@@ -0,0 +1,96 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import contextlib
+from collections.abc import Iterator
+from typing import Any
+
+import sqlalchemy as sa
+
+
+class ConnectionScope:
+    """Share a single database connection across all queries of an analysis.
+
+    As long as a scope is not opened, every query runs on a new connection from the engine's
+    pool. Once opened (either explicitly via :meth:`open` or by using the scope as a context
+    manager), all queries share a single connection until the scope is closed.
+
+    If an isolation level is provided, the scope is opened automatically and all queries run
+    within a single transaction with this isolation level. For isolation levels such as
+    ``SNAPSHOT`` (MSSQL) or ``REPEATABLE READ``, all results thus describe the same state of
+    the database.
+    """
+
+    def __init__(self, engine: sa.Engine, isolation_level: str | None = None):
+        """
+        Args:
+            engine: The engine to use for connecting to the database.
+            isolation_level: An optional isolation level for the transaction in which all
+                queries are run. Must be supported by the engine's dialect.
+        """
+        self.engine = engine
+        self.isolation_level = isolation_level
+        self._connection: sa.Connection | None = None
+
+    @property
+    def connection(self) -> sa.Connection | None:
+        """The connection held by this scope or ``None`` if the scope is not open."""
+        return self._connection
+
+    def open(self) -> sa.Connection:
+        """Open the scope, i.e. acquire the connection that is shared by all queries. If the
+        scope is already open, this method is a no-op.
+
+        Returns:
+            The connection held by this scope.
+        """
+        if self._connection is None:
+            connection = self.engine.connect()
+            if self.isolation_level is not None:
+                connection.execution_options(isolation_level=self.isolation_level)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the scope, committing the current transaction and releasing the
+        connection."""
+        if self._connection is None:
+            return
+        try:
+            self._connection.commit()
+        finally:
+            self._connection.close()
+            self._connection = None
+
+    @contextlib.contextmanager
+    def connect(self) -> Iterator[sa.Connection]:
+        """Obtain a connection for running queries.
+
+        Returns:
+            A context manager providing the connection held by this scope or, if the scope is
+            not open, a new connection that is closed when the context manager exits.
+        """
+        if self._connection is None and self.isolation_level is not None:
+            self.open()
+        if self._connection is None:
+            with self.engine.connect() as conn:
+                yield conn
+            return
+        try:
+            yield self._connection
+        except BaseException:
+            # Failed (e.g. cancelled) statements may leave the transaction in an aborted
+            # state, rendering the connection unusable for subsequent queries
+            self._connection.rollback()
+            raise
+        if self.isolation_level is None:
+            # Without an explicit isolation level, we do not need to keep the transaction
+            # open and, thus, do not block other connections
+            self._connection.commit()
+
+    def __enter__(self) -> "ConnectionScope":
+        self.open()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -12,7 +12,7 @@ __all__ = ["DialectProtocol"]
 # -------------------------------------------------------------------------------------------------
 
 try:
-    from .mssql import MssqlDialect  # noqa
+    from .mssql import AioodbcMssqlDialect, MssqlDialect  # noqa
 
     MssqlDialect.supports_statement_cache = False
     registry.register(
@@ -20,6 +20,11 @@ try:
         "sqlcompyre.analysis.dialects",
         "MssqlDialect",
     )
+    registry.register(
+        "mssql.aioodbc",
+        "sqlcompyre.analysis.dialects",
+        "AioodbcMssqlDialect",
+    )
 except ImportError:
     pass
 
@@ -28,13 +33,18 @@ except ImportError:
 # -------------------------------------------------------------------------------------------------
 
 try:
-    from .sqlite import SQLiteDialect  # noqa
+    from .sqlite import AioSQLiteDialect, SQLiteDialect  # noqa
 
     registry.register(
         "sqlite",
         "sqlcompyre.analysis.dialects",
         "SQLiteDialect",
     )
+    registry.register(
+        "sqlite.aiosqlite",
+        "sqlcompyre.analysis.dialects",
+        "AioSQLiteDialect",
+    )
 except ImportError:
     pass
 
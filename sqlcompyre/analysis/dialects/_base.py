@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from datetime import datetime
-from typing import Protocol
+from typing import Any, Protocol
 
 import sqlalchemy as sa
 
@@ -37,6 +37,15 @@ class DialectProtocol(Protocol):
     case_insensitive_collation: str
     #: Whether views have a notion of NOT NULL columns.
     views_support_notnull_columns: bool
+    #: Whether the database supports ``EXCEPT ALL``, i.e. set differences of multisets.
+    supports_except_all: bool
+    #: Whether the driver can provide query results as Arrow record batches via
+    #: :meth:`fetch_arrow`.
+    supports_arrow_fetch: bool
+    #: Whether :meth:`row_hash` is based on a strong hash function (e.g. a cryptographic
+    #: hash) such that equal row counts and sums of row hashes reliably indicate equal
+    #: tables.
+    strong_row_hash: bool
 
     def get_table_creation_timestamps(
         self, engine: sa.Engine, tables: list[sa.Table]
@@ -55,3 +64,158 @@ class DialectProtocol(Protocol):
         raise NotImplementedError(
             f"{self.__class__.__name__} does not support querying table creation timestamps"
         )
+
+    def get_table_size_estimates(
+        self, engine: sa.Engine, tables: list[sa.Table]
+    ) -> list[int | None]:
+        """Obtain estimates of the sizes of a list of tables from the database catalog,
+        without scanning the tables.
+
+        Args:
+            engine: The engine to use for connecting to the database and querying the catalog.
+            tables: The list of tables to estimate the sizes of.
+
+        Returns:
+            The estimated sizes of the tables in bytes, ordered in the same way as the input.
+            ``None`` for tables whose size cannot be estimated, e.g. views.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support estimating table sizes"
+        )
+
+    def reflect_tables(
+        self,
+        engine: sa.Engine,
+        schema: str | None,
+        metadata: sa.MetaData,
+        views: bool,
+        only: list[str] | None = None,
+    ) -> list[sa.Table]:
+        """Reflect all tables of a schema with a few bulk queries against the catalog of the
+        database, rather than the multiple queries per table issued by
+        :meth:`sqlalchemy.MetaData.reflect`. Only columns (with their types and
+        nullability) and primary keys are reflected.
+
+        Args:
+            engine: The engine to use for connecting to the database and querying the catalog.
+            schema: The schema whose tables to reflect or ``None`` for the default schema.
+            metadata: The metadata to add the reflected tables to.
+            views: Whether to reflect views in addition to tables.
+            only: The names of the tables to reflect. If not provided, all tables of the
+                schema are reflected. Names of tables that do not exist are ignored.
+
+        Returns:
+            The reflected tables.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support bulk reflection of tables"
+        )
+
+    def get_schema_version(self, engine: sa.Engine, schema: str | None) -> str | None:
+        """Obtain a cheap marker of the definitions of all tables and views in a schema from
+        the catalog of the database.
+
+        Args:
+            engine: The engine to use for connecting to the database and querying the catalog.
+            schema: The schema to obtain the marker for or ``None`` for the default schema.
+
+        Returns:
+            A string that changes whenever a table or view of the schema is created, altered
+            or dropped or ``None`` if no reliable marker can be obtained, e.g. for in-memory
+            databases.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support versioning schemas"
+        )
+
+    def row_hash(self, columns: list[sa.ColumnElement]) -> sa.ColumnElement[int]:
+        """Obtain an expression that hashes the values of the provided columns on the
+        database server.
+
+        Args:
+            columns: The columns whose values to hash.
+
+        Returns:
+            An expression evaluating to a non-negative integer smaller than ``2^31`` for each
+            row. The same values must always produce the same hash.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support hashing rows"
+        )
+
+    def get_table_fingerprint(self, engine: sa.Engine, table: sa.Table) -> str | None:
+        """Obtain a cheap fingerprint of the contents of a table, e.g. from the database
+        catalog, without scanning the table.
+
+        Args:
+            engine: The engine to use for connecting to the database.
+            table: The table to fingerprint.
+
+        Returns:
+            A string that changes whenever the contents of the table change or ``None`` if no
+            reliable fingerprint can be obtained for the table.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support fingerprinting tables"
+        )
+
+    def temporary_table(
+        self, name: str, metadata: sa.MetaData, *columns: sa.Column
+    ) -> sa.Table:
+        """Define a temporary table that is only visible to the connection creating it.
+
+        Args:
+            name: The name of the table.
+            metadata: The metadata to attach the table to.
+            columns: The columns of the table.
+
+        Returns:
+            The table definition. The table still needs to be created.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support temporary tables"
+        )
+
+    def explain(self, cursor: Any, statement: str, parameters: Any) -> str:
+        """Obtain the query plan of a statement without executing it.
+
+        Args:
+            cursor: The DBAPI cursor to use for obtaining the query plan.
+            statement: The compiled statement to explain.
+            parameters: The parameters of the statement.
+
+        Returns:
+            A textual representation of the query plan.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support explaining statements"
+        )
+
+    def cancel(self, dbapi_connection: Any, cursor: Any) -> None:
+        """Cancel the statement that is currently executed via a cursor. This method is
+        called from a different thread than the one executing the statement.
+
+        Args:
+            dbapi_connection: The DBAPI connection executing the statement.
+            cursor: The DBAPI cursor executing the statement.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support cancelling statements"
+        )
+
+    def fetch_arrow(self, cursor: Any, batch_size: int) -> Any:
+        """Obtain the rows of the statement that was last executed via a cursor as Arrow
+        record batches, without converting them to Python objects. Only called if
+        :attr:`supports_arrow_fetch` is set, in which case the statement is executed without
+        ``stream_results`` such that no rows are fetched from the cursor beforehand.
+
+        Args:
+            cursor: The DBAPI cursor that executed the statement.
+            batch_size: The (maximum) number of rows per record batch.
+
+        Returns:
+            A ``pyarrow.RecordBatchReader`` providing the rows.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support fetching Arrow record batches"
+        )
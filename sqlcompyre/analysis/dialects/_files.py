@@ -0,0 +1,31 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+
+
+def database_file_fingerprint(
+    database: str | None, journal_suffixes: list[str]
+) -> str | None:
+    """Fingerprint the contents of a file-based database via the modification times and
+    sizes of the database file and its journal files.
+
+    Args:
+        database: The path to the database file.
+        journal_suffixes: The suffixes that are appended to the path of the database file to
+            obtain the paths of the journal files.
+
+    Returns:
+        The fingerprint or ``None`` for in-memory databases.
+    """
+    if not database or database == ":memory:":
+        return None
+    parts = []
+    for path in [database] + [database + suffix for suffix in journal_suffixes]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            parts.append("-")
+            continue
+        parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+    return "|".join(parts)
@@ -0,0 +1,85 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import hashlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import sqlalchemy as sa
+
+
+@dataclass
+class ReflectedColumn:
+    """A column of a table or view as read from the catalog of the database."""
+
+    #: The name of the table or view that the column belongs to.
+    table: str
+    #: The name of the column.
+    name: str
+    #: The type of the column.
+    type: sa.types.TypeEngine
+    #: Whether the column may contain NULL values.
+    nullable: bool
+
+
+def build_tables(
+    metadata: sa.MetaData,
+    schema: str | None,
+    columns: Iterable[ReflectedColumn],
+    primary_keys: dict[str, list[str]],
+) -> list[sa.Table]:
+    """Build table objects from columns and primary keys read from the catalog of the
+    database.
+
+    Args:
+        metadata: The metadata to add the tables to.
+        schema: The schema of the tables.
+        columns: The columns of all tables, ordered by their position within a table.
+        primary_keys: A mapping from table names to the names of their primary key columns,
+            ordered by their position in the primary key. Tables without primary key may be
+            omitted.
+
+    Returns:
+        The tables in the order in which they first appear in ``columns``. Just like for
+        :meth:`sqlalchemy.MetaData.reflect`, tables that are already present in the metadata
+        are not redefined.
+    """
+    tables: dict[str, list[sa.Column]] = {}
+    for column in columns:
+        tables.setdefault(column.table, []).append(
+            sa.Column(column.name, column.type, nullable=column.nullable)
+        )
+    result = []
+    for name, table_columns in tables.items():
+        key = f"{schema}.{name}" if schema is not None else name
+        if key in metadata.tables:
+            result.append(metadata.tables[key])
+            continue
+        primary_key = primary_keys.get(name)
+        result.append(
+            sa.Table(
+                name,
+                metadata,
+                *table_columns,
+                *([sa.PrimaryKeyConstraint(*primary_key)] if primary_key else []),
+                schema=schema,
+            )
+        )
+    return result
+
+
+def definitions_digest(rows: Iterable[Sequence[Any]]) -> str:
+    """Compute a digest of the definitions of tables and views as read from the catalog of
+    the database.
+
+    Args:
+        rows: The rows describing the definitions, in a deterministic order.
+
+    Returns:
+        A hexadecimal digest that changes whenever any of the definitions change.
+    """
+    digest = hashlib.sha256()
+    for row in rows:
+        digest.update(repr(tuple(row)).encode())
+    return digest.hexdigest()
@@ -1,9 +1,14 @@
 # Copyright (c) QuantCo 2025-2025
 # SPDX-License-Identifier: BSD-3-Clause
 
+from typing import Any
+
+import sqlalchemy as sa
 from duckdb_engine import Dialect as SqlAlchemyDuckdbDialect
 
 from ._base import DialectProtocol
+from ._files import database_file_fingerprint
+from ._reflection import ReflectedColumn, build_tables, definitions_digest
 
 
 class DuckDBDialect(SqlAlchemyDuckdbDialect, DialectProtocol):  # type: ignore
@@ -14,3 +19,145 @@ class DuckDBDialect(SqlAlchemyDuckdbDialect, DialectProtocol):  # type: ignore
     case_sensitive_collation: str = "BINARY"
     case_insensitive_collation: str = "NOCASE"
     views_support_notnull_columns: bool = False
+    supports_except_all: bool = True
+    supports_arrow_fetch: bool = True
+    strong_row_hash: bool = True
+
+    def get_table_size_estimates(
+        self, engine: sa.Engine, tables: list[sa.Table]
+    ) -> list[int | None]:
+        query = sa.text(
+            "SELECT schema_name, table_name, estimated_size, column_count "
+            "FROM duckdb_tables()"
+        )
+        with engine.connect() as conn:
+            # DuckDB only estimates the number of rows, we assume 8 bytes per value
+            estimates = {
+                (schema, name): n_rows * n_columns * 8
+                for schema, name, n_rows, n_columns in conn.execute(query)
+            }
+        return [estimates.get((t.schema or "main", t.name)) for t in tables]
+
+    def reflect_tables(
+        self,
+        engine: sa.Engine,
+        schema: str | None,
+        metadata: sa.MetaData,
+        views: bool,
+        only: list[str] | None = None,
+    ) -> list[sa.Table]:
+        # Views do not appear in `duckdb_tables()`, i.e. restricting to its entries excludes
+        # them
+        objects = "SELECT table_name FROM duckdb_tables() WHERE {where}"
+        if views:
+            objects += " UNION ALL SELECT view_name FROM duckdb_views() WHERE {where}"
+        where = (
+            "database_name = current_database() AND schema_name = :schema "
+            "AND NOT internal"
+        )
+        only_condition = "AND table_name IN :only" if only is not None else ""
+        columns_query = sa.text(
+            f"""
+            SELECT table_name, column_name, data_type, is_nullable, numeric_precision,
+                numeric_scale
+            FROM duckdb_columns()
+            WHERE {where} AND table_name IN ({objects.format(where=where)})
+                {only_condition}
+            ORDER BY table_name, column_index
+            """
+        )
+        pk_query = sa.text(
+            f"""
+            SELECT table_name, constraint_column_names
+            FROM duckdb_constraints()
+            WHERE database_name = current_database() AND schema_name = :schema
+                AND constraint_type = 'PRIMARY KEY' {only_condition}
+            """
+        )
+        params: dict[str, Any] = {"schema": schema or "main"}
+        if only is not None:
+            columns_query = columns_query.bindparams(
+                sa.bindparam("only", expanding=True)
+            )
+            pk_query = pk_query.bindparams(sa.bindparam("only", expanding=True))
+            params["only"] = only
+        with engine.connect() as conn:
+            rows = conn.execute(columns_query, params).all()
+            primary_keys = {
+                table: list(columns)
+                for table, columns in conn.execute(pk_query, params)
+            }
+        return build_tables(
+            metadata,
+            schema,
+            [
+                ReflectedColumn(
+                    table=table,
+                    name=column,
+                    type=self._reflected_type(data_type, precision, scale),
+                    nullable=nullable,
+                )
+                for table, column, data_type, nullable, precision, scale in rows
+            ],
+            primary_keys,
+        )
+
+    def _reflected_type(
+        self, data_type: str, precision: int | None, scale: int | None
+    ) -> sa.types.TypeEngine:
+        match data_type.split("(")[0]:
+            case "DECIMAL":
+                return sa.Numeric(precision, scale)
+            case "DOUBLE":
+                return sa.Double()
+            case "BLOB":
+                return sa.LargeBinary()
+            case "TIMESTAMP WITH TIME ZONE":
+                return sa.DateTime(timezone=True)
+            case "JSON":
+                return sa.String()
+        type_ = self.ischema_names.get(data_type.lower())
+        return type_() if type_ is not None else sa.types.NULLTYPE
+
+    def row_hash(self, columns: list[sa.ColumnElement]) -> sa.ColumnElement[int]:
+        return sa.func.hash(*columns) % 2147483648
+
+    def get_table_fingerprint(self, engine: sa.Engine, table: sa.Table) -> str | None:
+        return database_file_fingerprint(engine.url.database, [".wal"])
+
+    def get_schema_version(self, engine: sa.Engine, schema: str | None) -> str | None:
+        if not engine.url.database or engine.url.database == ":memory:":
+            return None
+        # DuckDB does not expose a schema version, the definitions stored in the catalog are
+        # a cheap and exact substitute
+        where = (
+            "database_name = current_database() AND schema_name = :schema "
+            "AND NOT internal"
+        )
+        query = sa.text(
+            f"""
+            SELECT 'table', table_name, sql FROM duckdb_tables() WHERE {where}
+            UNION ALL
+            SELECT 'view', view_name, sql FROM duckdb_views() WHERE {where}
+            ORDER BY 1, 2
+            """
+        )
+        with engine.connect() as conn:
+            return definitions_digest(conn.execute(query, {"schema": schema or "main"}))
+
+    def temporary_table(
+        self, name: str, metadata: sa.MetaData, *columns: sa.Column
+    ) -> sa.Table:
+        return sa.Table(name, metadata, *columns, prefixes=["TEMPORARY"])
+
+    def explain(self, cursor: Any, statement: str, parameters: Any) -> str:
+        cursor.execute(f"EXPLAIN {statement}", parameters)
+        return "\n".join(row[-1] for row in cursor.fetchall())
+
+    def cancel(self, dbapi_connection: Any, cursor: Any) -> None:
+        dbapi_connection.interrupt()
+
+    def fetch_arrow(self, cursor: Any, batch_size: int) -> Any:
+        # `to_arrow_reader` supersedes `fetch_record_batch` in recent versions of DuckDB
+        fetch = getattr(cursor, "to_arrow_reader", None) or cursor.fetch_record_batch
+        return fetch(batch_size)
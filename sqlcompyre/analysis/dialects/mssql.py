@@ -1,12 +1,18 @@
 # Copyright (c) QuantCo 2024-2025
 # SPDX-License-Identifier: BSD-3-Clause
 
+import functools
 from datetime import datetime
+from typing import Any
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.mssql import VARBINARY
+from sqlalchemy.dialects.mssql import base as mssql_base
 from sqlalchemy.dialects.mssql import dialect as SqlAlchemyMssqlDialect  # noqa: N812
+from sqlalchemy.dialects.mssql.aioodbc import MSDialectAsync_aioodbc
 
 from ._base import DialectProtocol
+from ._reflection import ReflectedColumn, build_tables
 
 
 class MssqlDialect(SqlAlchemyMssqlDialect, DialectProtocol):  # type: ignore
@@ -19,6 +25,9 @@ class MssqlDialect(SqlAlchemyMssqlDialect, DialectProtocol):  # type: ignore
     case_sensitive_collation: str = "Latin1_General_CS_AS"
     case_insensitive_collation: str = "SQL_Latin1_General_CP1_CI_AS"
     views_support_notnull_columns: bool = True
+    supports_except_all: bool = False
+    supports_arrow_fetch: bool = False
+    strong_row_hash: bool = True
 
     def get_table_creation_timestamps(
         self, engine: sa.Engine, tables: list[sa.Table]
@@ -89,3 +98,291 @@ class MssqlDialect(SqlAlchemyMssqlDialect, DialectProtocol):  # type: ignore
                 mapping[full_name] = create_date
 
         return [mapping[str(t)] for t in tables]
+
+    def get_table_size_estimates(
+        self, engine: sa.Engine, tables: list[sa.Table]
+    ) -> list[int | None]:
+        # Tables may reside in different databases, each providing its own partition stats
+        databases: dict[str | None, list[str]] = {}
+        for table in tables:
+            name = str(table)
+            db = name.split(".")[0] if name.count(".") > 1 else None
+            databases.setdefault(db, []).append(name)
+
+        estimates: dict[str, int] = {}
+        with engine.connect() as conn:
+            for db, names in databases.items():
+                sys_schema = "sys" if db is None else f"{db}.sys"
+                query = sa.text(
+                    f"""
+                    SELECT s.name + '.' + o.name, SUM(p.used_page_count) * 8192
+                    FROM {sys_schema}.dm_db_partition_stats p
+                    JOIN {sys_schema}.objects o ON o.object_id = p.object_id
+                    JOIN {sys_schema}.schemas s ON s.schema_id = o.schema_id
+                    GROUP BY s.name, o.name
+                    """
+                )
+                try:
+                    result = conn.execute(query)
+                except sa.exc.DBAPIError:
+                    # Most likely, we lack the permission to view the database state
+                    conn.rollback()
+                    continue
+                for name, size in result:
+                    estimates[name if db is None else f"{db}.{name}"] = size
+        return [estimates.get(str(t)) for t in tables]
+
+    def reflect_tables(
+        self,
+        engine: sa.Engine,
+        schema: str | None,
+        metadata: sa.MetaData,
+        views: bool,
+        only: list[str] | None = None,
+    ) -> list[sa.Table]:
+        # Multi-part schemas reference the catalog of another database
+        db, schema_name = (
+            schema.split(".", 1)
+            if schema is not None and "." in schema
+            else (None, schema)
+        )
+        sys_schema = "sys" if db is None else f"{db}.sys"
+        object_types = "'U', 'V'" if views else "'U'"
+        schema_condition = (
+            "s.name = :schema" if schema_name is not None else "s.name = SCHEMA_NAME()"
+        )
+        if only is not None:
+            schema_condition += " AND o.name IN :only"
+        columns_query = sa.text(
+            f"""
+            SELECT o.name, c.name, t.name, bt.name, c.is_nullable, c.max_length,
+                c.precision, c.scale, c.collation_name
+            FROM {sys_schema}.columns c
+            JOIN {sys_schema}.objects o ON o.object_id = c.object_id
+            JOIN {sys_schema}.schemas s ON s.schema_id = o.schema_id
+            JOIN {sys_schema}.types t ON t.user_type_id = c.user_type_id
+            LEFT JOIN {sys_schema}.types bt
+                ON bt.system_type_id = t.system_type_id
+                AND bt.user_type_id = bt.system_type_id
+            WHERE {schema_condition} AND o.type IN ({object_types})
+            ORDER BY o.name, c.column_id
+            """
+        )
+        pk_query = sa.text(
+            f"""
+            SELECT o.name, c.name
+            FROM {sys_schema}.indexes i
+            JOIN {sys_schema}.index_columns ic
+                ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+            JOIN {sys_schema}.columns c
+                ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+            JOIN {sys_schema}.objects o ON o.object_id = i.object_id
+            JOIN {sys_schema}.schemas s ON s.schema_id = o.schema_id
+            WHERE {schema_condition} AND i.is_primary_key = 1
+            ORDER BY o.name, ic.key_ordinal
+            """
+        )
+        params: dict[str, Any] = (
+            {"schema": schema_name} if schema_name is not None else {}
+        )
+        if only is not None:
+            columns_query = columns_query.bindparams(
+                sa.bindparam("only", expanding=True)
+            )
+            pk_query = pk_query.bindparams(sa.bindparam("only", expanding=True))
+            params["only"] = only
+        with engine.connect() as conn:
+            rows = conn.execute(columns_query, params).all()
+            primary_keys: dict[str, list[str]] = {}
+            for table, column in conn.execute(pk_query, params):
+                primary_keys.setdefault(table, []).append(column)
+        return build_tables(
+            metadata,
+            schema,
+            [
+                ReflectedColumn(
+                    table=table,
+                    name=column,
+                    type=self._reflected_type(
+                        type_name,
+                        base_type_name,
+                        max_length,
+                        precision,
+                        scale,
+                        collation,
+                    ),
+                    nullable=bool(nullable),
+                )
+                for (
+                    table,
+                    column,
+                    type_name,
+                    base_type_name,
+                    nullable,
+                    max_length,
+                    precision,
+                    scale,
+                    collation,
+                ) in rows
+            ],
+            primary_keys,
+        )
+
+    def _reflected_type(
+        self,
+        type_name: str,
+        base_type_name: str | None,
+        max_length: int,
+        precision: int,
+        scale: int,
+        collation: str | None,
+    ) -> sa.types.TypeEngine:
+        # Mirrors the type resolution of `MSDialect.get_columns`
+        type_ = self.ischema_names.get(type_name)
+        if type_ is None and base_type_name is not None:
+            type_ = self.ischema_names.get(base_type_name)
+        if type_ is None:
+            return sa.types.NULLTYPE
+
+        kwargs: dict[str, Any] = {}
+        length = max_length if max_length != -1 else None
+        if type_ in (mssql_base.MSBinary, mssql_base.MSVarBinary, sa.LargeBinary):
+            kwargs["length"] = length
+        elif type_ in (mssql_base.MSString, mssql_base.MSChar):
+            kwargs["length"] = length
+        elif type_ in (mssql_base.MSNVarchar, mssql_base.MSNChar):
+            # The length of unicode strings is reported in bytes
+            kwargs["length"] = length // 2 if length is not None else None
+        if (
+            type_
+            in (
+                mssql_base.MSString,
+                mssql_base.MSChar,
+                mssql_base.MSNVarchar,
+                mssql_base.MSNChar,
+                mssql_base.MSText,
+                mssql_base.MSNText,
+            )
+            and collation
+        ):
+            kwargs["collation"] = collation
+        if issubclass(type_, sa.Numeric):
+            kwargs["precision"] = precision
+            if not issubclass(type_, sa.Float):
+                kwargs["scale"] = scale
+        return type_(**kwargs)
+
+    def row_hash(self, columns: list[sa.ColumnElement]) -> sa.ColumnElement[int]:
+        # BINARY_CHECKSUM ignores text, ntext, image and xml values and collides easily. We
+        # therefore hash the binary representation of all values with SHA-256. Each value is
+        # prefixed by its length and NULL values are replaced by a marker that cannot start a
+        # prefixed value such that the concatenation is unambiguous.
+        values: list[sa.ColumnElement] = [
+            sa.func.isnull(
+                sa.cast(sa.func.datalength(c), VARBINARY(4)).op("+")(
+                    sa.cast(c, VARBINARY("max"))
+                ),
+                sa.literal_column("0xFF"),
+            )
+            for c in columns
+        ]
+        data = functools.reduce(lambda lhs, rhs: lhs.op("+")(rhs), values)
+        digest = sa.func.hashbytes(sa.literal_column("'SHA2_256'"), data)
+        # The first four bytes of the digest provide the hash, the bitwise AND clears the sign
+        # bit
+        return sa.cast(sa.func.substring(digest, 1, 4), sa.Integer).op("&")(2147483647)
+
+    def get_table_fingerprint(self, engine: sa.Engine, table: sa.Table) -> str | None:
+        # The modification date only reflects changes of the table definition. Changes of the
+        # data are tracked via the row count and the last update from the index usage
+        # statistics. As these statistics are reset when the server restarts, we cannot
+        # fingerprint tables that have not been updated since the last restart.
+        name = str(table)
+        sys_schema = f"{name.split('.')[0]}.sys" if name.count(".") > 1 else "sys"
+        query = sa.text(
+            f"""
+            SELECT o.type, o.modify_date, SUM(p.rows), MAX(u.last_user_update)
+            FROM {sys_schema}.objects o
+            LEFT JOIN {sys_schema}.partitions p
+                ON p.object_id = o.object_id AND p.index_id IN (0, 1)
+            LEFT JOIN sys.dm_db_index_usage_stats u
+                ON u.object_id = o.object_id AND u.database_id = DB_ID(:db)
+            WHERE o.object_id = OBJECT_ID(:name)
+            GROUP BY o.type, o.modify_date
+            """
+        )
+        try:
+            with engine.connect() as conn:
+                result = conn.execute(
+                    query,
+                    {
+                        "name": name,
+                        "db": name.split(".")[0] if name.count(".") > 1 else None,
+                    },
+                ).one_or_none()
+        except sa.exc.DBAPIError:
+            # Most likely, we lack the permission to view the index usage statistics
+            return None
+        if result is None:
+            return None
+        object_type, modify_date, n_rows, last_user_update = result
+        if object_type.strip() != "U" or last_user_update is None:
+            # Views depend on other tables and cannot be fingerprinted
+            return None
+        return f"{modify_date.isoformat()}|{n_rows}|{last_user_update.isoformat()}"
+
+    def get_schema_version(self, engine: sa.Engine, schema: str | None) -> str | None:
+        # Altering a table updates its modification date, creating or dropping objects
+        # changes the number of objects and the checksum of their IDs
+        db, schema_name = (
+            schema.split(".", 1)
+            if schema is not None and "." in schema
+            else (None, schema)
+        )
+        sys_schema = "sys" if db is None else f"{db}.sys"
+        schema_condition = (
+            "s.name = :schema" if schema_name is not None else "s.name = SCHEMA_NAME()"
+        )
+        query = sa.text(
+            f"""
+            SELECT COUNT(*), CHECKSUM_AGG(o.object_id), MAX(o.modify_date)
+            FROM {sys_schema}.objects o
+            JOIN {sys_schema}.schemas s ON s.schema_id = o.schema_id
+            WHERE {schema_condition}
+            """
+        )
+        params = {"schema": schema_name} if schema_name is not None else {}
+        with engine.connect() as conn:
+            n_objects, checksum, modify_date = conn.execute(query, params).one()
+        if modify_date is None:
+            return None
+        return f"{n_objects}|{checksum}|{modify_date.isoformat()}"
+
+    def temporary_table(
+        self, name: str, metadata: sa.MetaData, *columns: sa.Column
+    ) -> sa.Table:
+        # Local temporary tables are identified by their name
+        return sa.Table(f"#{name}", metadata, *columns)
+
+    def explain(self, cursor: Any, statement: str, parameters: Any) -> str:
+        # With SHOWPLAN_TEXT enabled, statements are not executed but their plans are
+        # returned as result sets
+        cursor.execute("SET SHOWPLAN_TEXT ON")
+        try:
+            cursor.execute(statement, parameters)
+            lines: list[str] = []
+            while True:
+                if cursor.description is not None:
+                    lines.extend(row[0] for row in cursor.fetchall())
+                if not cursor.nextset():
+                    break
+        finally:
+            cursor.execute("SET SHOWPLAN_TEXT OFF")
+        return "\n".join(lines)
+
+    def cancel(self, dbapi_connection: Any, cursor: Any) -> None:
+        cursor.cancel()
+
+
+class AioodbcMssqlDialect(MssqlDialect, MSDialectAsync_aioodbc):  # type: ignore
+    """Dialect for Microsoft SQL Server, accessed asynchronously via ``aioodbc``."""
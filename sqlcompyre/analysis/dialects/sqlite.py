@@ -1,10 +1,17 @@
 # Copyright (c) QuantCo 2024-2024
 # SPDX-License-Identifier: BSD-3-Clause
 
+import re
+import zlib
+from typing import Any
 
+import sqlalchemy as sa
 from sqlalchemy.dialects.sqlite import dialect as SqlAlchemySqliteDialect  # noqa: N812
+from sqlalchemy.dialects.sqlite.aiosqlite import SQLiteDialect_aiosqlite
 
 from ._base import DialectProtocol
+from ._files import database_file_fingerprint
+from ._reflection import ReflectedColumn, build_tables, definitions_digest
 
 
 class SQLiteDialect(SqlAlchemySqliteDialect, DialectProtocol):  # type: ignore
@@ -15,3 +22,119 @@ class SQLiteDialect(SqlAlchemySqliteDialect, DialectProtocol):  # type: ignore
     case_sensitive_collation: str = "BINARY"
     case_insensitive_collation: str = "NOCASE"
     views_support_notnull_columns: bool = False
+    supports_except_all: bool = False
+    supports_arrow_fetch: bool = False
+    strong_row_hash: bool = False
+
+    def on_connect(self):
+        # SQLite does not provide any hash functions, we therefore register our own function
+        # on every new connection.
+        super_on_connect = super().on_connect()
+
+        def on_connect(dbapi_connection):
+            if super_on_connect is not None:
+                super_on_connect(dbapi_connection)
+            dbapi_connection.create_function(
+                _HASH_FUNCTION, -1, _hash, deterministic=True
+            )
+
+        return on_connect
+
+    def row_hash(self, columns: list[sa.ColumnElement]) -> sa.ColumnElement[int]:
+        return getattr(sa.func, _HASH_FUNCTION)(*columns)
+
+    def reflect_tables(
+        self,
+        engine: sa.Engine,
+        schema: str | None,
+        metadata: sa.MetaData,
+        views: bool,
+        only: list[str] | None = None,
+    ) -> list[sa.Table]:
+        schema_name = schema or "main"
+        types = ["table", "view"] if views else ["table"]
+        query = sa.text(
+            f"""
+            SELECT m.name, p.name, p.type, p."notnull", p.pk
+            FROM "{schema_name}".sqlite_master m
+            JOIN pragma_table_xinfo(m.name, :schema) p
+            WHERE m.type IN ({", ".join(f"'{t}'" for t in types)})
+                AND m.name NOT LIKE 'sqlite~_%' ESCAPE '~'
+                AND p.hidden != 1
+                {"AND m.name IN :only" if only is not None else ""}
+            ORDER BY m.name, p.cid
+            """
+        )
+        params: dict[str, Any] = {"schema": schema_name}
+        if only is not None:
+            query = query.bindparams(sa.bindparam("only", expanding=True))
+            params["only"] = only
+        with engine.connect() as conn:
+            rows = conn.execute(query, params).all()
+
+        primary_keys: dict[str, list[tuple[int, str]]] = {}
+        for table, column, _, _, pk in rows:
+            if pk > 0:
+                primary_keys.setdefault(table, []).append((pk, column))
+        return build_tables(
+            metadata,
+            schema,
+            [
+                ReflectedColumn(
+                    table=table,
+                    name=column,
+                    # Types of generated columns are suffixed with "GENERATED ALWAYS"
+                    type=self._resolve_type_affinity(
+                        re.sub(r"\s*GENERATED\s+ALWAYS", "", type_.upper())
+                    ),
+                    nullable=not notnull,
+                )
+                for table, column, type_, notnull, _ in rows
+            ],
+            {
+                table: [column for _, column in sorted(pk)]
+                for table, pk in primary_keys.items()
+            },
+        )
+
+    def get_table_fingerprint(self, engine: sa.Engine, table: sa.Table) -> str | None:
+        return database_file_fingerprint(engine.url.database, ["-wal", "-journal"])
+
+    def get_schema_version(self, engine: sa.Engine, schema: str | None) -> str | None:
+        if not engine.url.database or engine.url.database == ":memory:":
+            return None
+        # The `schema_version` pragma is a counter that starts over for recreated database
+        # files. Hashing the definitions stored in the catalog is just as cheap and exact.
+        query = sa.text(
+            f"""
+            SELECT type, name, sql FROM "{schema or "main"}".sqlite_master
+            ORDER BY type, name
+            """
+        )
+        with engine.connect() as conn:
+            return definitions_digest(conn.execute(query))
+
+    def temporary_table(
+        self, name: str, metadata: sa.MetaData, *columns: sa.Column
+    ) -> sa.Table:
+        return sa.Table(name, metadata, *columns, prefixes=["TEMPORARY"])
+
+    def explain(self, cursor: Any, statement: str, parameters: Any) -> str:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return "\n".join(row[-1] for row in cursor.fetchall())
+
+    def cancel(self, dbapi_connection: Any, cursor: Any) -> None:
+        dbapi_connection.interrupt()
+
+
+class AioSQLiteDialect(SQLiteDialect, SQLiteDialect_aiosqlite):  # type: ignore
+    """Dialect for SQLite, accessed asynchronously via ``aiosqlite``."""
+
+
+# -------------------------------------------------------------------------------------------------
+
+_HASH_FUNCTION = "sqlcompyre_hash"
+
+
+def _hash(*values: Any) -> int:
+    return zlib.crc32(repr(values).encode()) & 0x7FFFFFFF
@@ -9,6 +9,9 @@ from typing import Any
 
 import sqlalchemy as sa
 
+from .connection import ConnectionScope
+from .query_log import QueryLog, traced
+
 
 class QueryInspection:
     """Inspect the results of a SQL query.
@@ -18,24 +21,40 @@ class QueryInspection:
         or :meth:`~sqlcompyre.api.inspect_table` functions instead.
     """
 
-    def __init__(self, engine: sa.Engine, query: sa.FromClause):
+    def __init__(
+        self,
+        engine: sa.Engine,
+        query: sa.FromClause,
+        scope: ConnectionScope | None = None,
+        query_log: QueryLog | None = None,
+    ):
         """
         Args:
             engine: The engine to use for connecting to the database.
             query: The query whose results to inspect.
+            scope: The connection scope to run all queries in. If not provided, a new scope
+                that does not hold on to a connection is used.
+            query_log: The log to record all executed statements in. If not provided, a new
+                log is created.
         """
         self.engine = engine
         self.query = query
+        self.scope = scope or ConnectionScope(engine)
+        #: The log of all statements executed by this inspection.
+        self.query_log = query_log or QueryLog()
+        self.query_log.attach(engine)
 
     @cached_property
+    @traced
     def row_count(self) -> int:
         """Get the number of rows returned by the query."""
-        with self.engine.connect() as conn:
+        with self.scope.connect() as conn:
             return conn.execute(
                 sa.select(sa.func.count()).select_from(self.query)
             ).scalar_one()
 
     @lru_cache
+    @traced
     def distinct_row_count(self, *columns: str) -> int:
         """Get the number of rows with distinct values wrt. to the provided column(s).
 
@@ -46,7 +65,10 @@ class QueryInspection:
         Returns:
             The number of distinct rows.
         """
+        with self.scope.connect() as conn:
+            return conn.execute(self._distinct_row_count_query(*columns)).scalar_one()
 
+    def _distinct_row_count_query(self, *columns: str) -> sa.Select:
         if len(columns) == 0:
             data_query = sa.select(self.query).distinct()
 
@@ -57,9 +79,7 @@ class QueryInspection:
                 .select_from(self.query)
             )
 
-        count_query = sa.select(sa.func.count()).select_from(data_query.subquery())
-        with self.engine.connect() as conn:
-            return conn.execute(count_query).scalar_one()
+        return sa.select(sa.func.count()).select_from(data_query.subquery())
 
     @lru_cache
     def column_stats(self, column: str) -> ColumnStats:
@@ -71,7 +91,9 @@ class QueryInspection:
         Returns:
             An object providing access to column statistics.
         """
-        return ColumnStats(self.engine, self.query.c[column])
+        return ColumnStats(
+            self.engine, self.query.c[column], self.scope, self.query_log
+        )
 
 
 # ----------------------------------------- COLUMN STATS ---------------------------------------- #
@@ -81,20 +103,31 @@ class QueryInspection:
 class ColumnStats:
     """Obtain statistics about column values in a table."""
 
-    def __init__(self, engine: sa.Engine, column: sa.ColumnElement):
+    def __init__(
+        self,
+        engine: sa.Engine,
+        column: sa.ColumnElement,
+        scope: ConnectionScope | None = None,
+        query_log: QueryLog | None = None,
+    ):
         self.engine = engine
         self.column = column
+        self.scope = scope or ConnectionScope(engine)
+        self.query_log = query_log or QueryLog()
+        self.query_log.attach(engine)
 
     @cached_property
+    @traced
     def min(self) -> Any | None:
         """The minimum value in the column."""
         query = sa.select(sa.func.min(self.column))
-        with self.engine.connect() as conn:
+        with self.scope.connect() as conn:
             return conn.execute(query).scalar()
 
     @cached_property
+    @traced
     def max(self) -> Any | None:
         """The maximum value in the column."""
         query = sa.select(sa.func.max(self.column))
-        with self.engine.connect() as conn:
+        with self.scope.connect() as conn:
             return conn.execute(query).scalar()
@@ -0,0 +1,237 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import contextlib
+import contextvars
+import functools
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any, Concatenate, ParamSpec, Protocol, TypeVar, cast
+
+import sqlalchemy as sa
+
+from .dialects import DialectProtocol
+from .timeout import statement_timeout
+
+
+@dataclass
+class QueryLogEntry:
+    """A single statement executed against the database."""
+
+    #: The compiled SQL statement as sent to the database.
+    statement: str
+    #: The parameters of the statement.
+    parameters: Any
+    #: The wall time in seconds spent executing the statement and fetching its results.
+    duration: float
+    #: The number of rows returned (or, for statements not returning rows, affected) by the
+    #: statement. ``None`` if the database does not report the number of affected rows.
+    rows: int | None
+    #: The (nested) properties that triggered the statement, separated by slashes, e.g.
+    #: ``row_matches/row_counts``. ``None`` if the statement was not triggered by a property.
+    trigger: str | None
+    #: The query plan of the statement if the log captures query plans and the dialect
+    #: supports it.
+    plan: str | None = None
+
+
+class QueryLog:
+    """Log of all statements that are executed by an analysis.
+
+    Statements are recorded for all engines that the log is attached to, but only while the
+    analysis is computing one of its properties. Statements executed concurrently by other
+    code are not recorded.
+    """
+
+    def __init__(self, explain: bool = False):
+        """
+        Args:
+            explain: Whether to capture the query plan of every ``SELECT`` statement. The plan
+                is obtained by running an additional ``EXPLAIN`` statement prior to the actual
+                statement.
+        """
+        self.explain = explain
+        #: The recorded statements in the order of their execution.
+        self.entries: list[QueryLogEntry] = []
+
+    @property
+    def duration(self) -> float:
+        """The total wall time spent executing all recorded statements."""
+        return sum(entry.duration for entry in self.entries)
+
+    def timings(self) -> dict[str, tuple[int, float]]:
+        """Aggregate the recorded statements by the property that triggered them.
+
+        Returns:
+            A mapping from triggers to the number of statements and their total wall time,
+            ordered by the first execution of a statement with the trigger.
+        """
+        result: dict[str, tuple[int, float]] = {}
+        for entry in self.entries:
+            trigger = entry.trigger or "<unknown>"
+            count, duration = result.get(trigger, (0, 0.0))
+            result[trigger] = (count + 1, duration + entry.duration)
+        return result
+
+    def clear(self) -> None:
+        """Remove all recorded statements."""
+        self.entries.clear()
+
+    def attach(self, engine: sa.Engine) -> None:
+        """Record statements executed via the provided engine. Attaching an engine multiple
+        times is a no-op."""
+        for identifier, fn in [
+            ("before_cursor_execute", _before_cursor_execute),
+            ("after_cursor_execute", _after_cursor_execute),
+        ]:
+            if not sa.event.contains(engine, identifier, fn):
+                sa.event.listen(engine, identifier, fn)
+
+    @contextlib.contextmanager
+    def record(self, trigger: str) -> Iterator[None]:
+        """Record all statements that are executed within the context manager.
+
+        Args:
+            trigger: The name of the property that causes the statements to be executed. If
+                the context manager is nested within another one of the same log, the name is
+                appended to the outer trigger.
+        """
+        active = _ACTIVE.get()
+        path = (
+            (*active[1], trigger)
+            if active is not None and active[0] is self
+            else (trigger,)
+        )
+        token = _ACTIVE.set((self, path))
+        try:
+            yield
+        finally:
+            _ACTIVE.reset(token)
+
+
+class _Traceable(Protocol):
+    query_log: QueryLog
+
+
+S = TypeVar("S", bound=_Traceable)
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def traced(fn: Callable[Concatenate[S, P], T]) -> Callable[Concatenate[S, P], T]:
+    """Decorator for methods of analyses, recording all statements executed by the method in
+    the analysis' query log with the name of the method as trigger. If the analysis defines a
+    ``timeout``, statements are cancelled once they exceed it."""
+
+    @functools.wraps(fn)
+    def wrapper(self: S, *args: P.args, **kwargs: P.kwargs) -> T:
+        with (
+            self.query_log.record(fn.__name__),
+            statement_timeout(getattr(self, "timeout", None)),
+        ):
+            return fn(self, *args, **kwargs)
+
+    return wrapper
+
+
+# ----------------------------------------------------------------------------------------------- #
+
+#: The log that statements are currently recorded in along with the path of triggers.
+_ACTIVE: contextvars.ContextVar[tuple[QueryLog, tuple[str, ...]] | None] = (
+    contextvars.ContextVar("sqlcompyre_query_log", default=None)
+)
+
+
+def _before_cursor_execute(
+    conn: sa.Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    active = _ACTIVE.get()
+    if active is None or context is None:
+        return
+    log, path = active
+    plan = None
+    if log.explain and statement.lstrip()[:6].upper() in ("SELECT", "WITH"):
+        dialect = cast(DialectProtocol, conn.dialect)
+        # Use a raw cursor to not record the EXPLAIN statement itself
+        plan_cursor = conn.connection.dbapi_connection.cursor()  # type: ignore
+        try:
+            plan = dialect.explain(plan_cursor, statement, parameters)
+        except NotImplementedError:
+            pass
+        finally:
+            plan_cursor.close()
+    context._sqlcompyre_query = (
+        log,
+        QueryLogEntry(
+            statement=statement,
+            parameters=parameters,
+            duration=0.0,
+            rows=None,
+            trigger="/".join(path),
+            plan=plan,
+        ),
+        time.perf_counter(),
+    )
+
+
+def _after_cursor_execute(
+    conn: sa.Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    recording = getattr(context, "_sqlcompyre_query", None)
+    if recording is None:
+        return
+    log, entry, start = recording
+    entry.duration = time.perf_counter() - start
+    if cursor.description is not None:
+        # Count the returned rows (and the time spent fetching them) as results are
+        # consumed
+        entry.rows = 0
+        context.cursor = _RecordingCursor(cursor, entry)
+    elif cursor.rowcount is not None and cursor.rowcount >= 0:
+        entry.rows = cursor.rowcount
+    log.entries.append(entry)
+    del context._sqlcompyre_query
+
+
+class _RecordingCursor:
+    """Proxy for a DBAPI cursor that records the number of fetched rows and the time spent
+    fetching them."""
+
+    def __init__(self, cursor: Any, entry: QueryLogEntry):
+        self._cursor = cursor
+        self._entry = entry
+
+    def fetchone(self) -> Any:
+        start = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._entry.duration += time.perf_counter() - start
+        if row is not None:
+            self._entry.rows = cast(int, self._entry.rows) + 1
+        return row
+
+    def fetchmany(self, *args: Any, **kwargs: Any) -> Any:
+        return self._fetch(self._cursor.fetchmany, *args, **kwargs)
+
+    def fetchall(self) -> Any:
+        return self._fetch(self._cursor.fetchall)
+
+    def _fetch(self, fetch: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        rows = fetch(*args, **kwargs)
+        self._entry.duration += time.perf_counter() - start
+        self._entry.rows = cast(int, self._entry.rows) + len(rows)
+        return rows
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
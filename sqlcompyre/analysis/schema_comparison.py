@@ -1,19 +1,27 @@
 # Copyright (c) QuantCo 2024-2025
 # SPDX-License-Identifier: BSD-3-Clause
 
+import contextvars
 import logging
 import re
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import cached_property
 from typing import Literal, cast
 
 import sqlalchemy as sa
 from tqdm.auto import tqdm
 
+from sqlcompyre.cache import ResultCache
 from sqlcompyre.report import Report
 from sqlcompyre.results import Counts, Names
 
+from ._reflection import LazyTables
 from .dialects import DialectProtocol
+from .query_log import QueryLog, traced
 from .table_comparison import TableComparison
+from .timeout import StatementTimeoutError
+from .timeout import attach as attach_timeout
 
 
 class SchemaComparison:
@@ -29,11 +37,15 @@ class SchemaComparison:
         engine: sa.Engine,
         left_schema: str,
         right_schema: str,
-        left_tables: dict[str, sa.Table],
-        right_tables: dict[str, sa.Table],
+        left_tables: Mapping[str, sa.Table],
+        right_tables: Mapping[str, sa.Table],
         float_precision: float,
         collation: str | None,
         ignore_casing: bool,
+        cache: ResultCache | None = None,
+        isolation_level: str | None = None,
+        query_log: QueryLog | None = None,
+        timeout: float | None = None,
     ):
         """
         Args:
@@ -41,13 +53,21 @@ class SchemaComparison:
             left_schema: The name of the "left" schema. Purely informational.
             right_schema: The name of the "right" schema. Purely informational.
             left_tables: A mapping from fully-qualified table names to all tables in the "left"
-                schema.
+                schema. Tables may be reflected lazily once they are first accessed.
             right_tables: A mapping from fully-qualified table names to all tables in the "right"
-                schema.
+                schema. Tables may be reflected lazily once they are first accessed.
             float_precision: The precision of floating point comparisons.
             collation: An optional collation to use for comparing string columns.
             ignore_casing: Whether casing (e.g. capitalization) should be ignored when matching
                 table names.
+            cache: An optional cache for the results of table comparisons.
+            isolation_level: An optional isolation level for the transactions that table
+                comparisons are run in.
+            query_log: The log to record all executed statements in, including the ones of
+                table comparisons obtained from this schema comparison. If not provided, a new
+                log is created.
+            timeout: An optional number of seconds after which a single statement of table
+                comparisons is cancelled.
         """
         self.engine = engine
         self.left_schema = left_schema
@@ -57,6 +77,13 @@ class SchemaComparison:
         self.float_precision = float_precision
         self.collation = collation
         self.ignore_casing = ignore_casing
+        self.cache = cache
+        self.isolation_level = isolation_level
+        #: The log of all statements executed by this comparison.
+        self.query_log = query_log or QueryLog()
+        self.query_log.attach(engine)
+        self.timeout = timeout
+        attach_timeout(engine)
 
     # ---------------------------------------------------------------------------------------------
     # COMPARISON
@@ -108,32 +135,7 @@ class SchemaComparison:
         Returns:
             The full comparison between the tables.
         """
-        if self.ignore_casing:
-            # Find table names irrespective of casing
-            if name.lower() not in self.table_names.in_common:
-                raise ValueError(
-                    "The table name is not available in at least one schema."
-                )
-
-            left_mapping = {
-                name.lower(): table for name, table in self.left_tables.items()
-            }
-            left_table = left_mapping[name.lower()]
-
-            right_mapping = {
-                name.lower(): table for name, table in self.right_tables.items()
-            }
-            right_table = right_mapping[name.lower()]
-        else:
-            # Find table name with correct casing
-            if name not in self.table_names.in_common:
-                raise ValueError(
-                    "The table name is not available in at least one schema."
-                )
-
-            left_table = self.left_tables[name]
-            right_table = self.right_tables[name]
-
+        left_table, right_table = self._matched_tables(name)
         return TableComparison(
             engine=self.engine,
             left_table=left_table,
@@ -145,8 +147,46 @@ class SchemaComparison:
             collation=self.collation,
             ignore_casing=self.ignore_casing,
             infer_primary_keys=infer_primary_keys,
+            cache=self.cache,
+            isolation_level=self.isolation_level,
+            query_log=self.query_log,
+            timeout=self.timeout,
         )
 
+    def _matched_tables(self, name: str) -> tuple[sa.Table, sa.Table]:
+        """Find the "left" and "right" table matched by the provided name."""
+        left_name, right_name = self._matched_names(name)
+        return self.left_tables[left_name], self.right_tables[right_name]
+
+    def _matched_names(self, name: str) -> tuple[str, str]:
+        """Find the names of the "left" and "right" table matched by the provided name."""
+        if self.ignore_casing:
+            # Find table names irrespective of casing
+            if name.lower() not in self.table_names.in_common:
+                raise ValueError(
+                    "The table name is not available in at least one schema."
+                )
+
+            left_mapping = {name.lower(): name for name in self.left_tables}
+            right_mapping = {name.lower(): name for name in self.right_tables}
+            return left_mapping[name.lower()], right_mapping[name.lower()]
+
+        # Find table name with correct casing
+        if name not in self.table_names.in_common:
+            raise ValueError("The table name is not available in at least one schema.")
+        return name, name
+
+    def _reflect_matched_tables(self) -> None:
+        """Reflect all tables that are available in both schemas at once rather than when
+        they are first compared."""
+        names = [self._matched_names(name) for name in self.table_names.in_common]
+        for tables, keys in [
+            (self.left_tables, [left for left, _ in names]),
+            (self.right_tables, [right for _, right in names]),
+        ]:
+            if isinstance(tables, LazyTables):
+                tables.load(keys)
+
     # ---------------------------------------------------------------------------------------------
     # SUMMARY REPORT
     # ---------------------------------------------------------------------------------------------
@@ -164,6 +204,7 @@ class SchemaComparison:
             },
         )
 
+    @traced
     def table_reports(
         self,
         ignore_tables: list[str] | None = None,
@@ -172,6 +213,7 @@ class SchemaComparison:
         infer_primary_keys: bool = False,
         sort_by: Literal["name", "creation_timestamp"] = "name",
         verbose: bool = True,
+        max_workers: int = 1,
     ) -> dict[str, Report]:
         """Generate reports for all tables matched between the schemas.
 
@@ -187,7 +229,7 @@ class SchemaComparison:
                 provided columns are ignored to evaluate equality.
             skip_equal: Whether to skip reports about tables which are equal in the two schemas.
                 Tables that cannot be compared for equality (e.g. because they have no primary key)
-                are still included.
+                or whose equality cannot be determined within the timeout are still included.
             infer_primary_keys: Whether primary keys should be inferred if compared tables do not
                 have matching primary key(s).
             sort_by: The strategy for sorting the table reports. Either alphabetically by the name
@@ -195,6 +237,12 @@ class SchemaComparison:
                 in the "left" schema (``creation_timestamp``). Note that the latter option is not
                 supported for all database systems.
             verbose: Whether to show a progress bar for the report generation.
+            max_workers: The number of tables to compare concurrently. Each concurrent table
+                comparison uses its own connection, i.e. the connection pool of the engine
+                should allow for at least this many connections. Where the database provides
+                size estimates of the tables, the largest tables are compared first such that
+                workers do not idle while the last tables are compared, and the progress bar
+                estimates the remaining time from the sizes of the tables.
 
         Returns:
             A mapping from matched table names to the reports of their comparisons, ordered by the
@@ -205,26 +253,60 @@ class SchemaComparison:
         ]
         ignore_table_columns = ignore_table_columns or {}
 
-        result = {}
-        pbar = tqdm(self.table_names.in_common, disable=not verbose)
-        for table in pbar:
+        if max_workers < 1:
+            raise ValueError("The number of workers must be at least 1.")
+        tables = []
+        for table in self.table_names.in_common:
             if any(pattern.match(table) for pattern in ignore_table_patterns):
                 logging.info("Ignoring table %s.", table)
                 continue
+            tables.append(table)
 
-            pbar.set_description(f"Processing '{table}'")
-            comparison = self.compare_matched_table(
-                table,
-                ignore_columns=(
-                    ignore_table_columns[table]
-                    if table in ignore_table_columns
-                    else None
-                ),
-                infer_primary_keys=infer_primary_keys,
-            )
-            if skip_equal and comparison.equal:
-                continue
-            result[table] = comparison.summary_report()
+        # Schedule the largest tables first (longest-processing-time-first) and weight the
+        # progress by the sizes of the tables
+        sizes = self._estimate_sizes(tables)
+        schedule = (
+            sorted(tables, key=lambda table: sizes[table], reverse=True)
+            if sizes is not None
+            else tables
+        )
+        weights = sizes or {table: 1 for table in tables}
+
+        reports: dict[str, Report | None] = {}
+        pbar = tqdm(
+            total=sum(weights.values()),
+            disable=not verbose,
+            **(dict(unit="B", unit_scale=True) if sizes is not None else {}),
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    # Record statements of all tables in the query log
+                    contextvars.copy_context().run,
+                    self._table_report,
+                    table,
+                    ignore_columns=ignore_table_columns.get(table),
+                    skip_equal=skip_equal,
+                    infer_primary_keys=infer_primary_keys,
+                ): table
+                for table in schedule
+            }
+            try:
+                for future in as_completed(futures):
+                    reports[futures[future]] = future.result()
+                    pbar.set_description(f"Processed '{futures[future]}'")
+                    pbar.update(weights[futures[future]])
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+            finally:
+                pbar.close()
+
+        # Restore the order of the table names irrespective of the order of completion
+        result = {
+            table: report for table in tables if (report := reports[table]) is not None
+        }
 
         match sort_by:
             case "name":
@@ -233,13 +315,69 @@ class SchemaComparison:
                 timestamps = cast(
                     DialectProtocol, self.engine.dialect
                 ).get_table_creation_timestamps(
-                    self.engine, [self.left_tables[name] for name in result]
+                    self.engine,
+                    [
+                        _placeholder(self.left_tables, self._matched_names(name)[0])
+                        for name in result
+                    ],
                 )
                 return {
                     name: result[name]
                     for name, _ in sorted(zip(result, timestamps), key=lambda x: x[1])
                 }
 
+    def _estimate_sizes(self, tables: list[str]) -> dict[str, int] | None:
+        """Estimate the combined size of the "left" and "right" table for each of the
+        provided matched tables or ``None`` if the database does not provide estimates."""
+        # Sizes are obtained from the catalog, hence, the tables need not be reflected
+        pairs = [
+            (
+                _placeholder(self.left_tables, left),
+                _placeholder(self.right_tables, right),
+            )
+            for left, right in map(self._matched_names, tables)
+        ]
+        try:
+            estimates = cast(
+                DialectProtocol, self.engine.dialect
+            ).get_table_size_estimates(self.engine, [t for pair in pairs for t in pair])
+        except NotImplementedError:
+            return None
+        sizes = [
+            None if left is None or right is None else left + right
+            for left, right in zip(estimates[::2], estimates[1::2])
+        ]
+        known = sorted(size for size in sizes if size is not None)
+        if len(known) == 0:
+            return None
+        # Tables without estimates (e.g. views) are assumed to be of median size
+        median = known[len(known) // 2]
+        return {
+            table: max(size if size is not None else median, 1)
+            for table, size in zip(tables, sizes)
+        }
+
+    def _table_report(
+        self,
+        table: str,
+        ignore_columns: list[str] | None,
+        skip_equal: bool,
+        infer_primary_keys: bool,
+    ) -> Report | None:
+        """Generate the report for a single matched table or ``None`` if it is skipped."""
+        # Run all queries of a table comparison on a single connection
+        with (
+            self.query_log.record(table),
+            self.compare_matched_table(
+                table,
+                ignore_columns=ignore_columns,
+                infer_primary_keys=infer_primary_keys,
+            ) as comparison,
+        ):
+            if skip_equal and _is_equal(table, comparison):
+                return None
+            return comparison.summary_report()
+
     # ---------------------------------------------------------------------------------------------
     # STRING REPRESENTATION
     # ---------------------------------------------------------------------------------------------
@@ -252,3 +390,24 @@ class SchemaComparison:
             f"{self.__class__.__name__}"
             f'(left_schema="{self.left_schema}", right_schema="{self.right_schema}")'
         )
+
+
+# ----------------------------------------------------------------------------------------------- #
+
+
+def _is_equal(table: str, comparison: TableComparison) -> bool:
+    try:
+        return comparison.equal
+    except StatementTimeoutError as exc:
+        logging.warning(
+            "Equality of '%s' could not be determined (%s): including it in the reports.",
+            table,
+            exc,
+        )
+        return False
+
+
+def _placeholder(tables: Mapping[str, sa.Table], name: str) -> sa.Table:
+    if isinstance(tables, LazyTables):
+        return tables.placeholder(name)
+    return tables[name]
@@ -1,14 +1,56 @@
 # Copyright (c) QuantCo 2024-2025
 # SPDX-License-Identifier: BSD-3-Clause
 
+import contextlib
+import contextvars
+import dataclasses
 import functools
+import itertools
+import json
 import logging
+import math
+import uuid
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import cached_property
+from pathlib import Path
+from typing import Any, Literal, TypedDict, TypeVar, cast
 
 import sqlalchemy as sa
 
+from sqlcompyre.cache import ResultCache, table_fingerprint, table_identity
 from sqlcompyre.report import Report
-from sqlcompyre.results import ColumnMatches, Counts, Names, RowMatches
+from sqlcompyre.results import (
+    ColumnMatches,
+    Counts,
+    Names,
+    RowMatches,
+    Skipped,
+    TopChanges,
+)
+
+from ._incremental import IncrementalState
+from ._merge_join import (
+    exact_comparator,
+    float_comparator,
+    merge_join,
+    stream_rows,
+)
+from .connection import ConnectionScope
+from .dialects import DialectProtocol
+from .query_log import QueryLog, traced
+from .timeout import StatementTimeoutError
+from .timeout import attach as attach_timeout
+
+T = TypeVar("T")
+
+
+class _RowMatchQueries(TypedDict):
+    unjoined_left: sa.Select
+    unjoined_right: sa.Select
+    joined_equal: sa.Select
+    joined_unequal: sa.Select
+    joined_total: sa.Select
 
 
 class TableComparison:
@@ -31,6 +73,17 @@ class TableComparison:
         collation: str | None,
         ignore_casing: bool,
         infer_primary_keys: bool,
+        fused: bool = False,
+        right_engine: sa.Engine | None = None,
+        batch_size: int = 10_000,
+        partitions: int = 1,
+        sample_fraction: float | None = None,
+        cache: ResultCache | None = None,
+        watermark_column: str | None = None,
+        materialize: bool = False,
+        isolation_level: str | None = None,
+        query_log: QueryLog | None = None,
+        timeout: float | None = None,
     ):
         """
         Args:
@@ -48,8 +101,50 @@ class TableComparison:
             ignore_casing: Whether casing (e.g. capitalization) should be ignored when matching
                 column names.
             infer_primary_keys: Whether to infer primary keys if none are available.
+            fused: Whether to compute row counts, row matches and column matches from a single
+                aggregate query over a full outer join instead of issuing one query per
+                statistic.
+            right_engine: The engine to use for connecting to the database of the "right"
+                table. If not provided, both tables are accessed via ``engine``. If provided
+                and different from ``engine``, the tables are compared by streaming both of
+                them, ordered by the join columns, and merge-joining them in Python. Note that
+                the queries provided by row and column matches reference both tables and can,
+                thus, not be executed in this case.
+            batch_size: The number of rows to fetch at once when streaming tables from
+                different engines.
+            partitions: The number of ranges to split the domain of the first join column
+                into. Each range is compared with a single aggregate query and the queries are
+                run concurrently.
+            sample_fraction: If provided, row and column matches are only computed for a
+                deterministic sample of the rows, selected via a hash of the join columns.
+                Column matches are then reported with 95% confidence intervals.
+            cache: An optional cache for row counts, row matches and column matches. Results
+                are only cached if both tables can be fingerprinted.
+            watermark_column: An optional column of the "left" table whose values increase
+                whenever a row is inserted or updated. If provided, only rows with a watermark
+                larger than the one recorded in the previous comparison are compared and the
+                results are combined with the per-key state persisted in ``cache``.
+            materialize: Whether to materialize the join keys of all joined rows along with
+                one equality flag per compared column into a temporary table. Row matches,
+                column matches, the queries they provide and top changes are then derived
+                from this table. As it stores no column values, queries for rows join it
+                with the tables via the join keys. It cannot be combined with fused,
+                partitioned or incremental comparisons. The temporary table is bound to
+                :attr:`connection`.
+            isolation_level: An optional isolation level (e.g. ``SNAPSHOT`` or
+                ``REPEATABLE READ``). If provided, all queries of this comparison are run on a
+                single connection within a single transaction with this isolation level such
+                that all results describe the same state of the database.
+            query_log: The log to record all executed statements in. If not provided, a new
+                log is created.
+            timeout: An optional number of seconds after which a single statement is
+                cancelled, raising a :class:`~sqlcompyre.analysis.StatementTimeoutError`.
+                Sections of the summary report whose statements time out are marked as
+                skipped.
         """
         self.engine = engine
+        self.right_engine = right_engine or engine
+        self.batch_size = batch_size
         self.left_table = left_table.alias("left")
         self.right_table = right_table.alias("right")
         self.column_name_mapping = _identity_column_mapping_if_needed(
@@ -62,6 +157,70 @@ class TableComparison:
         self.float_precision = float_precision
         self.collation = collation
         self.ignore_casing = ignore_casing
+        self.fused = fused
+        self.partitions = partitions
+        self.sample_fraction = sample_fraction
+        self.cache = cache
+        self.watermark_column = watermark_column
+        self.materialize = materialize
+        #: The scope that manages the connection shared by all queries of this comparison.
+        self.scope = ConnectionScope(engine, isolation_level)
+        #: The log of all statements executed by this comparison.
+        self.query_log = query_log or QueryLog()
+        self.query_log.attach(self.engine)
+        self.query_log.attach(self.right_engine)
+        self.timeout = timeout
+        attach_timeout(self.engine)
+        attach_timeout(self.right_engine)
+
+        if timeout is not None and timeout <= 0:
+            raise ValueError("The timeout must be positive.")
+        if self._is_cross_engine and fused:
+            raise ValueError("Tables from different engines cannot be compared fused.")
+        if self._is_cross_engine and collation is not None:
+            raise ValueError(
+                "A collation cannot be used to compare tables from different engines."
+            )
+        if partitions < 1:
+            raise ValueError("The number of partitions must be at least 1.")
+        if self._is_cross_engine and partitions > 1:
+            raise ValueError(
+                "Tables from different engines cannot be compared in partitions."
+            )
+        if fused and partitions > 1:
+            raise ValueError("Fused comparisons cannot be combined with partitions.")
+        if sample_fraction is not None and not 0 < sample_fraction <= 1:
+            raise ValueError("The sample fraction must be in the interval (0, 1].")
+        if self._is_cross_engine and sample_fraction is not None:
+            raise ValueError("Tables from different engines cannot be sampled.")
+        if materialize and (self._is_cross_engine or sample_fraction is not None):
+            raise ValueError(
+                "Materialized comparisons cannot be combined with tables from different "
+                "engines or sampling."
+            )
+        if materialize and (fused or partitions > 1 or watermark_column is not None):
+            raise ValueError(
+                "Materialized comparisons cannot be combined with fused, partitioned or "
+                "incremental comparisons."
+            )
+        if isolation_level is not None and (self._is_cross_engine or partitions > 1):
+            raise ValueError(
+                "An isolation level cannot be combined with tables from different engines or "
+                "partitions as they require multiple connections."
+            )
+        if watermark_column is not None:
+            if cache is None:
+                raise ValueError("Incremental comparisons require a cache.")
+            if self._is_cross_engine or sample_fraction is not None:
+                raise ValueError(
+                    "Incremental comparisons cannot be combined with tables from different "
+                    "engines or sampling."
+                )
+            if fused or partitions > 1:
+                raise ValueError(
+                    "Incremental comparisons cannot be combined with fused comparisons or "
+                    "partitions."
+                )
 
         self._user_join_columns = join_columns or []
         self._infer_primary_keys = infer_primary_keys
@@ -71,17 +230,24 @@ class TableComparison:
     # ---------------------------------------------------------------------------------------------
 
     @cached_property
+    @traced
     def join_columns(self) -> list[str]:
         """The columns used for joining the two tables."""
         pks = _join_columns_from_pk_if_needed(
-            self.engine,
             self.left_table,
             self.right_table,
             self._user_join_columns,
             ignore_casing=self.ignore_casing,
             column_name_mapping=self.column_name_mapping,
-            infer_primary_keys=self._infer_primary_keys,
         )
+        if not pks:
+            if not self._infer_primary_keys:
+                raise ValueError(
+                    "No matching primary keys found and no join columns specified. Consider "
+                    "specifying `ignore_casing` if your column names are case-sensitive or "
+                    "`infer_primary_keys` if your table does not have a primary key."
+                )
+            pks = self._infer_join_columns()
         return sorted(pks)
 
     # ---------------------------------------------------------------------------------------------
@@ -89,61 +255,167 @@ class TableComparison:
     # ---------------------------------------------------------------------------------------------
 
     @cached_property
+    @traced
     def equal(self) -> bool:
-        """Whether the compared tables are equal."""
+        """Whether the compared tables are equal.
+
+        The check stops at the first difference it finds: it compares the column names and
+        the row counts before probing for a single unjoined or unequal row. Row matches are
+        only used if they are already available or computed jointly with the row counts
+        anyway.
+        """
+        if (
+            len(self.column_names.missing_left) > 0
+            or len(self.column_names.missing_right) > 0
+        ):
+            return False
         try:
-            return (
-                len(self.column_names.missing_left) == 0
-                and len(self.column_names.missing_right) == 0
-                and self.row_matches.n_joined_equal == self.row_matches.n_joined_total
-                and self.row_matches.n_unjoined_left == 0
-                and self.row_matches.n_unjoined_right == 0
+            if self._row_matches_available:
+                return (
+                    self.row_matches.n_joined_equal == self.row_matches.n_joined_total
+                    and self.row_matches.n_unjoined_left == 0
+                    and self.row_matches.n_unjoined_right == 0
+                )
+            if not self.row_counts.equal:
+                return False
+            queries = self._row_match_queries
+            return not any(
+                self._exists(query)
+                for query in [
+                    queries["joined_unequal"],
+                    queries["unjoined_left"],
+                    queries["unjoined_right"],
+                ]
             )
         except ValueError:
-            # There are no join columns (or they can't be inferred). We can still compare for
-            # equality via "EXCEPT ALL" statements. Since they are not supported by most database
-            # systems, we resort to EXCEPT + GROUP BY though...
-            left_columns = [
-                self.left_table.c[c] for c in self.column_name_mapping.keys()
-            ]
-            left_with_counts = (
-                sa.select(*left_columns, sa.func.count().label("num"))
-                .select_from(self.left_table)
-                .group_by(*left_columns)
-                .cte("left_with_counts")
-            )
+            if self._is_cross_engine:
+                raise ValueError(
+                    "Tables from different engines can only be compared for equality if they "
+                    "can be joined."
+                )
 
-            right_columns = [
-                self.right_table.c[c] for c in self.column_name_mapping.values()
-            ]
-            right_with_counts = (
-                sa.select(*right_columns, sa.func.count().label("num"))
-                .select_from(self.right_table)
-                .group_by(*right_columns)
-                .cte("right_with_counts")
+            # There are no join columns (or they can't be inferred). Equal tables are usually
+            # identified by a cheap fingerprint if the dialect provides a strong hash,
+            # otherwise we compare the multisets of rows exactly.
+            return self._equal_fingerprints() or self._equal_multisets()
+
+    def _equal_fingerprints(self) -> bool:
+        """Whether the tables have the same order-independent fingerprint, consisting of the
+        number of rows and the sum of the row hashes. Different fingerprints do not imply
+        that the tables differ as row hashes depend on collations (e.g. ``a`` and ``A`` hash
+        differently for case-insensitive collations). ``False`` if the dialect does not
+        provide a strong hash for rows as equal fingerprints would then not imply equal
+        tables."""
+        dialect = cast(DialectProtocol, self.engine.dialect)
+        if not dialect.strong_row_hash:
+            return False
+
+        def fingerprint(
+            table: sa.FromClause, columns: list[sa.ColumnElement]
+        ) -> sa.Select:
+            row_hash = dialect.row_hash(columns)
+            return sa.select(
+                sa.func.count(), sa.func.sum(sa.cast(row_hash, sa.BigInteger))
+            ).select_from(table)
+
+        left_columns, right_columns = self._hashable_columns(
+            list(self.column_name_mapping.keys())
+        )
+        try:
+            left = fingerprint(self.left_table, left_columns)
+            right = fingerprint(self.right_table, right_columns)
+        except NotImplementedError:
+            return False
+        with self._connect() as conn:
+            return tuple(conn.execute(left).one()) == tuple(conn.execute(right).one())
+
+    def _equal_multisets(self) -> bool:
+        """Whether the tables contain the same rows with the same multiplicities."""
+        left_columns = [self.left_table.c[c] for c in self.column_name_mapping.keys()]
+        right_columns = [
+            self.right_table.c[c] for c in self.column_name_mapping.values()
+        ]
+        dialect = cast(DialectProtocol, self.engine.dialect)
+        if dialect.supports_except_all:
+            left = sa.select(*left_columns)
+            right = sa.select(*right_columns)
+            return not self._exists(left.except_all(right)) and not self._exists(
+                right.except_all(left)
             )
 
-            only_left = (
-                sa.select(left_with_counts)
-                .except_(sa.select(right_with_counts))
-                .cte("only_left")
-            )
-            only_right = (
-                sa.select(right_with_counts)
-                .except_(sa.select(left_with_counts))
-                .cte("only_right")
-            )
-            union = sa.union(sa.select(only_left), sa.select(only_right))
-            count = sa.select(sa.func.count()).select_from(union.subquery())
-            with self.engine.connect() as conn:
-                return conn.execute(count).scalar_one() == 0
+        # Without "EXCEPT ALL", we resort to EXCEPT + GROUP BY
+        left_with_counts = (
+            sa.select(*left_columns, sa.func.count().label("num"))
+            .select_from(self.left_table)
+            .group_by(*left_columns)
+            .cte("left_with_counts")
+        )
+        right_with_counts = (
+            sa.select(*right_columns, sa.func.count().label("num"))
+            .select_from(self.right_table)
+            .group_by(*right_columns)
+            .cte("right_with_counts")
+        )
+        only_left = (
+            sa.select(left_with_counts)
+            .except_(sa.select(right_with_counts))
+            .cte("only_left")
+        )
+        only_right = (
+            sa.select(right_with_counts)
+            .except_(sa.select(left_with_counts))
+            .cte("only_right")
+        )
+        return not self._exists(sa.union(sa.select(only_left), sa.select(only_right)))
+
+    @property
+    def _row_matches_available(self) -> bool:
+        """Whether row matches are computed without additional full scans, i.e. whether they
+        are already computed, cached or computed along with the row counts. Row matches of
+        a sample are never considered available as they cannot prove equality."""
+        if self.sample_fraction is not None:
+            return False
+        return (
+            "row_matches" in self.__dict__
+            or self._statistics_computed_jointly
+            or self._load_cached_result("row_matches") is not None
+        )
+
+    @property
+    def _statistics_computed_jointly(self) -> bool:
+        """Whether row counts and row matches are obtained from the same computation such
+        that probing for differences is not applicable."""
+        return (
+            self._is_cross_engine
+            or self.watermark_column is not None
+            or self.materialize
+            or self.partitions > 1
+            or self.fused
+        )
 
     @cached_property
+    @traced
     def row_counts(self) -> Counts:
         """A comparison between the number of rows in each table."""
+        cached = self._load_cached_result("row_counts")
+        if cached is not None:
+            return Counts(**cached)
+        counts = self._compute_row_counts()
+        self._store_cached_result("row_counts", dataclasses.asdict(counts))
+        return counts
+
+    def _compute_row_counts(self) -> Counts:
+        try:
+            stats = self._statistics
+        except ValueError:
+            # Without join columns, the tables cannot be joined and we need to count the
+            # rows of both tables separately.
+            stats = None
+        if stats is not None:
+            return Counts(left=stats["n_left"], right=stats["n_right"])
         return Counts(
             left=self._count_rows(self.left_table),
-            right=self._count_rows(self.right_table),
+            right=self._count_rows(self.right_table, engine=self.right_engine),
         )
 
     @cached_property
@@ -157,98 +429,126 @@ class TableComparison:
         )
 
     @cached_property
+    @traced
     def row_matches(self) -> RowMatches:
         """A comparison between the contents of the individual rows in the two
         tables."""
-        # Get conditions for (non-)equal columns
-        equality_conditions = [
-            self._is_equal(colname_1, colname_2)
-            for colname_1, colname_2 in self.column_name_mapping.items()
-            if colname_1 not in self.join_columns
-        ]
-        inequality_conditions: list[sa.ColumnElement[bool]] = [
-            sa.not_(c) for c in equality_conditions
-        ]
-
-        # If there are no conditions, equality is always true, inequality is always false
-        if not equality_conditions:
-            equality_conditions = [sa.true()]
-            inequality_conditions = [sa.false()]
+        cached = self._load_cached_result("row_matches")
+        if cached is not None:
+            comparison = self._sample if self.sample_fraction is not None else self
+            return RowMatches(**cached, **comparison._row_match_queries)
+        row_matches = self._compute_row_matches()
+        self._store_cached_result(
+            "row_matches",
+            {
+                field: getattr(row_matches, field)
+                for field in [
+                    "n_unjoined_left",
+                    "n_unjoined_right",
+                    "n_joined_equal",
+                    "n_joined_unequal",
+                    "n_joined_total",
+                    "sample_fraction",
+                ]
+            },
+        )
+        return row_matches
 
-        # -- Create queries
-        # Query for rows ONLY in left table
-        left_columns = [self.left_table.c[c] for c in self.join_columns] + [
-            self.left_table.c[c]
-            for c in self.column_name_mapping
-            if c not in self.join_columns
-        ]
-        unjoined_left = (
-            sa.select(*left_columns)
-            .select_from(self._outer_join(left=True))
-            .where(
-                self.right_table.c[self.column_name_mapping[self.join_columns[0]]].is_(
-                    None
-                )
+    def _compute_row_matches(self) -> RowMatches:
+        if self.sample_fraction is not None:
+            return dataclasses.replace(
+                self._sample.row_matches, sample_fraction=self.sample_fraction
             )
-        )
 
-        # Query for rows ONLY in right table
-        right_columns = [
-            self.right_table.c[self.column_name_mapping[c]] for c in self.join_columns
-        ] + [
-            self.right_table.c[v]
-            for k, v in self.column_name_mapping.items()
-            if k not in self.join_columns
-        ]
-        unjoined_right = (
-            sa.select(*right_columns)
-            .select_from(self._outer_join(left=False))
-            .where(self.left_table.c[self.join_columns[0]].is_(None))
+        stats = self._statistics
+        if stats is not None:
+            return self._to_row_matches(
+                stats["n_left"],
+                stats["n_right"],
+                stats["n_joined"],
+                stats["n_joined_unequal"],
+            )
+        return self._to_row_matches(
+            self.row_counts.left,
+            self.row_counts.right,
+            self._count_rows(self._inner_join()),
+            self._count_rows(self._row_match_queries["joined_unequal"].subquery()),
         )
 
-        # For the remaining queries, we need to build a set of column names
-        join_columns = [
-            self.left_table.c[c].label(f"joined_{c}") for c in self.join_columns
-        ]
-        left_columns = [
-            self.left_table.c[c].label(f"left_{c}")
-            for c in self.column_name_mapping.keys()
-            if c not in self.join_columns
-        ]
-        right_columns = [
-            self.right_table.c[c].label(f"right_{c}")
-            for k, c in self.column_name_mapping.items()
-            if k not in self.join_columns
-        ]
-        # Interleave left and right columns here
-        columns = join_columns + [
-            c for cols in zip(left_columns, right_columns) for c in cols
-        ]
-
-        # The remaining queries
-        joined_total = sa.select(*columns).select_from(self._inner_join())
-        joined_unequal = joined_total.where(sa.or_(*inequality_conditions))
-        joined_equal = joined_total.where(sa.and_(*equality_conditions))
-        joined_row_count = self._count_rows(self._inner_join())
-        different_row_count = self._count_rows(joined_unequal.subquery())
-
-        # Return row machts
+    def _to_row_matches(
+        self, n_left: int, n_right: int, n_joined: int, n_joined_unequal: int
+    ) -> RowMatches:
+        """Derive row matches from the row counts of both tables and the number of joined
+        (unequal) rows."""
         return RowMatches(
-            n_unjoined_left=self.row_counts.left - joined_row_count,
-            n_unjoined_right=self.row_counts.right - joined_row_count,
-            n_joined_equal=joined_row_count - different_row_count,
-            n_joined_unequal=different_row_count,
-            n_joined_total=joined_row_count,
-            unjoined_left=unjoined_left,
-            unjoined_right=unjoined_right,
-            joined_equal=joined_equal,
-            joined_unequal=joined_unequal,
-            joined_total=joined_total,
+            n_unjoined_left=n_left - n_joined,
+            n_unjoined_right=n_right - n_joined,
+            n_joined_equal=n_joined - n_joined_unequal,
+            n_joined_unequal=n_joined_unequal,
+            n_joined_total=n_joined,
+            **self._row_match_queries,
         )
 
     @cached_property
+    @traced
     def column_matches(self) -> ColumnMatches:
         """A comparison between the column values of the two tables."""
+        cached = self._load_cached_result("column_matches")
+        if cached is not None:
+            comparison = self._sample if self.sample_fraction is not None else self
+            intervals = cached["confidence_intervals"]
+            return ColumnMatches(
+                fraction_same=cached["fraction_same"],
+                mismatch_selects=comparison._mismatch_selects,
+                confidence_intervals=(
+                    {column: tuple(bounds) for column, bounds in intervals.items()}
+                    if intervals is not None
+                    else None
+                ),
+            )
+        column_matches = self._compute_column_matches()
+        self._store_cached_result(
+            "column_matches",
+            {
+                "fraction_same": column_matches.fraction_same,
+                "confidence_intervals": column_matches.confidence_intervals,
+            },
+        )
+        return column_matches
+
+    def _compute_column_matches(self) -> ColumnMatches:
+        if self.sample_fraction is not None:
+            column_matches = self._sample.column_matches
+            n_joined = self._sample.row_matches.n_joined_total
+            return dataclasses.replace(
+                column_matches,
+                confidence_intervals={
+                    column: _wilson_interval(fraction, n_joined)
+                    for column, fraction in column_matches.fraction_same.items()
+                },
+            )
+
+        avgs = self._fraction_same_query
+        if avgs is None:
+            return ColumnMatches(fraction_same={}, mismatch_selects={})
+
+        # Compute fraction of matching values
+        stats = self._statistics
+        if stats is not None:
+            avgs_results = stats["fraction_same"]
+        else:
+            with self._connect() as conn:
+                avgs_results = _to_fraction_same(conn.execute(avgs).one())
+
+        return ColumnMatches(
+            fraction_same=avgs_results,
+            mismatch_selects=self._mismatch_selects,
+        )
+
+    @property
+    def _fraction_same_query(self) -> sa.Select | None:
+        """Query for the fraction of equal values in all compared columns of the joined
+        rows or ``None`` if there are no compared columns."""
         MATCH_SUFFIX = "_zzz_match"
         inner_join = self._inner_join()
 
@@ -261,38 +561,102 @@ class TableComparison:
             if left_column not in self.join_columns
         ]
         if len(cases) == 0:
-            return ColumnMatches(fraction_same={}, mismatch_selects={})
+            return None
 
         case_stmt = sa.select(*cases).select_from(inner_join).subquery()
-
-        # Compute fraction of matching values
         cols_to_avg = [col for col in case_stmt.c if f"_{MATCH_SUFFIX}" in col.name]
-        avgs = sa.select(
+        return sa.select(
             *[
                 sa.func.avg(col).label(f"{col.name.replace(f'_{MATCH_SUFFIX}', '')}")
                 for col in cols_to_avg
             ]
         )
-        with self.engine.connect() as conn:
-            avgs_results = {
-                column: (match if match is not None else float("nan"))
-                for column, match in conn.execute(avgs).all()[0]._asdict().items()
+
+    @cached_property
+    def _mismatch_selects(self) -> dict[str, sa.Select]:
+        """Queries for the joined rows with differing values, keyed by the name of the
+        left-table column."""
+        if self.materialize:
+            diff = self._materialized_diff
+            return {
+                left_column: sa.select(self.left_table, self.right_table)
+                .select_from(self._materialized_join())
+                .where(diff.c[f"eq_{i}"] == 0)
+                for i, left_column in enumerate(self._compared_columns)
             }
 
-        # Find column mismatches
-        mismatch_selects = {
+        inner_join = self._inner_join()
+        return {
             left_column: sa.select(inner_join).where(
                 sa.not_(self._is_equal(left_column, right_column))
             )
             for left_column, right_column in self.column_name_mapping.items()
             if left_column not in self.join_columns
         }
-        return ColumnMatches(
-            fraction_same=avgs_results,
-            mismatch_selects=mismatch_selects,
-        )
+
+    def cell_diffs(
+        self, after: Sequence[Any] | None = None, limit: int | None = None
+    ) -> sa.Select:
+        """Query for all differing values of the joined rows in long format, i.e. with one
+        row per differing cell.
+
+        The query joins the tables only once and unpivots the compared columns, rather than
+        running one join per column as the queries in :attr:`ColumnMatches.mismatch_selects`.
+        Its columns are the join columns (named as in the left table), followed by
+        ``column_name`` (the name of the left-table column), ``left_value`` and
+        ``right_value``. Since the compared columns may have different types, values are cast
+        to strings. Rows are ordered by the join columns and the position of the column.
+
+        Args:
+            after: The join column values and the column name of the last row of a previous
+                page. If provided, only rows after this row are returned. This allows to page
+                through the differing cells via the index on the join columns rather than an
+                ``OFFSET``.
+            limit: The maximum number of rows to return.
+
+        Returns:
+            The query for the differing cells.
+        """
+        if self._is_cross_engine:
+            raise ValueError(
+                "Cell diffs cannot be computed for tables from different engines."
+            )
+        columns = self._compared_columns
+        if len(columns) == 0:
+            raise ValueError("Cell diffs require at least one compared column.")
+
+        query, index = self._unpivoted_diffs()
+        keys = [self.left_table.c[c] for c in self.join_columns]
+        query = query.order_by(*keys, index)
+
+        if after is not None:
+            *after_keys, after_column = after
+            if len(after_keys) != len(keys) or after_column not in columns:
+                raise ValueError(
+                    "`after` must provide the join column values and the name of a "
+                    "compared column."
+                )
+            # Keyset condition `(keys, index) > (after_keys, after_index)`, expanded as row
+            # value comparisons are not supported by all databases
+            position = [*keys, index]
+            values = [*after_keys, columns.index(after_column)]
+            query = query.where(
+                sa.or_(
+                    *[
+                        sa.and_(
+                            *[p == v for p, v in zip(position[:i], values[:i])],
+                            position[i] > values[i],
+                        )
+                        for i in range(len(position))
+                    ]
+                )
+            )
+        if limit is not None:
+            query = query.limit(limit)
+        return query
 
     @functools.lru_cache
+    @traced
     def get_top_changes(self, column_name: str, n: int = 5) -> dict[str, int]:
         """Gets the most common changes in a single column.
 
@@ -304,40 +668,270 @@ class TableComparison:
             A dictionary where the key is a change in string form (maybe "true -> false") and the
             value is the number of times the change occurs.
         """
+        if self._is_cross_engine:
+            raise ValueError(
+                "Top changes cannot be computed for tables from different engines."
+            )
         aggregate_query = self._get_aggregate_changes(column_name)
-        with self.engine.connect() as conn:
-            res = conn.execute(aggregate_query.limit(n))
+        with self._connect() as conn:
+            res = conn.execute(
+                aggregate_query.order_by(sa.func.count().desc()).limit(n)
+            )
             return {change: count for change, count in res}
 
+    @functools.lru_cache
+    @traced
+    def get_all_top_changes(self, n: int = 5) -> TopChanges:
+        """Gets the most common changes for all compared columns with a single query.
+
+        Args:
+            n: The number of changes to get per column.
+
+        Returns:
+            The most common changes for each compared column. Columns without any changes are
+            mapped to an empty dictionary.
+        """
+        if self._is_cross_engine:
+            raise ValueError(
+                "Top changes cannot be computed for tables from different engines."
+            )
+        columns = self._compared_columns
+        if len(columns) == 0:
+            return TopChanges(changes={})
+
+        # Unpivot the differing cells of a single join and aggregate the changes of all
+        # columns at once, keeping the `n` most common changes per column
+        query, index = self._unpivoted_diffs()
+        diffs = query.add_columns(index.label("column_index")).subquery("diffs")
+        left_value = diffs.c["left_value"]
+        right_value = diffs.c["right_value"]
+        change = (
+            sa.func.coalesce(left_value, "NULL")
+            + " -> "
+            + sa.func.coalesce(right_value, "NULL")
+        )
+        aggregates = (
+            sa.select(
+                diffs.c["column_index"],
+                change.label("change"),
+                sa.func.count().label("count"),
+            )
+            .group_by(diffs.c["column_index"], left_value, right_value)
+            .subquery("aggregates")
+        )
+        ranked = sa.select(
+            aggregates,
+            sa.func.row_number()
+            .over(
+                partition_by=aggregates.c["column_index"],
+                order_by=aggregates.c["count"].desc(),
+            )
+            .label("rank"),
+        ).subquery("ranked")
+        query = (
+            sa.select(ranked.c["column_index"], ranked.c["change"], ranked.c["count"])
+            .where(ranked.c["rank"] <= n)
+            .order_by(ranked.c["column_index"], ranked.c["rank"])
+        )
+
+        changes: dict[str, dict[str, int]] = {column: {} for column in columns}
+        with self._connect() as conn:
+            for column_index, change, count in conn.execute(query):
+                changes[columns[column_index]][change] = count
+        return TopChanges(changes=changes)
+
+    @functools.lru_cache
+    @traced
+    def checksum_diff(
+        self, n_buckets: int = 256, max_bucket_rows: int = 10_000
+    ) -> RowMatches:
+        """Compute row matches by comparing checksums of buckets of rows instead of joining
+        the tables.
+
+        Both tables hash their rows on the database server and aggregate the hashes into
+        buckets determined by a hash of the join columns. Only the bucket checksums are
+        transferred and compared. Buckets whose checksums differ are recursively split into
+        smaller buckets until they are small enough to fetch the join columns and row hashes of
+        their rows and isolate the differing rows. For tables that are almost identical, this is
+        much cheaper than joining the tables.
+
+        Note:
+            Rows are compared by the hashes of their values, i.e. neither
+            ``float_precision`` nor ``collation`` are taken into account and, in the unlikely
+            event of a hash collision, a differing row is considered equal. Matched columns
+            with different types are cast to a common type before hashing. The join columns
+            must be unique and must not contain NULL values. Since column values are not compared
+            individually, the returned row matches provide counts but there are no column
+            matches for this strategy.
+
+        Args:
+            n_buckets: The number of buckets that each differing bucket is split into.
+            max_bucket_rows: The maximum number of rows in a differing bucket for which the
+                rows of the bucket are fetched instead of splitting the bucket further.
+
+        Returns:
+            The row matches between the two tables. The queries of the row matches are the same
+            as for :attr:`row_matches`.
+        """
+        if n_buckets < 2:
+            raise ValueError("The number of buckets must be at least 2.")
+        if self._is_cross_engine:
+            raise ValueError(
+                "Checksums cannot be compared for tables from different engines."
+            )
+
+        # Equal values must hash equally on both sides, independently of the column types
+        dialect = cast(DialectProtocol, self.engine.dialect)
+        left_keys, right_keys = self._hashable_columns(self.join_columns)
+        left_values, right_values = self._hashable_columns(
+            list(self.column_name_mapping.keys())
+        )
+        left_hashes = sa.select(
+            dialect.row_hash(left_keys).label("key_hash"),
+            dialect.row_hash(left_values).label("row_hash"),
+            *[key.label(f"key_{i}") for i, key in enumerate(left_keys)],
+        ).subquery()
+        right_hashes = sa.select(
+            dialect.row_hash(right_keys).label("key_hash"),
+            dialect.row_hash(right_values).label("row_hash"),
+            *[key.label(f"key_{i}") for i, key in enumerate(right_keys)],
+        ).subquery()
+
+        # Compare the checksums of the buckets level by level. At each level, buckets are
+        # determined by the key hash modulo `n_buckets^level`.
+        n_left = 0
+        n_unjoined_left = n_unjoined_right = n_joined_unequal = 0
+        modulus, parent_modulus = n_buckets, 1
+        parent_buckets: list[int] | None = None
+        while parent_buckets is None or len(parent_buckets) > 0:
+            left_checksums = self._bucket_checksums(
+                left_hashes, modulus, parent_modulus, parent_buckets
+            )
+            right_checksums = self._bucket_checksums(
+                right_hashes, modulus, parent_modulus, parent_buckets
+            )
+            if parent_buckets is None:
+                n_left = sum(count for count, _ in left_checksums.values())
+
+            differing_buckets = {
+                bucket: max(
+                    left_checksums.get(bucket, (0, 0))[0],
+                    right_checksums.get(bucket, (0, 0))[0],
+                )
+                for bucket in left_checksums.keys() | right_checksums.keys()
+                if left_checksums.get(bucket) != right_checksums.get(bucket)
+            }
+            can_split = modulus * n_buckets <= _MAX_HASH
+            leaf_buckets = [
+                bucket
+                for bucket, count in differing_buckets.items()
+                if count <= max_bucket_rows or not can_split
+            ]
+
+            # Isolate the differing rows in the leaf buckets
+            if leaf_buckets:
+                left_rows = self._bucket_rows(left_hashes, modulus, leaf_buckets)
+                right_rows = self._bucket_rows(right_hashes, modulus, leaf_buckets)
+                n_unjoined_left += len(left_rows.keys() - right_rows.keys())
+                n_unjoined_right += len(right_rows.keys() - left_rows.keys())
+                n_joined_unequal += sum(
+                    left_rows[key] != right_rows[key]
+                    for key in left_rows.keys() & right_rows.keys()
+                )
+
+            parent_buckets = sorted(differing_buckets.keys() - set(leaf_buckets))
+            modulus, parent_modulus = modulus * n_buckets, modulus
+
+        n_joined_total = n_left - n_unjoined_left
+        return RowMatches(
+            n_unjoined_left=n_unjoined_left,
+            n_unjoined_right=n_unjoined_right,
+            n_joined_equal=n_joined_total - n_joined_unequal,
+            n_joined_unequal=n_joined_unequal,
+            n_joined_total=n_joined_total,
+            **self._row_match_queries,
+        )
+
     # ---------------------------------------------------------------------------------------------
     # SUMMARY REPORT
     # ---------------------------------------------------------------------------------------------
 
-    def summary_report(self) -> Report:
+    @traced
+    def summary_report(
+        self, strategy: Literal["join", "checksum"] = "join", top_changes: int = 0
+    ) -> Report:
         """Generate a report that summarizes the table comparison.
 
+        Args:
+            strategy: The strategy for matching rows. ``join`` joins the tables to compute row
+                and column matches. ``checksum`` computes row matches via :meth:`checksum_diff`
+                and, thus, does not provide column matches.
+            top_changes: The number of most common changes to include in the report for each
+                compared column. Only applicable for the ``join`` strategy.
+
         Returns:
             A report summarizing the comparison of the two tables.
         """
         description = None
-        sections = {
-            "Column Names": self.column_names,
-            "Row Counts": self.row_counts,
-        }
+        sections: dict[str, Any] = {"Column Names": self.column_names}
 
         # Optionally add additional information if `join_columns` can be constructed
         try:
-            description = "Joining on columns:"
+            description = (
+                "Comparing checksums on columns:"
+                if strategy == "checksum"
+                else "Joining on columns:"
+            )
             for column in self.join_columns:
                 description += (
                     f"\n  - '{column}' = '{self.column_name_mapping[column]}'"
                 )
-            sections.update(
-                {
-                    "Row Matches": self.row_matches,
-                    "Column Matches": self.column_matches,
-                }
+            if self.sample_fraction is not None and strategy == "join":
+                description += f"\nMatching rows on a {self.sample_fraction:.2%} sample of join keys."
+            match strategy:
+                case "join":
+                    sections.update(
+                        {
+                            "Row Counts": self._section(lambda: self.row_counts),
+                            "Row Matches": self._section(lambda: self.row_matches),
+                            "Column Matches": self._section(
+                                lambda: self.column_matches
+                            ),
+                        }
+                    )
+                    if top_changes > 0:
+                        sections["Top Changes"] = self._section(
+                            lambda: self.get_all_top_changes(top_changes)
+                        )
+                case "checksum":
+                    row_matches = self._section(self.checksum_diff)
+                    sections.update(
+                        {
+                            "Row Counts": (
+                                row_matches
+                                if isinstance(row_matches, Skipped)
+                                else Counts(
+                                    left=row_matches.n_unjoined_left
+                                    + row_matches.n_joined_total,
+                                    right=row_matches.n_unjoined_right
+                                    + row_matches.n_joined_total,
+                                )
+                            ),
+                            "Row Matches": row_matches,
+                        }
+                    )
+        except StatementTimeoutError as exc:
+            # The join columns could not be determined in time
+            logging.warning(
+                "Join columns of '%s' and '%s' could not be determined (%s): skipping row "
+                "and column matches",
+                self._left_table_name,
+                self._right_table_name,
+                exc,
             )
+            description = None
+            sections["Row Counts"] = self._section(lambda: self.row_counts)
+            sections["Row Matches"] = Skipped(str(exc))
         except ValueError as exc:
             logging.warning(
                 "'%s' and '%s' cannot be matched (%s): dropping row and column matches "
@@ -346,6 +940,7 @@ class TableComparison:
                 self._right_table_name,
                 exc,
             )
+            sections["Row Counts"] = self._section(lambda: self.row_counts)
 
         return Report(
             "tables",
@@ -355,10 +950,74 @@ class TableComparison:
             sections,
         )
 
+    def _section(self, compute: Callable[[], T]) -> T | Skipped:
+        try:
+            return compute()
+        except StatementTimeoutError as exc:
+            logging.warning(
+                "Skipping section of the comparison of '%s' and '%s': %s",
+                self._left_table_name,
+                self._right_table_name,
+                exc,
+            )
+            return Skipped(str(exc))
+
+    # ---------------------------------------------------------------------------------------------
+    # RESOURCE MANAGEMENT
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def connection(self) -> sa.Connection | None:
+        """The connection that this comparison holds on to, if any. Queries referencing
+        temporary tables (e.g. mismatch queries if ``materialize`` is set) must be run via
+        this connection."""
+        return self.scope.connection
+
+    def connect(self) -> "TableComparison":
+        """Acquire a connection that is shared by all subsequent queries of this comparison
+        until :meth:`close` is called. This is done implicitly when the comparison is used as
+        a context manager or an isolation level is provided.
+
+        Returns:
+            This comparison.
+        """
+        self.scope.open()
+        return self
+
+    @traced
+    def close(self) -> None:
+        """Drop all temporary tables and release the connection held by this comparison.
+        The comparison can still be used afterwards but results computed on temporary
+        tables are computed anew."""
+        if self.connection is None:
+            return
+        if "_materialized_diff" in self.__dict__:
+            self._materialized_diff.drop(self.connection)
+            del self.__dict__["_materialized_diff"]
+            # Drop all results whose queries reference the temporary table
+            for name in [
+                "_mismatch_selects",
+                "_row_match_queries",
+                "row_matches",
+                "column_matches",
+            ]:
+                self.__dict__.pop(name, None)
+        self.scope.close()
+
+    def __enter__(self) -> "TableComparison":
+        return self.connect()
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     # ---------------------------------------------------------------------------------------------
     # UTILITY METHODS
     # ---------------------------------------------------------------------------------------------
 
+    @property
+    def _is_cross_engine(self) -> bool:
+        return self.right_engine is not self.engine
+
     @property
     def _left_table_name(self) -> str:
         if isinstance(self.left_table, sa.Alias):
@@ -371,6 +1030,136 @@ class TableComparison:
             return str(self.right_table.element)
         return "<right query>"
 
+    @cached_property
+    def _row_match_queries(self) -> _RowMatchQueries:
+        """The queries for obtaining (un-)matched rows, keyed by the name of the
+        corresponding field in :class:`~sqlcompyre.results.RowMatches`."""
+        # Get conditions for (non-)equal columns
+        if self.materialize:
+            diff = self._materialized_diff
+            equality_conditions: list[sa.ColumnElement[bool]] = [
+                diff.c[f"eq_{i}"] == 1 for i in range(len(self._compared_columns))
+            ]
+        else:
+            equality_conditions = [
+                self._is_equal(colname_1, colname_2)
+                for colname_1, colname_2 in self.column_name_mapping.items()
+                if colname_1 not in self.join_columns
+            ]
+        inequality_conditions: list[sa.ColumnElement[bool]] = [
+            sa.not_(c) for c in equality_conditions
+        ]
+
+        # If there are no conditions, equality is always true, inequality is always false
+        if not equality_conditions:
+            equality_conditions = [sa.true()]
+            inequality_conditions = [sa.false()]
+
+        # -- Create queries
+        # Query for rows ONLY in left table
+        left_columns = [self.left_table.c[c] for c in self.join_columns] + [
+            self.left_table.c[c]
+            for c in self.column_name_mapping
+            if c not in self.join_columns
+        ]
+        if self.materialize:
+            # The materialized diff contains the keys of all joined rows such that unjoined
+            # rows are found without joining the tables with each other
+            unjoined_left = self._materialized_anti_join(
+                self.left_table, self.join_columns, left_columns
+            )
+        else:
+            unjoined_left = (
+                sa.select(*left_columns)
+                .select_from(self._outer_join(left=True))
+                .where(
+                    self.right_table.c[
+                        self.column_name_mapping[self.join_columns[0]]
+                    ].is_(None)
+                )
+            )
+
+        # Query for rows ONLY in right table
+        right_columns = [
+            self.right_table.c[self.column_name_mapping[c]] for c in self.join_columns
+        ] + [
+            self.right_table.c[v]
+            for k, v in self.column_name_mapping.items()
+            if k not in self.join_columns
+        ]
+        if self.materialize:
+            unjoined_right = self._materialized_anti_join(
+                self.right_table,
+                [self.column_name_mapping[c] for c in self.join_columns],
+                right_columns,
+            )
+        else:
+            unjoined_right = (
+                sa.select(*right_columns)
+                .select_from(self._outer_join(left=False))
+                .where(self.left_table.c[self.join_columns[0]].is_(None))
+            )
+
+        # For the remaining queries, we need to build a set of column names
+        join_columns = [
+            self.left_table.c[c].label(f"joined_{c}") for c in self.join_columns
+        ]
+        left_columns = [
+            self.left_table.c[c].label(f"left_{c}")
+            for c in self.column_name_mapping.keys()
+            if c not in self.join_columns
+        ]
+        right_columns = [
+            self.right_table.c[c].label(f"right_{c}")
+            for k, c in self.column_name_mapping.items()
+            if k not in self.join_columns
+        ]
+        # Interleave left and right columns here
+        columns = join_columns + [
+            c for cols in zip(left_columns, right_columns) for c in cols
+        ]
+
+        # The remaining queries
+        joined = self._materialized_join() if self.materialize else self._inner_join()
+        joined_total = sa.select(*columns).select_from(joined)
+        joined_unequal = joined_total.where(sa.or_(*inequality_conditions))
+        joined_equal = joined_total.where(sa.and_(*equality_conditions))
+        return {
+            "unjoined_left": unjoined_left,
+            "unjoined_right": unjoined_right,
+            "joined_equal": joined_equal,
+            "joined_unequal": joined_unequal,
+            "joined_total": joined_total,
+        }
+
+    def _hashable_columns(
+        self, left_columns: list[str]
+    ) -> tuple[list[sa.ColumnElement], list[sa.ColumnElement]]:
+        """Obtains the provided columns of the "left" table and their counterparts in the
+        "right" table such that equal values produce equal row hashes.
+
+        Row hashes depend on the types of the values (e.g. ``1`` and ``1.0`` hash
+        differently), matched columns with different types are therefore cast to a common
+        type.
+
+        Args:
+            left_columns: The names of the columns in the "left" table.
+
+        Returns:
+            The columns of the "left" table and the matched columns of the "right" table.
+        """
+        left: list[sa.ColumnElement] = []
+        right: list[sa.ColumnElement] = []
+        for column in left_columns:
+            lhs: sa.ColumnElement = self.left_table.c[column]
+            rhs: sa.ColumnElement = self.right_table.c[self.column_name_mapping[column]]
+            common_type = _common_type(self.engine.dialect, lhs.type, rhs.type)
+            if common_type is not None:
+                lhs, rhs = sa.cast(lhs, common_type), sa.cast(rhs, common_type)
+            left.append(lhs)
+            right.append(rhs)
+        return left, right
+
     def _is_equal(self, left_column: str, right_column: str) -> sa.ColumnElement[bool]:
         """Forms a condition for comparing two columns.
 
@@ -381,9 +1170,22 @@ class TableComparison:
         Returns:
             A condition for comparing two columns of the "left" and "right" table.
         """
-        lhs = self.left_table.c[left_column]
-        rhs = self.right_table.c[right_column]
+        return self._is_equal_columns(
+            self.left_table.c[left_column], self.right_table.c[right_column]
+        )
+
+    def _is_equal_columns(
+        self, lhs: sa.ColumnElement, rhs: sa.ColumnElement
+    ) -> sa.ColumnElement[bool]:
+        """Forms a condition for comparing two column expressions.
+
+        Args:
+            lhs: Column expression from the "left" table being compared.
+            rhs: Column expression from the "right" table being compared.
 
+        Returns:
+            A condition for comparing the two column expressions.
+        """
         # Create the condition that is used
         if not isinstance(lhs.type, sa.Float):
             if isinstance(lhs.type, sa.String) and self.collation is not None:
@@ -403,6 +1205,651 @@ class TableComparison:
             sa.case((condition, None), else_=rhs),
         ).is_(None)
 
+    def _infer_join_columns(self) -> list[str]:
+        """Infer the smallest set of compared columns that uniquely identifies the rows in
+        both tables. If a cache is provided, the inferred columns are persisted and reused
+        by subsequent comparisons of the same tables as long as they remain unique."""
+        cache_key = self._inferred_key_cache_key
+        if self.cache is not None and cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None and self._is_valid_key(cached):
+                return cached
+
+        # Here we want to infer the primary key. For this, we need to get rid of all columns
+        # that can be NULL.
+        left_nulls, right_nulls = self._null_counts
+        non_null_column_mapping = {
+            k: v
+            for k, v in self.column_name_mapping.items()
+            if left_nulls.get(k, 0) == 0 and right_nulls.get(v, 0) == 0
+        }
+        if len(non_null_column_mapping) == 0:
+            raise ValueError(
+                "Automatically inferring primary keys failed as there are no non-null columns "
+                "that can be matched."
+            )
+
+        key = _minimal_unique_key(
+            self.engine,
+            self.right_engine,
+            self.left_table,
+            self.right_table,
+            non_null_column_mapping,
+        )
+        if key is None:
+            raise ValueError(
+                "Automatically inferring primary keys failed as the mapped column names "
+                "would cause duplicates."
+            )
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, key)
+        return key
+
+    def _is_valid_key(self, columns: list[str]) -> bool:
+        """Whether the provided compared columns contain no NULLs and uniquely identify the
+        rows in both tables."""
+        if not set(columns) <= set(self.column_name_mapping):
+            return False
+        right_columns = [self.column_name_mapping[c] for c in columns]
+        nulls = _null_counts(self.engine, self.left_table, columns) | {
+            f"right_{c}": n
+            for c, n in _null_counts(
+                self.right_engine, self.right_table, right_columns
+            ).items()
+        }
+        return (
+            all(n == 0 for n in nulls.values())
+            and _is_valid_primary_key(self.engine, self.left_table, columns)
+            and _is_valid_primary_key(
+                self.right_engine, self.right_table, right_columns
+            )
+        )
+
+    @property
+    def _inferred_key_cache_key(self) -> str | None:
+        left_identity = table_identity(self.engine, self.left_table)
+        right_identity = table_identity(self.right_engine, self.right_table)
+        if left_identity is None or right_identity is None:
+            return None
+        return ResultCache.key(
+            result="inferred_key",
+            left=left_identity,
+            right=right_identity,
+            column_name_mapping=self.column_name_mapping,
+        )
+
+    @cached_property
+    def _null_counts(self) -> tuple[dict[str, int], dict[str, int]]:
+        """The number of NULL values in each nullable compared column of the "left" and the
+        "right" table, respectively. Computed with a single aggregate query per table."""
+        return (
+            _null_counts(
+                self.engine,
+                self.left_table,
+                [c for c in self.column_name_mapping if self.left_table.c[c].nullable],
+            ),
+            _null_counts(
+                self.right_engine,
+                self.right_table,
+                [
+                    c
+                    for c in self.column_name_mapping.values()
+                    if self.right_table.c[c].nullable
+                ],
+            ),
+        )
+
+    @cached_property
+    def _cache_key_components(self) -> dict[str, Any] | None:
+        """The components of the cache keys of this comparison's results or ``None`` if the
+        results cannot be cached."""
+        if self.cache is None:
+            return None
+        left_fingerprint = table_fingerprint(self.engine, self.left_table)
+        if left_fingerprint is None:
+            return None
+        right_fingerprint = table_fingerprint(self.right_engine, self.right_table)
+        if right_fingerprint is None:
+            return None
+        return {
+            "left": left_fingerprint,
+            "right": right_fingerprint,
+            "join_columns": sorted(self._user_join_columns),
+            "infer_primary_keys": self._infer_primary_keys,
+            "column_name_mapping": self.column_name_mapping,
+            "float_precision": self.float_precision,
+            "collation": self.collation,
+            "sample_fraction": self.sample_fraction,
+        }
+
+    def _load_cached_result(self, name: str) -> Any | None:
+        components = self._cache_key_components
+        if self.cache is None or components is None:
+            return None
+        return self.cache.get(self.cache.key(result=name, **components))
+
+    def _store_cached_result(self, name: str, value: Any) -> None:
+        components = self._cache_key_components
+        if self.cache is None or components is None:
+            return
+        self.cache.set(self.cache.key(result=name, **components), value)
+
+    @cached_property
+    def _sample(self) -> "TableComparison":
+        """A comparison of the rows whose join column values hash into the sample."""
+        dialect = cast(DialectProtocol, self.engine.dialect)
+        threshold = int(cast(float, self.sample_fraction) * _MAX_HASH)
+
+        def sample(table: sa.FromClause, keys: list[sa.ColumnElement]) -> sa.FromClause:
+            key_hash = dialect.row_hash(keys)
+            return sa.select(table).where(key_hash < threshold).subquery()
+
+        # Equal keys must hash equally on both sides to sample the same keys
+        left_keys, right_keys = self._hashable_columns(self.join_columns)
+        comparison = TableComparison(
+            self.engine,
+            sample(self.left_table, left_keys),
+            sample(self.right_table, right_keys),
+            join_columns=self.join_columns,
+            column_name_mapping=dict(self.column_name_mapping),
+            ignore_columns=None,
+            float_precision=self.float_precision,
+            collation=self.collation,
+            ignore_casing=False,
+            infer_primary_keys=False,
+            fused=self.fused,
+            partitions=self.partitions,
+        )
+        # The sample must be evaluated within the same connection scope
+        comparison.scope = self.scope
+        comparison.query_log = self.query_log
+        return comparison
+
+    @property
+    def _statistics(self) -> dict[str, Any] | None:
+        """Row counts, row matches and column matches if they are computed together rather
+        than with one query per statistic."""
+        if self.sample_fraction is not None:
+            # Statistics of the sample are provided by `_sample`, row counts must be exact
+            return None
+        if self._is_cross_engine:
+            return self._merge_join_statistics
+        if self.watermark_column is not None:
+            return self._incremental_statistics
+        if self.materialize:
+            return self._materialized_statistics
+        if self.partitions > 1:
+            return self._partitioned_statistics
+        if self.fused:
+            return self._fused_statistics
+        return None
+
+    @cached_property
+    def _fused_statistics(self) -> dict[str, Any]:
+        """Row counts, row matches and column matches, computed with a single
+        aggregate query over a full outer join of the two tables."""
+        return self._to_statistics(*self._aggregate_counts())
+
+    @cached_property
+    def _partitioned_statistics(self) -> dict[str, Any]:
+        """Row counts, row matches and column matches, computed by splitting the domain of the
+        first join column into ranges and running one aggregate query per range
+        concurrently."""
+        join_column = self.join_columns[0]
+        left_key = self.left_table.c[join_column]
+        right_key = self.right_table.c[self.column_name_mapping[join_column]]
+
+        # Use the upper bounds of (approximately) equally-sized tiles of the left table as
+        # split points. The last tile's upper bound is not needed as the last range is
+        # unbounded. Rows with NULL keys are assigned to the last range.
+        tile = sa.func.ntile(self.partitions).over(order_by=left_key).label("tile")
+        tiles = (
+            sa.select(left_key.label("key"), tile)
+            .where(left_key.is_not(None))
+            .subquery()
+        )
+        query = (
+            sa.select(sa.func.max(tiles.c["key"]).label("upper"))
+            .group_by(tiles.c["tile"])
+            .order_by("upper")
+        )
+        with self._connect() as conn:
+            upper_bounds = conn.execute(query).scalars().all()
+        split_points = sorted(set(upper_bounds[:-1]))
+
+        def range_condition(
+            key: sa.ColumnElement, index: int
+        ) -> sa.ColumnElement[bool] | None:
+            lower = key > split_points[index - 1] if index > 0 else None
+            if index < len(split_points):
+                upper = key <= split_points[index]
+                return upper if lower is None else sa.and_(lower, upper)
+            # The last range is unbounded and additionally contains all rows with NULL keys
+            return None if lower is None else sa.or_(lower, key.is_(None))
+
+        n_ranges = len(split_points) + 1
+        totals: list[Any] = [0, 0, 0, 0, [0] * len(self._compared_columns)]
+        with ThreadPoolExecutor(max_workers=n_ranges) as executor:
+            futures = {
+                executor.submit(
+                    # Record statements of all partitions in the query log
+                    contextvars.copy_context().run,
+                    self._aggregate_counts,
+                    range_condition(left_key, i),
+                    range_condition(right_key, i),
+                    dedicated_connection=True,
+                ): i
+                for i in range(n_ranges)
+            }
+            for n_done, future in enumerate(as_completed(futures), start=1):
+                *counts, n_equal = future.result()
+                for i, count in enumerate(counts):
+                    totals[i] += count
+                totals[-1] = [a + b for a, b in zip(totals[-1], n_equal)]
+                logging.info(
+                    "Compared partition %d of %d (%d/%d done).",
+                    futures[future] + 1,
+                    n_ranges,
+                    n_done,
+                    n_ranges,
+                )
+        return self._to_statistics(*totals)
+
+    @cached_property
+    def _materialized_diff(self) -> sa.Table:
+        """A temporary table with the join keys of all joined rows and one equality flag per
+        compared column, created on :attr:`connection`."""
+        dialect = cast(DialectProtocol, self.engine.dialect)
+        key_columns = [
+            sa.Column(f"key_{i}", self.left_table.c[c].type)
+            for i, c in enumerate(self.join_columns)
+        ]
+        diff = dialect.temporary_table(
+            f"sqlcompyre_diff_{uuid.uuid4().hex[:16]}",
+            sa.MetaData(),
+            *key_columns,
+            *[
+                sa.Column(f"eq_{i}", sa.Integer())
+                for i in range(len(self._compared_columns))
+            ],
+        )
+        query = sa.select(
+            *[self.left_table.c[c] for c in self.join_columns],
+            *[
+                sa.case((self._is_equal(c, self.column_name_mapping[c]), 1), else_=0)
+                for c in self._compared_columns
+            ],
+        ).select_from(self._inner_join())
+
+        conn = self.scope.open()
+        diff.create(conn)
+        sa.Index(
+            f"ix_{diff.name.lstrip('#')}", *[diff.c[c.name] for c in key_columns]
+        ).create(conn)
+        conn.execute(diff.insert().from_select([c.name for c in diff.c], query))
+        if self.scope.isolation_level is None:
+            conn.commit()
+        return diff
+
+    @cached_property
+    def _materialized_statistics(self) -> dict[str, Any]:
+        """Row counts, row matches and column matches, computed from the materialized
+        diff."""
+        diff = self._materialized_diff
+        flags = [diff.c[f"eq_{i}"] for i in range(len(self._compared_columns))]
+        unequal = sa.or_(*[f == 0 for f in flags]) if flags else sa.false()
+        query = sa.select(
+            sa.func.count(),
+            _count_if(unequal),
+            *[sa.func.coalesce(sa.func.sum(f), 0) for f in flags],
+        ).select_from(diff)
+        with self._connect() as conn:
+            n_joined, n_joined_unequal, *n_equal = conn.execute(query).one()
+        return self._to_statistics(
+            self._count_rows(self.left_table),
+            self._count_rows(self.right_table),
+            n_joined,
+            n_joined_unequal,
+            n_equal,
+        )
+
+    def _materialized_join(self) -> sa.Join:
+        """Join the materialized diff with both tables via the join keys."""
+        diff = self._materialized_diff
+        return diff.join(
+            self.left_table,
+            sa.and_(
+                *[
+                    diff.c[f"key_{i}"] == self.left_table.c[c]
+                    for i, c in enumerate(self.join_columns)
+                ]
+            ),
+        ).join(
+            self.right_table,
+            sa.and_(
+                *[
+                    diff.c[f"key_{i}"]
+                    == self.right_table.c[self.column_name_mapping[c]]
+                    for i, c in enumerate(self.join_columns)
+                ]
+            ),
+        )
+
+    def _materialized_anti_join(
+        self,
+        table: sa.FromClause,
+        key_columns: list[str],
+        columns: Sequence[sa.ColumnElement],
+    ) -> sa.Select:
+        """Query the rows of a table whose keys are not contained in the materialized
+        diff, i.e. the rows that cannot be joined."""
+        diff = self._materialized_diff
+        return (
+            sa.select(*columns)
+            .select_from(
+                table.outerjoin(
+                    diff,
+                    sa.and_(
+                        *[
+                            diff.c[f"key_{i}"] == table.c[c]
+                            for i, c in enumerate(key_columns)
+                        ]
+                    ),
+                )
+            )
+            .where(diff.c["key_0"].is_(None))
+        )
+
+    @cached_property
+    def _incremental_statistics(self) -> dict[str, Any]:
+        """Row counts, row matches and column matches, computed by comparing only the rows
+        that changed since the previous comparison and combining the results with the
+        persisted per-key state."""
+        state = IncrementalState(
+            self._incremental_state_path, n_columns=len(self._compared_columns)
+        )
+        watermarks = state.watermarks()
+        if watermarks is not None:
+            self._update_incremental_state(state, watermarks)
+            totals = state.totals()
+            # Deleted rows cannot be detected via the watermark. We therefore validate the
+            # row counts and fall back to a full comparison if they disagree with the state.
+            row_counts = (
+                self._count_rows(self.left_table),
+                self._count_rows(self.right_table),
+            )
+            if row_counts == totals[:2]:
+                return self._to_statistics(*totals)
+            logging.info(
+                "Row counts of '%s' and '%s' disagree with the recorded state, "
+                "comparing all rows.",
+                self._left_table_name,
+                self._right_table_name,
+            )
+        self._update_incremental_state(state, None)
+        return self._to_statistics(*state.totals())
+
+    @cached_property
+    def _incremental_state_path(self) -> Path:
+        left_identity = table_identity(self.engine, self.left_table)
+        right_identity = table_identity(self.engine, self.right_table)
+        if left_identity is None or right_identity is None:
+            raise ValueError("Incremental comparisons can only be run on tables.")
+        cache = cast(ResultCache, self.cache)
+        return cache.state_path(
+            cache.key(
+                result="incremental_state",
+                left=left_identity,
+                right=right_identity,
+                join_columns=self.join_columns,
+                column_name_mapping=self.column_name_mapping,
+                float_precision=self.float_precision,
+                collation=self.collation,
+                watermark_column=self.watermark_column,
+            )
+        )
+
+    def _update_incremental_state(
+        self, state: IncrementalState, watermarks: tuple[Any, Any] | None
+    ) -> None:
+        """Compare the rows that changed since the provided watermarks and update the state
+        accordingly. If no watermarks are provided, all rows are compared and the state is
+        replaced."""
+        # The watermark column is typically ignored for evaluating equality, we therefore
+        # fall back to the column with the same name in the "right" table
+        watermark_column = cast(str, self.watermark_column)
+        right_watermark_column = self.column_name_mapping.get(
+            watermark_column, watermark_column
+        )
+        left_watermark = self.left_table.c[watermark_column]
+        right_watermark = self.right_table.c[right_watermark_column]
+
+        # Collect the keys of all rows that changed in at least one of the tables. Rows without
+        # a watermark are always considered to be changed.
+        left_keys = sa.select(
+            *[
+                self.left_table.c[c].label(f"key_{i}")
+                for i, c in enumerate(self.join_columns)
+            ]
+        )
+        right_keys = sa.select(
+            *[
+                self.right_table.c[self.column_name_mapping[c]].label(f"key_{i}")
+                for i, c in enumerate(self.join_columns)
+            ]
+        )
+        if watermarks is not None:
+            if watermarks[0] is not None:
+                left_keys = left_keys.where(
+                    sa.or_(left_watermark.is_(None), left_watermark > watermarks[0])
+                )
+            if watermarks[1] is not None:
+                right_keys = right_keys.where(
+                    sa.or_(right_watermark.is_(None), right_watermark > watermarks[1])
+                )
+        changed = sa.union(left_keys, right_keys).subquery("changed")
+
+        # Then, obtain the state of all these keys
+        left = sa.select(self.left_table, sa.literal(1).label(_LEFT_MARKER)).subquery(
+            "left"
+        )
+        right = sa.select(
+            self.right_table, sa.literal(1).label(_RIGHT_MARKER)
+        ).subquery("right")
+        joined = changed.outerjoin(
+            left,
+            sa.and_(
+                *[
+                    changed.c[f"key_{i}"] == left.c[c]
+                    for i, c in enumerate(self.join_columns)
+                ]
+            ),
+        ).outerjoin(
+            right,
+            sa.and_(
+                *[
+                    changed.c[f"key_{i}"] == right.c[self.column_name_mapping[c]]
+                    for i, c in enumerate(self.join_columns)
+                ]
+            ),
+        )
+        equality_conditions = [
+            self._is_equal_columns(left.c[c], right.c[self.column_name_mapping[c]])
+            for c in self._compared_columns
+        ]
+        unequal = (
+            sa.or_(*[sa.not_(c) for c in equality_conditions])
+            if equality_conditions
+            else sa.false()
+        )
+        query = sa.select(
+            *changed.c,
+            left.c[watermark_column],
+            right.c[right_watermark_column],
+            sa.case((left.c[_LEFT_MARKER].is_not(None), 1), else_=0),
+            sa.case((right.c[_RIGHT_MARKER].is_not(None), 1), else_=0),
+            sa.case((unequal, 1), else_=0),
+            *[sa.case((c, 1), else_=0) for c in equality_conditions],
+        ).select_from(joined)
+
+        # Eventually, update the state
+        n_keys = len(self.join_columns)
+        state.update(
+            (
+                (json.dumps(list(row[:n_keys]), default=str), *row[n_keys:])
+                for row in stream_rows(self.engine, query, self.batch_size)
+            ),
+            full=watermarks is None,
+        )
+
+    @property
+    def _compared_columns(self) -> list[str]:
+        return [c for c in self.column_name_mapping if c not in self.join_columns]
+
+    def _aggregate_counts(
+        self,
+        left_condition: sa.ColumnElement[bool] | None = None,
+        right_condition: sa.ColumnElement[bool] | None = None,
+        dedicated_connection: bool = False,
+    ) -> tuple[int, int, int, int, list[int]]:
+        """Count the rows of both tables along with the joined (unequal) rows and the number of
+        equal values per compared column with a single query.
+
+        Args:
+            left_condition: An optional condition to restrict the rows of the "left" table.
+            right_condition: An optional condition to restrict the rows of the "right" table.
+            dedicated_connection: Whether to run the query on a new connection rather than the
+                one held by this comparison, e.g. to run multiple queries concurrently.
+
+        Returns:
+            The arguments for :meth:`_to_statistics`.
+        """
+        # Mark the rows of both tables such that we can tell after the full outer join which
+        # table(s) a row originates from. We cannot use the join columns for this as they might
+        # contain NULL values.
+        left_select = sa.select(self.left_table, sa.literal(1).label(_LEFT_MARKER))
+        if left_condition is not None:
+            left_select = left_select.where(left_condition)
+        left = left_select.subquery("left")
+        right_select = sa.select(self.right_table, sa.literal(1).label(_RIGHT_MARKER))
+        if right_condition is not None:
+            right_select = right_select.where(right_condition)
+        right = right_select.subquery("right")
+        full_join = left.join(
+            right,
+            sa.and_(
+                *[
+                    left.c[join_col] == right.c[self.column_name_mapping[join_col]]
+                    for join_col in self.join_columns
+                ]
+            ),
+            full=True,
+        )
+
+        in_left = left.c[_LEFT_MARKER].is_not(None)
+        in_right = right.c[_RIGHT_MARKER].is_not(None)
+        joined = sa.and_(in_left, in_right)
+        equality_conditions = [
+            self._is_equal_columns(left.c[left_column], right.c[right_column])
+            for left_column, right_column in self.column_name_mapping.items()
+            if left_column not in self.join_columns
+        ]
+        unequal = (
+            sa.or_(*[sa.not_(c) for c in equality_conditions])
+            if equality_conditions
+            else sa.false()
+        )
+
+        query = sa.select(
+            _count_if(in_left),
+            _count_if(in_right),
+            _count_if(joined),
+            _count_if(sa.and_(joined, unequal)),
+            *[_count_if(sa.and_(joined, c)) for c in equality_conditions],
+        ).select_from(full_join)
+        connect = self.engine.connect if dedicated_connection else self._connect
+        with connect() as conn:
+            n_left, n_right, n_joined, n_joined_unequal, *n_equal = conn.execute(
+                query
+            ).one()
+        return n_left, n_right, n_joined, n_joined_unequal, n_equal
+
+    @cached_property
+    def _merge_join_statistics(self) -> dict[str, Any]:
+        """Row counts, row matches and column matches, computed by streaming both tables
+        ordered by the join columns and merge-joining them in Python."""
+        compared_columns = [
+            (left_column, right_column)
+            for left_column, right_column in self.column_name_mapping.items()
+            if left_column not in self.join_columns
+        ]
+        left_keys = [self.left_table.c[c] for c in self.join_columns]
+        left_query = sa.select(
+            *left_keys, *[self.left_table.c[c] for c, _ in compared_columns]
+        ).order_by(*left_keys)
+        right_keys = [
+            self.right_table.c[self.column_name_mapping[c]] for c in self.join_columns
+        ]
+        right_query = sa.select(
+            *right_keys, *[self.right_table.c[c] for _, c in compared_columns]
+        ).order_by(*right_keys)
+
+        # Mirror the equality semantics of `_is_equal`
+        comparators = [
+            (
+                float_comparator(self.float_precision)
+                if isinstance(self.left_table.c[c].type, sa.Float)
+                else exact_comparator
+            )
+            for c, _ in compared_columns
+        ]
+        stats = merge_join(
+            stream_rows(self.engine, left_query, self.batch_size),
+            stream_rows(self.right_engine, right_query, self.batch_size),
+            n_keys=len(self.join_columns),
+            comparators=comparators,
+            batch_size=self.batch_size,
+        )
+        return self._to_statistics(
+            stats.n_left,
+            stats.n_right,
+            stats.n_joined,
+            stats.n_joined_unequal,
+            stats.n_equal,
+        )
+
+    def _to_statistics(
+        self,
+        n_left: int,
+        n_right: int,
+        n_joined: int,
+        n_joined_unequal: int,
+        n_equal: list[int],
+    ) -> dict[str, Any]:
+        """Collects the statistics obtained from a single pass over both tables.
+
+        Args:
+            n_left: The number of rows in the "left" table.
+            n_right: The number of rows in the "right" table.
+            n_joined: The number of joined rows.
+            n_joined_unequal: The number of joined rows with at least one differing value.
+            n_equal: The number of joined rows with equal values for each compared column.
+
+        Returns:
+            The statistics as consumed by :attr:`_statistics`.
+        """
+        compared_columns = self._compared_columns
+        return {
+            "n_left": n_left,
+            "n_right": n_right,
+            "n_joined": n_joined,
+            "n_joined_unequal": n_joined_unequal,
+            "fraction_same": {
+                column: (n / n_joined if n_joined > 0 else float("nan"))
+                for column, n in zip(compared_columns, n_equal)
+            },
+        }
+
     @cached_property
     def _join_conditions(self) -> list[sa.ColumnElement[bool]]:
         """Forms a list of join conditions."""
@@ -433,6 +1880,62 @@ class TableComparison:
             return left_table.outerjoin(right_table, sa.and_(*self._join_conditions))
         return right_table.outerjoin(left_table, sa.and_(*self._join_conditions))
 
+    def _unpivoted_diffs(self) -> tuple[sa.Select, sa.ColumnElement[int]]:
+        """Unpivots the differing cells of the joined rows such that they can be queried with
+        a single join.
+
+        Returns:
+            The unordered query for the differing cells as described in :meth:`cell_diffs`
+            along with the expression for the position of the column of each cell.
+        """
+        columns = self._compared_columns
+        if self.materialize:
+            diff = self._materialized_diff
+            joined = self._materialized_join()
+            is_unequal = [diff.c[f"eq_{i}"] == 0 for i in range(len(columns))]
+        else:
+            joined = self._inner_join()
+            is_unequal = [
+                sa.not_(self._is_equal(c, self.column_name_mapping[c])) for c in columns
+            ]
+
+        # Unpivot the compared columns by cross joining the joined rows with the list of
+        # column names and picking the values of the respective column
+        names = sa.union_all(
+            *[
+                sa.select(
+                    sa.literal(i).label("column_index"),
+                    sa.literal(column).label("column_name"),
+                )
+                for i, column in enumerate(columns)
+            ]
+        ).subquery("compared_columns")
+        index = names.c["column_index"]
+
+        def pick(values: list[sa.ColumnElement]) -> sa.ColumnElement:
+            return sa.case(*[(index == i, v) for i, v in enumerate(values)])
+
+        query = (
+            sa.select(
+                *[self.left_table.c[c] for c in self.join_columns],
+                names.c["column_name"],
+                pick([sa.cast(self.left_table.c[c], sa.String) for c in columns]).label(
+                    "left_value"
+                ),
+                pick(
+                    [
+                        sa.cast(
+                            self.right_table.c[self.column_name_mapping[c]], sa.String
+                        )
+                        for c in columns
+                    ]
+                ).label("right_value"),
+            )
+            .select_from(joined.join(names, sa.true()))
+            .where(sa.or_(*[sa.and_(index == i, u) for i, u in enumerate(is_unequal)]))
+        )
+        return query, index
+
     def _get_aggregate_changes(self, left_col_name: str) -> sa.Select:
         """Counts the number of different ways each column changes from one table to
         another.
@@ -441,8 +1944,8 @@ class TableComparison:
             left_col_name: The column name in the left table.
 
         Returns:
-            A select statement counting the number of each unique change, ordering by most common
-            to least common.
+            A select statement counting the number of each unique change. The columns of the
+            select statement are labeled ``change`` and ``count``.
         """
         right_col_name = self.column_name_mapping[left_col_name]
         left_col = self.left_table.c[left_col_name]
@@ -456,27 +1959,124 @@ class TableComparison:
             )
         )
 
+        if self.materialize:
+            flag = self._materialized_diff.c[
+                f"eq_{self._compared_columns.index(left_col_name)}"
+            ]
+            joined = self._materialized_join()
+            is_unequal = flag == 0
+        else:
+            joined = self._inner_join()
+            is_unequal = sa.not_(self._is_equal(left_col_name, right_col_name))
+
         return (
-            sa.select(change, sa.func.count())
-            .select_from(self._inner_join())
-            .where(sa.not_(self._is_equal(left_col_name, right_col_name)))
+            sa.select(change.label("change"), sa.func.count().label("count"))
+            .select_from(joined)
+            .where(is_unequal)
             .group_by(left_col, right_col)
-            .order_by(sa.func.count().desc())
         )
 
-    def _count_rows(self, table: sa.FromClause) -> int:
+    def _bucket_checksums(
+        self,
+        hashes: sa.Subquery,
+        modulus: int,
+        parent_modulus: int,
+        parent_buckets: list[int] | None,
+    ) -> dict[int, tuple[int, int]]:
+        """Computes the checksums of all buckets with the provided parents.
+
+        Args:
+            hashes: A subquery providing the key and row hashes of a table.
+            modulus: The modulus to obtain the bucket from the key hash.
+            parent_modulus: The modulus to obtain the parent bucket from the key hash.
+            parent_buckets: The parent buckets whose child buckets to compute checksums for or
+                ``None`` if checksums ought to be computed for all buckets.
+
+        Returns:
+            A mapping from buckets to the number of rows and the sum of row hashes.
+        """
+        buckets = sa.select(
+            (hashes.c["key_hash"] % modulus).label("bucket"),
+            sa.cast(hashes.c["row_hash"], sa.BigInteger).label("row_hash"),
+        )
+        result: dict[int, tuple[int, int]] = {}
+        for condition in _bucket_conditions(
+            hashes.c["key_hash"] % parent_modulus, parent_buckets
+        ):
+            bucket_subquery = buckets.where(condition).subquery()
+            query = sa.select(
+                bucket_subquery.c["bucket"],
+                sa.func.count(),
+                sa.func.sum(bucket_subquery.c["row_hash"]),
+            ).group_by(bucket_subquery.c["bucket"])
+            with self._connect() as conn:
+                result.update(
+                    {
+                        bucket: (count, checksum)
+                        for bucket, count, checksum in conn.execute(query)
+                    }
+                )
+        return result
+
+    def _bucket_rows(
+        self, hashes: sa.Subquery, modulus: int, buckets: list[int]
+    ) -> dict[tuple[Any, ...], int]:
+        """Fetches the join column values and row hashes of all rows in the provided
+        buckets.
+
+        Args:
+            hashes: A subquery providing the key and row hashes of a table.
+            modulus: The modulus to obtain the bucket from the key hash.
+            buckets: The buckets whose rows to fetch.
+
+        Returns:
+            A mapping from the values of the join columns to the row hash.
+        """
+        key_columns = [hashes.c[f"key_{i}"] for i in range(len(self.join_columns))]
+        result: dict[tuple[Any, ...], int] = {}
+        for condition in _bucket_conditions(hashes.c["key_hash"] % modulus, buckets):
+            query = sa.select(hashes.c["row_hash"], *key_columns).where(condition)
+            with self._connect() as conn:
+                result.update(
+                    {tuple(keys): row_hash for row_hash, *keys in conn.execute(query)}
+                )
+        return result
+
+    def _exists(self, query: sa.Select | sa.CompoundSelect) -> bool:
+        """Checks whether a query returns at least one row without evaluating it fully.
+
+        Args:
+            query: The query to check.
+
+        Returns:
+            Whether the query returns any row.
+        """
+        probe = sa.select(sa.literal(1)).select_from(query.subquery()).limit(1)
+        with self._connect() as conn:
+            return conn.execute(probe).first() is not None
+
+    def _count_rows(self, table: sa.FromClause, engine: sa.Engine | None = None) -> int:
         """Counts the number of rows in a table-like object.
 
         Args:
             table: A table-like object.
+            engine: The engine to use for counting the rows. Defaults to the engine of the
+                "left" table.
 
         Returns:
             The number of rows.
         """
-        with self.engine.connect() as conn:
-            return conn.execute(
-                sa.select(sa.func.count()).select_from(table)
-            ).scalar_one()
+        query = sa.select(sa.func.count()).select_from(table)
+        if engine is not None and engine is not self.engine:
+            with engine.connect() as conn:
+                return conn.execute(query).scalar_one()
+        with self._connect() as conn:
+            return conn.execute(query).scalar_one()
+
+    def _connect(self) -> contextlib.AbstractContextManager[sa.Connection]:
+        """Connect to the database of the "left" table, re-using :attr:`connection` if this
+        comparison holds on to a connection."""
+        return self.scope.connect()
 
     # ---------------------------------------------------------------------------------------------
     # STRING REPRESENTATION
@@ -497,15 +2097,92 @@ class TableComparison:
 # UTILITIES
 # -------------------------------------------------------------------------------------------------
 
+_LEFT_MARKER = "_zzz_left"
+_RIGHT_MARKER = "_zzz_right"
+
+
+# Exclusive upper bound for the values of row hashes
+_MAX_HASH = 2**31
+# The maximum number of buckets to include into a single `IN` clause
+_MAX_BUCKETS_PER_QUERY = 1000
+# The maximum number of columns of an inferred key that is smaller than all columns
+_MAX_INFERRED_KEY_SIZE = 2
+# The maximum number of column combinations that are checked when inferring a key
+_MAX_INFERRED_KEY_CANDIDATES = 10
+
+
+def _common_type(
+    dialect: sa.Dialect, lhs: sa.types.TypeEngine, rhs: sa.types.TypeEngine
+) -> sa.types.TypeEngine | None:
+    """The type to cast two matched columns to such that equal values hash equally or
+    ``None`` if the columns already have the same type."""
+    if _type_name(dialect, lhs) == _type_name(dialect, rhs):
+        return None
+    if isinstance(lhs, sa.Integer) and isinstance(rhs, sa.Integer):
+        return sa.BigInteger()
+    exact = (sa.Integer, sa.Numeric)
+    if isinstance(lhs, exact) and isinstance(rhs, exact):
+        scales = [
+            0 if isinstance(t, sa.Integer) else cast(sa.Numeric, t).scale
+            for t in [lhs, rhs]
+        ]
+        if not any(isinstance(t, sa.Float) for t in [lhs, rhs]) and None not in scales:
+            return sa.Numeric(38, max(cast(list[int], scales)))
+        return sa.Double()
+    # Otherwise, compare the canonical string representation of the values
+    return sa.UnicodeText()
+
+
+def _type_name(dialect: sa.Dialect, type_: sa.types.TypeEngine) -> str:
+    try:
+        return type_.compile(dialect=dialect)
+    except sa.exc.CompileError:
+        return repr(type_)
+
+
+def _bucket_conditions(
+    bucket: sa.ColumnElement[int], buckets: list[int] | None
+) -> list[sa.ColumnElement[bool]]:
+    if buckets is None:
+        return [sa.true()]
+    return [
+        bucket.in_(buckets[i : i + _MAX_BUCKETS_PER_QUERY])
+        for i in range(0, len(buckets), _MAX_BUCKETS_PER_QUERY)
+    ]
+
+
+def _to_fraction_same(row: sa.Row) -> dict[str, float]:
+    """Obtain the fraction of equal values per column from the result of
+    :attr:`TableComparison._fraction_same_query`."""
+    return {
+        column: (match if match is not None else float("nan"))
+        for column, match in row._asdict().items()
+    }
+
+
+def _wilson_interval(fraction: float, n: int, z: float = 1.96) -> tuple[float, float]:
+    """Wilson score interval for a fraction observed in a sample of size ``n``. The default
+    ``z`` yields a 95% confidence interval."""
+    if n == 0 or math.isnan(fraction):
+        return (float("nan"), float("nan"))
+    denominator = 1 + z**2 / n
+    center = (fraction + z**2 / (2 * n)) / denominator
+    margin = (
+        z * math.sqrt(fraction * (1 - fraction) / n + z**2 / (4 * n**2)) / denominator
+    )
+    return (max(center - margin, 0.0), min(center + margin, 1.0))
+
+
+def _count_if(condition: sa.ColumnElement[bool]) -> sa.ColumnElement[int]:
+    return sa.func.coalesce(sa.func.sum(sa.case((condition, 1), else_=0)), 0)
+
 
 def _join_columns_from_pk_if_needed(
-    engine: sa.Engine,
     left: sa.FromClause,
     right: sa.FromClause,
     join_columns: list[str],
     ignore_casing: bool,
     column_name_mapping: dict[str, str],
-    infer_primary_keys: bool,
 ) -> list[str]:
     if join_columns and ignore_casing:
         # If we already have join columns and do not case about casing being passed, we need to
@@ -521,72 +2198,100 @@ def _join_columns_from_pk_if_needed(
             # All primary keys can be matched
             join_columns = list(left_pks | {reverse_mapping[pk] for pk in right_pks})
 
-    if not join_columns:
-        if not infer_primary_keys:
-            raise ValueError(
-                "No matching primary keys found and no join columns specified. Consider "
-                "specifying `ignore_casing` if your column names are case-sensitive or "
-                "`infer_primary_keys` if your table does not have a primary key."
-            )
+    return join_columns
 
-        # Here we want to infer the primary key. For this, we need to check whether all columns
-        # that are being matched provide a useful primary key. We do not make any effort to
-        # calculate a small primary key to reduce computational complexity. However, we need to
-        # get rid of all columns that can be NULL.
-        non_null_column_mapping = {
-            k: v
-            for k, v in column_name_mapping.items()
-            if _is_valid_primary_key_column(engine, left, right, k, v)
-        }
-        if len(non_null_column_mapping) == 0:
-            raise ValueError(
-                "Automatically inferring primary keys failed as there are no non-null columns "
-                "that can be matched."
-            )
 
-        left_keys = list(non_null_column_mapping.keys())
-        right_keys = list(non_null_column_mapping.values())
-        if (not _is_valid_primary_key(engine, left, left_keys)) or (
-            not _is_valid_primary_key(engine, right, right_keys)
-        ):
-            raise ValueError(
-                "Automatically inferring primary keys failed as the mapped column names "
-                "would cause duplicates."
-            )
+def _minimal_unique_key(
+    left_engine: sa.Engine,
+    right_engine: sa.Engine,
+    left: sa.FromClause,
+    right: sa.FromClause,
+    column_name_mapping: dict[str, str],
+) -> list[str] | None:
+    """Find the smallest set of (non-null) columns that is unique in both tables.
 
-        # When we reach this point, we are okay to use all columns
-        join_columns = left_keys
+    Single columns are checked with a single query per table that counts the distinct values
+    of all columns. Combinations of up to ``_MAX_INFERRED_KEY_SIZE`` columns are then checked
+    in the order of the upper bound of their number of distinct values, derived from the
+    counts of the individual columns. If no small key is found, all columns are used.
 
-    return join_columns
+    Returns:
+        The columns of the key or ``None`` if not even all columns are unique.
+    """
+    # Consider columns in the order of the "left" table to obtain a deterministic key
+    left_columns = [c.name for c in left.columns if c.name in column_name_mapping]
+    right_columns = [column_name_mapping[c] for c in left_columns]
+    n_left, left_distinct = _distinct_counts(left_engine, left, left_columns)
+    n_right, right_distinct = _distinct_counts(right_engine, right, right_columns)
+
+    def coverage(combination: tuple[str, ...]) -> float:
+        # Upper bound for the number of distinct values of the combination relative to the
+        # number of rows, taking the minimum across both tables. Combinations with a
+        # coverage below 1 cannot be unique.
+        return min(
+            math.prod(left_distinct[c] for c in combination) / n_left
+            if n_left > 0
+            else math.inf,
+            math.prod(right_distinct[column_name_mapping[c]] for c in combination)
+            / n_right
+            if n_right > 0
+            else math.inf,
+        )
 
+    # A single column is unique if its number of distinct values matches the number of rows
+    for column in left_columns:
+        if coverage((column,)) >= 1:
+            return [column]
+
+    candidates = sorted(
+        (
+            combination
+            for size in range(2, min(_MAX_INFERRED_KEY_SIZE, len(left_columns)) + 1)
+            for combination in itertools.combinations(left_columns, size)
+            if coverage(combination) >= 1
+        ),
+        key=lambda c: (len(c), -coverage(c)),
+    )
+    for combination in candidates[:_MAX_INFERRED_KEY_CANDIDATES]:
+        columns = list(combination)
+        if _is_valid_primary_key(left_engine, left, columns) and _is_valid_primary_key(
+            right_engine, right, [column_name_mapping[c] for c in columns]
+        ):
+            return columns
 
-def _is_valid_primary_key_column(
-    engine: sa.Engine,
-    left_table: sa.FromClause,
-    right_table: sa.FromClause,
-    left_column: str,
-    right_column: str,
-) -> bool:
-    # If both columns are non-nullable, it is a valid column.
-    if (
-        not left_table.c[left_column].nullable
-        and not right_table.c[right_column].nullable
+    # Fall back to using all columns
+    if _is_valid_primary_key(left_engine, left, left_columns) and _is_valid_primary_key(
+        right_engine, right, right_columns
     ):
-        return True
+        return left_columns
+    return None
+
 
-    # If not, let's check if there are actually any nulls in the column.
+def _distinct_counts(
+    engine: sa.Engine, table: sa.FromClause, columns: list[str]
+) -> tuple[int, dict[str, int]]:
+    with engine.connect() as conn:
+        row = conn.execute(
+            sa.select(
+                sa.func.count(),
+                *[sa.func.count(sa.distinct(table.c[c])) for c in columns],
+            ).select_from(table)
+        ).one()
+    return row[0], dict(zip(columns, row[1:]))
+
+
+def _null_counts(
+    engine: sa.Engine, table: sa.FromClause, columns: list[str]
+) -> dict[str, int]:
+    if not columns:
+        return {}
     with engine.connect() as conn:
-        left_nulls = conn.execute(
-            sa.select(sa.func.count())
-            .select_from(left_table)
-            .where(left_table.c[left_column].is_(None))
-        ).scalar_one()
-        right_nulls = conn.execute(
-            sa.select(sa.func.count())
-            .select_from(right_table)
-            .where(right_table.c[right_column].is_(None))
-        ).scalar_one()
-    return left_nulls == 0 and right_nulls == 0
+        row = conn.execute(
+            sa.select(
+                *[_count_if(table.c[c].is_(None)).label(c) for c in columns]
+            ).select_from(table)
+        ).one()
+    return dict(zip(columns, row))
 
 
 def _is_valid_primary_key(
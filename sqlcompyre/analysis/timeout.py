@@ -0,0 +1,174 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import contextlib
+import contextvars
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+import sqlalchemy as sa
+
+from .dialects import DialectProtocol
+
+
+class StatementTimeoutError(TimeoutError):
+    """Error raised when a statement is cancelled because it exceeded its timeout or
+    because all running statements were cancelled via :meth:`cancel_statements`."""
+
+
+def attach(engine: sa.Engine) -> None:
+    """Allow cancelling statements executed via the provided engine. Attaching an engine
+    multiple times is a no-op."""
+    listeners: list[tuple[str, Callable[..., Any]]] = [
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+        ("handle_error", _handle_error),
+    ]
+    for identifier, fn in listeners:
+        if not sa.event.contains(engine, identifier, fn):
+            sa.event.listen(engine, identifier, fn)
+
+
+@contextlib.contextmanager
+def statement_timeout(seconds: float | None) -> Iterator[None]:
+    """Make all statements executed within the context manager cancellable and cancel them
+    if they run longer than the provided timeout.
+
+    Args:
+        seconds: The maximum number of seconds that a single statement may run. If ``None``,
+            the timeout of an enclosing context manager applies, if any.
+    """
+    active = _ACTIVE.get()
+    if seconds is None and active is not None:
+        seconds = active
+    token = _ACTIVE.set(seconds if seconds is not None else _NO_TIMEOUT)
+    try:
+        yield
+    finally:
+        _ACTIVE.reset(token)
+
+
+def cancel_statements() -> None:
+    """Cancel all cancellable statements that are currently running, e.g. in another
+    thread. The cancelled statements raise a :class:`StatementTimeoutError`."""
+    with _LOCK:
+        running = list(_RUNNING)
+    for statement in running:
+        statement.cancel()
+
+
+# ----------------------------------------------------------------------------------------------- #
+
+#: Marker for statements that are cancellable but have no timeout.
+_NO_TIMEOUT = float("inf")
+
+#: The timeout for statements in the current context. ``None`` if statements are not
+#: cancellable.
+_ACTIVE: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "sqlcompyre_statement_timeout", default=None
+)
+
+_LOCK = threading.Lock()
+_RUNNING: set["_RunningStatement"] = set()
+_WARNED_DIALECTS: set[str] = set()
+
+
+@dataclass(eq=False)
+class _RunningStatement:
+    dialect: DialectProtocol
+    dbapi_connection: Any
+    cursor: Any
+    timeout: float
+    cancelled: bool = False
+    finished: bool = False
+    timer: threading.Timer | None = field(default=None, repr=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def cancel(self) -> None:
+        # The timer may fire after the statement has ended, cancelling must then not
+        # interrupt the next statement running on the same connection
+        with self.lock:
+            if self.finished:
+                return
+            self.cancelled = True
+            try:
+                self.dialect.cancel(self.dbapi_connection, self.cursor)
+            except NotImplementedError:
+                if self.dialect.name not in _WARNED_DIALECTS:
+                    _WARNED_DIALECTS.add(self.dialect.name)
+                    logging.warning(
+                        "Statements cannot be cancelled for dialect '%s'.",
+                        self.dialect.name,
+                    )
+
+    def start(self) -> None:
+        with _LOCK:
+            _RUNNING.add(self)
+        if self.timeout != _NO_TIMEOUT:
+            self.timer = threading.Timer(self.timeout, self.cancel)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def stop(self) -> None:
+        with self.lock:
+            self.finished = True
+        if self.timer is not None:
+            self.timer.cancel()
+        with _LOCK:
+            _RUNNING.discard(self)
+
+
+def _before_cursor_execute(
+    conn: sa.Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    timeout = _ACTIVE.get()
+    if timeout is None or context is None:
+        return
+    running = _RunningStatement(
+        dialect=cast(DialectProtocol, conn.dialect),
+        dbapi_connection=conn.connection.dbapi_connection,
+        cursor=cursor,
+        timeout=timeout,
+    )
+    context._sqlcompyre_statement = running
+    running.start()
+
+
+def _after_cursor_execute(
+    conn: sa.Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    running = getattr(context, "_sqlcompyre_statement", None)
+    if running is not None:
+        running.stop()
+
+
+def _handle_error(exception_context: sa.engine.ExceptionContext) -> Exception | None:
+    running = getattr(
+        exception_context.execution_context, "_sqlcompyre_statement", None
+    )
+    if running is None:
+        return None
+    running.stop()
+    if not running.cancelled:
+        return None
+    reason = (
+        "was cancelled"
+        if running.timeout == _NO_TIMEOUT
+        else f"exceeded its timeout of {running.timeout:g}s"
+    )
+    error = StatementTimeoutError(f"Statement {reason}.")
+    error.__cause__ = exception_context.original_exception
+    return error
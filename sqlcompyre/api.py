@@ -4,15 +4,31 @@
 import sys
 
 import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from .analysis import QueryInspection, SchemaComparison, TableComparison
+from .analysis._reflection import LazyTables, reflect, table_names
+from .analysis.asynchronous import (
+    AsyncQueryInspection,
+    AsyncSchemaComparison,
+    AsyncTableComparison,
+    _run_sync,
+)
+from .analysis.connection import ConnectionScope
+from .analysis.query_log import QueryLog
+from .cache import ResultCache
 
 # ---------------------------------------------------------------------------------------------
 # INSPECTIONS
 # ---------------------------------------------------------------------------------------------
 
 
-def inspect(engine: sa.Engine, query: sa.Select | sa.FromClause) -> QueryInspection:
+def inspect(
+    engine: sa.Engine,
+    query: sa.Select | sa.FromClause,
+    isolation_level: str | None = None,
+    query_log: QueryLog | None = None,
+) -> QueryInspection:
     """Inspect the results of a query in the database.
 
     Args:
@@ -20,6 +36,14 @@ def inspect(engine: sa.Engine, query: sa.Select | sa.FromClause) -> QueryInspect
         query: The query whose results to inspect. This can either be a SQLAlchemy ``SELECT``
             statement or a ``FROM`` clause (which includes plain :class:`sqlalchemy.Table`
             objects).
+        isolation_level: An optional isolation level (e.g. ``SNAPSHOT`` or
+            ``REPEATABLE READ``). If provided, all queries of the inspection, including the
+            ones for column statistics, are run within a single transaction with this
+            isolation level. Call ``close()`` on :attr:`QueryInspection.scope` to end the
+            transaction.
+        query_log: An optional log to record all executed statements in. If not provided,
+            statements are recorded in a new log, available as
+            :attr:`QueryInspection.query_log`.
 
     Returns:
         A query inspection object that can be used to easily gain insights into the query
@@ -29,12 +53,19 @@ def inspect(engine: sa.Engine, query: sa.Select | sa.FromClause) -> QueryInspect
         :meth:`inspect_table` if you want to inspect the results of ``SELECT * FROM table`` and
         specify the table as a string.
     """
+    scope = ConnectionScope(engine, isolation_level)
     if isinstance(query, sa.Select):
-        return QueryInspection(engine, query.subquery())
-    return QueryInspection(engine, query)
+        return QueryInspection(engine, query.subquery(), scope, query_log)
+    return QueryInspection(engine, query, scope, query_log)
 
 
-def inspect_table(engine: sa.Engine, table: sa.Table | str) -> QueryInspection:
+def inspect_table(
+    engine: sa.Engine,
+    table: sa.Table | str,
+    isolation_level: str | None = None,
+    query_log: QueryLog | None = None,
+    cache: ResultCache | None = None,
+) -> QueryInspection:
     """Inspect a table in the database.
 
     Args:
@@ -43,6 +74,12 @@ def inspect_table(engine: sa.Engine, table: sa.Table | str) -> QueryInspection:
             be specified with schema (and database) name. For MSSQL, the table name can be
             specified as ``[[<database>.]<schema>.]<table>`` depending on the "default" database
             of the provided engine and the database's default schema.
+        isolation_level: An optional isolation level for all queries of the inspection. See
+            :meth:`inspect` for details.
+        query_log: An optional log to record all executed statements in.
+        cache: An optional on-disk cache for the table definitions reflected from the
+            database if ``table`` is specified as string. Cached definitions are reused as
+            long as the catalog reports the table's schema to be unchanged.
 
     Returns:
         A query inspection object that can be used to easily gain insights into the table.
@@ -53,13 +90,10 @@ def inspect_table(engine: sa.Engine, table: sa.Table | str) -> QueryInspection:
         specifying the table name as a string.
     """
     if isinstance(table, str):
-        schema = _get_schema_name_from_table(table)
-        meta = sa.MetaData()
-        meta.reflect(bind=engine, schema=schema, views=True)
-        sa_table = meta.tables[table]
+        sa_table = _reflect_table(engine, table, cache)
     else:
         sa_table = table
-    return inspect(engine, sa_table)
+    return inspect(engine, sa_table, isolation_level, query_log)
 
 
 # ---------------------------------------------------------------------------------------------
@@ -68,7 +102,7 @@ def inspect_table(engine: sa.Engine, table: sa.Table | str) -> QueryInspection:
 
 
 def compare_tables(
-    engine: sa.Engine,
+    engine: sa.Engine | None,
     left: sa.Select | sa.FromClause | str,
     right: sa.Select | sa.FromClause | str,
     join_columns: list[str] | None = None,
@@ -78,11 +112,24 @@ def compare_tables(
     collation: str | None = None,
     ignore_casing: bool = False,
     infer_primary_keys: bool = False,
+    fused: bool = False,
+    left_engine: sa.Engine | None = None,
+    right_engine: sa.Engine | None = None,
+    batch_size: int = 10_000,
+    partitions: int = 1,
+    sample_fraction: float | None = None,
+    cache: ResultCache | None = None,
+    watermark_column: str | None = None,
+    materialize: bool = False,
+    isolation_level: str | None = None,
+    query_log: QueryLog | None = None,
+    timeout: float | None = None,
 ) -> TableComparison:
     """Compare two tables in the database.
 
     Args:
-        engine: The engine to use to access the database.
+        engine: The engine to use to access the database. May only be ``None`` if both
+            ``left_engine`` and ``right_engine`` are provided.
         left: The "left" database table for the comparison. The table can optionally be
             specified with schema (and database) name. For MSSQL, the table name can be
             specified as ``[[<database>.]<schema>.]<table>`` depending on the "default"
@@ -106,27 +153,88 @@ def compare_tables(
         ignore_casing: Whether casing (e.g. capitalization) should be ignored when matching
             column names. This is valuable if only interacting with the database through
             case-insensitive tools (e.g. SQL).
-        infer_primary_keys: Allows SQLCompyre to build a primary key from all matching columns
-            automatically and use it to match tables even if they do not have a primary key.
+        infer_primary_keys: Allows SQLCompyre to infer a primary key automatically and use it
+            to match tables even if they do not have a primary key. The inferred key is the
+            smallest set of at most two non-null matching columns that is unique in both
+            tables or, if there is no such set, all non-null matching columns. If ``cache`` is
+            provided, the inferred key is persisted and reused as long as it remains unique.
+        fused: Whether to compute row counts, row matches and column matches with a single
+            aggregate query over a ``FULL OUTER JOIN`` of the tables. This scans each table only
+            once instead of once per statistic and is, thus, much faster for large tables. It
+            requires the join columns to be unique in both tables.
+        left_engine: The engine to use to access the "left" table. Defaults to ``engine``.
+        right_engine: The engine to use to access the "right" table. Defaults to ``engine``.
+            If the engines of the "left" and "right" table differ (e.g. to compare a table
+            with its replica in another database system), both tables are streamed in
+            batches, ordered by the join columns, and merge-joined in Python. The memory usage
+            is bounded by the batch size, independently of the size of the tables. The queries
+            of row and column matches cannot be executed in this case.
+        batch_size: The number of rows to fetch at once when streaming tables from different
+            engines.
+        partitions: The number of ranges to split the domain of the (first) join column into.
+            If larger than one, the ranges are compared concurrently, with one aggregate query
+            per range, and the partial results are summed up. The connection pool of
+            ``engine`` should allow for at least this many connections.
+        sample_fraction: An optional fraction of rows to compute row and column matches on.
+            The sample is chosen deterministically via a hash of the join columns such that
+            the same keys are sampled in both tables. Row counts remain exact while column
+            matches additionally provide 95% confidence intervals.
+        cache: An optional on-disk cache for row counts, row matches and column matches. If a
+            result for the same tables (identified via a fingerprint of their contents) and
+            the same options is cached, it is returned without accessing the tables. Table
+            definitions reflected for tables specified as strings are cached as well and
+            reused as long as the catalog reports their schema to be unchanged.
+        watermark_column: An optional column of the "left" table (e.g. ``updated_at``) whose
+            value increases whenever a row is inserted or updated. If provided, the
+            comparison is run incrementally: only rows whose watermark exceeds the largest
+            watermark of the previous comparison are compared, and the results are combined
+            with the per-key state persisted in ``cache`` to obtain exact row and column
+            matches. Since deleted rows cannot be detected via the watermark, all rows are
+            compared whenever the row counts disagree with the persisted state. Requires
+            ``cache`` and unique, non-null join columns.
+        materialize: Whether to materialize the join keys of all joined rows along with one
+            equality flag per compared column into a temporary table, indexed by the join
+            keys. The tables are then joined only once and row matches, column matches,
+            mismatch queries and top changes are all derived from the temporary table. As the
+            temporary table is bound to a connection, mismatch queries must be executed via
+            :attr:`TableComparison.connection`. Use the comparison as a context manager or
+            call :meth:`TableComparison.close` to drop the temporary table.
+        isolation_level: An optional isolation level (e.g. ``SNAPSHOT`` for MSSQL or
+            ``REPEATABLE READ``). If provided, all queries of the comparison are run on a
+            single connection within a single transaction with this isolation level such
+            that row counts, row matches and column matches describe the same state of the
+            database even if the tables are modified concurrently. Use the comparison as a
+            context manager or call :meth:`TableComparison.close` to end the transaction.
+            Cannot be combined with tables from different engines or partitions.
+        query_log: An optional log to record all executed statements in, along with their
+            wall time, the number of returned rows and the property that triggered them.
+            Pass ``QueryLog(explain=True)`` to additionally capture query plans. If not
+            provided, statements are recorded in a new log, available as
+            :attr:`TableComparison.query_log`.
+        timeout: An optional number of seconds after which a single statement is cancelled.
+            Accessing a statistic whose statement is cancelled raises a
+            :class:`~sqlcompyre.analysis.StatementTimeoutError` while the summary report
+            marks the affected sections as skipped. Statements are cancelled via the DBAPI
+            (e.g. ``interrupt()`` for SQLite and DuckDB); for dialects that do not support
+            cancellation, the timeout has no effect.
 
     Returns:
         A table comparison object that can be used to explore the differences in the tables.
     """
+    left_engine = left_engine or engine
+    right_engine = right_engine or engine
+    if left_engine is None or right_engine is None:
+        raise ValueError(
+            "`engine` must be provided unless both `left_engine` and `right_engine` are set."
+        )
+
     # Get the SQLAlchemy representation of the tables in the database
     left_table: sa.FromClause
     right_table: sa.FromClause
-    if isinstance(left, str) or isinstance(right, str):
-        meta = sa.MetaData()
-
-        if isinstance(left, str):
-            left_schema = _get_schema_name_from_table(left)
-            meta.reflect(bind=engine, schema=left_schema, views=True)
-            left_table = meta.tables[left]
-
-        if isinstance(right, str):
-            right_schema = _get_schema_name_from_table(right)
-            meta.reflect(bind=engine, schema=right_schema, views=True)
-            right_table = meta.tables[right]
+    if isinstance(left, str):
+        left_table = _reflect_table(left_engine, left, cache)
+    if isinstance(right, str):
+        right_table = _reflect_table(right_engine, right, cache)
 
     if not isinstance(left, str):
         left_table = left.subquery() if isinstance(left, sa.Select) else left
@@ -135,7 +243,7 @@ def compare_tables(
 
     # Create a table comparison object
     return TableComparison(
-        engine=engine,
+        engine=left_engine,
         left_table=left_table,
         right_table=right_table,
         join_columns=join_columns,
@@ -145,6 +253,17 @@ def compare_tables(
         collation=collation,
         ignore_casing=ignore_casing,
         infer_primary_keys=infer_primary_keys,
+        fused=fused,
+        right_engine=right_engine,
+        batch_size=batch_size,
+        partitions=partitions,
+        sample_fraction=sample_fraction,
+        cache=cache,
+        watermark_column=watermark_column,
+        materialize=materialize,
+        isolation_level=isolation_level,
+        query_log=query_log,
+        timeout=timeout,
     )
 
 
@@ -156,6 +275,10 @@ def compare_schemas(
     float_precision: float = sys.float_info.epsilon,
     collation: str | None = None,
     ignore_casing: bool = False,
+    cache: ResultCache | None = None,
+    isolation_level: str | None = None,
+    query_log: QueryLog | None = None,
+    timeout: float | None = None,
 ) -> SchemaComparison:
     """Compare all tables from two schemas in the database. For multi-part schemas (e.g.
     for MSSQL), it is possible to only specify the first part of the schema and compare
@@ -181,6 +304,16 @@ def compare_schemas(
         ignore_casing: Whether casing (e.g. capitalization) should be ignored when matching
             table names. This is valuable if only interacting with the database through
             case-insensitive tools (e.g. SQL).
+        cache: An optional on-disk cache for the results of comparisons of matched tables
+            and for the table definitions reflected from both schemas.
+        isolation_level: An optional isolation level that is used for the comparisons of
+            matched tables. Each table comparison runs within its own transaction.
+        query_log: An optional log to record all statements in that are executed by the
+            schema comparison and the comparisons of matched tables.
+        timeout: An optional number of seconds after which a single statement of the
+            comparisons of matched tables is cancelled. A table whose equality cannot be
+            determined in time is reported rather than skipped by
+            :meth:`SchemaComparison.table_reports`.
 
     Returns:
         A schema comparison object.
@@ -196,18 +329,21 @@ def compare_schemas(
     left_name = left[:-2] if is_db_comparison else left
     right_name = right[:-2] if is_db_comparison else right
 
-    # Find all tables in left and right schema/database
+    # Find all tables in left and right schema/database, tables are only reflected once they
+    # are compared
     left_tables = _get_tables_from_schema(
         engine,
         left_name,
         is_database=is_db_comparison,
         include_views=include_views,
+        cache=cache,
     )
     right_tables = _get_tables_from_schema(
         engine,
         right_name,
         is_database=is_db_comparison,
         include_views=include_views,
+        cache=cache,
     )
 
     # Create the schema comparison object. To obtain the table names, we split off the "prefix"
@@ -216,16 +352,154 @@ def compare_schemas(
         engine=engine,
         left_schema=left,
         right_schema=right,
-        left_tables={str(table)[len(left_name) + 1 :]: table for table in left_tables},
-        right_tables={
-            str(table)[len(right_name) + 1 :]: table for table in right_tables
-        },
+        left_tables=left_tables,
+        right_tables=right_tables,
         float_precision=float_precision,
         collation=collation,
         ignore_casing=ignore_casing,
+        cache=cache,
+        isolation_level=isolation_level,
+        query_log=query_log,
+        timeout=timeout,
     )
 
 
+# ---------------------------------------------------------------------------------------------
+# ASYNCIO
+# ---------------------------------------------------------------------------------------------
+
+
+async def inspect_async(
+    engine: AsyncEngine, query: sa.Select | sa.FromClause | str
+) -> AsyncQueryInspection:
+    """Inspect the results of a query in the database from within an asyncio event loop.
+
+    Args:
+        engine: The asynchronous engine to use to access the database. Its database driver
+            must support asyncio (see :meth:`compare_tables_async`).
+        query: The query whose results to inspect. If provided as string, the query is
+            interpreted as the name of a table (see :meth:`inspect_table`).
+
+    Returns:
+        A query inspection object whose statistics can be awaited.
+    """
+    if isinstance(query, str):
+        inspection = await _run_sync(
+            engine, lambda _: inspect_table(engine.sync_engine, query)
+        )
+    else:
+        inspection = inspect(engine.sync_engine, query)
+    return AsyncQueryInspection(engine, inspection)
+
+
+async def compare_tables_async(
+    engine: AsyncEngine,
+    left: sa.Select | sa.FromClause | str,
+    right: sa.Select | sa.FromClause | str,
+    join_columns: list[str] | None = None,
+    ignore_columns: list[str] | None = None,
+    column_name_mapping: dict[str, str] | None = None,
+    float_precision: float = sys.float_info.epsilon,
+    collation: str | None = None,
+    ignore_casing: bool = False,
+    infer_primary_keys: bool = False,
+    fused: bool = False,
+    sample_fraction: float | None = None,
+    cache: ResultCache | None = None,
+    watermark_column: str | None = None,
+    materialize: bool = False,
+    isolation_level: str | None = None,
+    query_log: QueryLog | None = None,
+    timeout: float | None = None,
+) -> AsyncTableComparison:
+    """Compare two tables in the database from within an asyncio event loop. Row counts, row
+    matches and column matches can be awaited and independent queries are run concurrently,
+    each on its own connection.
+
+    See :meth:`compare_tables` for a description of all parameters. Note that ``engine`` must
+    be an :class:`~sqlalchemy.ext.asyncio.AsyncEngine`. Comparisons of tables from different
+    engines and partitioned comparisons are not supported as they require multiple threads.
+
+    Note:
+        Asynchronous engines require an asyncio database driver which is not installed along
+        with SQLCompyre, e.g. ``aiosqlite`` for SQLite (``sqlite+aiosqlite://...``) or
+        ``aioodbc`` for Microsoft SQL Server (``mssql+aioodbc://...``).
+
+    Returns:
+        A table comparison object whose statistics can be awaited.
+    """
+    comparison = await _run_sync(
+        engine,
+        lambda _: compare_tables(
+            engine.sync_engine,
+            left,
+            right,
+            join_columns=join_columns,
+            ignore_columns=ignore_columns,
+            column_name_mapping=column_name_mapping,
+            float_precision=float_precision,
+            collation=collation,
+            ignore_casing=ignore_casing,
+            infer_primary_keys=infer_primary_keys,
+            fused=fused,
+            sample_fraction=sample_fraction,
+            cache=cache,
+            watermark_column=watermark_column,
+            materialize=materialize,
+            isolation_level=isolation_level,
+            query_log=query_log,
+            timeout=timeout,
+        ),
+    )
+    return AsyncTableComparison(engine, comparison)
+
+
+async def compare_schemas_async(
+    engine: AsyncEngine,
+    left: str,
+    right: str,
+    include_views: bool = False,
+    float_precision: float = sys.float_info.epsilon,
+    collation: str | None = None,
+    ignore_casing: bool = False,
+    cache: ResultCache | None = None,
+    isolation_level: str | None = None,
+    query_log: QueryLog | None = None,
+    timeout: float | None = None,
+) -> AsyncSchemaComparison:
+    """Compare all tables from two schemas in the database from within an asyncio event loop.
+
+    See :meth:`compare_schemas` for a description of all parameters. Note that ``engine`` must
+    be an :class:`~sqlalchemy.ext.asyncio.AsyncEngine` backed by an asyncio database driver
+    (see :meth:`compare_tables_async`).
+
+    Returns:
+        A schema comparison object whose table comparisons can be awaited.
+    """
+
+    def compare(_: sa.Connection) -> SchemaComparison:
+        comparison = compare_schemas(
+            engine.sync_engine,
+            left,
+            right,
+            include_views=include_views,
+            float_precision=float_precision,
+            collation=collation,
+            ignore_casing=ignore_casing,
+            cache=cache,
+            isolation_level=isolation_level,
+            query_log=query_log,
+            timeout=timeout,
+        )
+        # The synchronous facade of the engine is only usable within `run_sync`, hence,
+        # matched tables cannot be reflected lazily
+        comparison._reflect_matched_tables()
+        return comparison
+
+    comparison = await _run_sync(engine, compare)
+    return AsyncSchemaComparison(engine, comparison)
+
+
 # ---------------------------------------------------------------------------------------------
 # HELPERS
 # ---------------------------------------------------------------------------------------------
@@ -243,17 +517,31 @@ def _get_tables_from_schema(
     schema: str,
     is_database: bool,
     include_views: bool,
-) -> list[sa.Table]:
+    cache: ResultCache | None,
+) -> LazyTables:
     if is_database:
         engine = sa.create_engine(engine.url.set(database=schema))
-        schemas = sa.inspect(engine).get_schema_names()
-        nested_tables = [
-            _get_tables_from_schema(
-                engine, f"{schema}.{s}", is_database=False, include_views=include_views
-            )
+        schemas = [f"{schema}.{s}" for s in sa.inspect(engine).get_schema_names()]
+    else:
+        schemas = [schema]
+    # The tables are keyed by their names without the "prefix" given by `schema`
+    return LazyTables(
+        engine,
+        {
+            f"{s}.{name}"[len(schema) + 1 :]: (s, name)
             for s in schemas
-        ]
-        return [table for schema in nested_tables for table in schema]
-    meta = sa.MetaData()
-    meta.reflect(bind=engine, schema=schema, views=include_views)
-    return list(meta.tables.values())
+            for name in table_names(engine, s, views=include_views)
+        },
+        cache,
+    )
+
+
+def _reflect_table(
+    engine: sa.Engine, table: str, cache: ResultCache | None
+) -> sa.Table:
+    schema = _get_schema_name_from_table(table)
+    name = table[len(schema) + 1 :] if schema is not None else table
+    tables = reflect(engine, schema, views=True, cache=cache, only=[name])
+    if len(tables) == 0:
+        raise KeyError(table)
+    return tables[0]
@@ -0,0 +1,220 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import hashlib
+import json
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, cast
+
+import sqlalchemy as sa
+
+from .analysis.dialects import DialectProtocol
+
+
+class ResultCache:
+    """Persistent on-disk cache for the results of table comparisons.
+
+    Results are keyed by a fingerprint of the compared tables along with the options of the
+    comparison. A table's fingerprint is obtained cheaply from the database catalog (see
+    :meth:`~sqlcompyre.analysis.dialects.DialectProtocol.get_table_fingerprint`) such that
+    cache hits do not need to query the contents of the tables. Comparisons of tables that
+    cannot be fingerprinted (e.g. arbitrary queries) are never cached.
+
+    Additionally, table definitions reflected from the database are cached per schema and
+    reused for as long as the schema's version in the catalog (see
+    :meth:`~sqlcompyre.analysis.dialects.DialectProtocol.get_schema_version`) is unchanged.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_size: int | None = 64 * 1024 * 1024,
+        max_age: timedelta | None = timedelta(days=30),
+    ):
+        """
+        Args:
+            directory: The directory in which to store cached results. Defaults to
+                ``sqlcompyre`` in ``$XDG_CACHE_HOME`` (or ``~/.cache``).
+            max_size: The maximum total size of all cached results in bytes. If exceeded, the
+                least recently used results are evicted. If ``None``, the size is unbounded.
+            max_age: The maximum time since a cached result was last used. Results that have
+                not been used for longer are evicted. If ``None``, results never expire.
+        """
+        self.directory = (
+            Path(directory) if directory is not None else _default_directory()
+        )
+        self.max_size = max_size
+        self.max_age = max_age
+
+    def get(self, key: str) -> Any | None:
+        """Obtain a cached result.
+
+        Args:
+            key: The key of the result as obtained from :meth:`key`.
+
+        Returns:
+            The cached result or ``None`` if no (valid) result is cached for the key.
+        """
+        path = self._path(key)
+        try:
+            if self._is_expired(path):
+                path.unlink(missing_ok=True)
+                return None
+            with path.open() as f:
+                result = json.load(f)
+            # Mark the result as recently used for eviction
+            os.utime(path)
+            return result
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a result in the cache and evict outdated results if required.
+
+        Args:
+            key: The key of the result as obtained from :meth:`key`.
+            value: The JSON-serializable result to store.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("w") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)
+        self._evict(keep=path)
+
+    def evict(self) -> None:
+        """Remove expired results and, if the cache exceeds its maximum size, the least
+        recently used results."""
+        self._evict(keep=None)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def key(**components: Any) -> str:
+        """Compute the key for a result.
+
+        Args:
+            components: JSON-serializable components that uniquely identify the result.
+
+        Returns:
+            The key of the result.
+        """
+        serialized = json.dumps(components, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def state_path(self, key: str) -> Path:
+        """Obtain the path of a file for persisting state across comparisons. Different to
+        results, state files are never evicted.
+
+        Args:
+            key: The key of the state as obtained from :meth:`key`.
+
+        Returns:
+            The path of the state file. The parent directory is guaranteed to exist.
+        """
+        directory = self.directory / "state"
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / f"{key}.sqlite3"
+
+    # ---------------------------------------------------------------------------------------------
+
+    def _evict(self, keep: Path | None) -> None:
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if self._is_expired(path, stat.st_mtime):
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        if self.max_size is None:
+            return
+        total_size = sum(size for _, size, _ in entries)
+        # Evict the least recently used results first, the result that was just stored is
+        # evicted last
+        for _, size, path in sorted(entries, key=lambda x: (x[2] == keep, x[0])):
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _is_expired(self, path: Path, mtime: float | None = None) -> bool:
+        if self.max_age is None:
+            return False
+        if mtime is None:
+            mtime = path.stat().st_mtime
+        return time.time() - mtime > self.max_age.total_seconds()
+
+
+def table_identity(engine: sa.Engine, table: sa.FromClause) -> str | None:
+    """Obtain an identifier of a table that changes whenever the table's definition
+    changes.
+
+    Args:
+        engine: The engine to use for connecting to the database.
+        table: The table to identify.
+
+    Returns:
+        The identifier or ``None`` if the table is not a database table but a query.
+    """
+    if isinstance(table, sa.Alias):
+        table = table.element  # type: ignore
+    if not isinstance(table, sa.Table):
+        return None
+    columns = [
+        (column.name, str(column.type), column.primary_key, column.nullable)
+        for column in table.columns
+    ]
+    return ResultCache.key(
+        url=engine.url.render_as_string(hide_password=True),
+        table=str(table),
+        columns=columns,
+    )
+
+
+def table_fingerprint(engine: sa.Engine, table: sa.FromClause) -> str | None:
+    """Obtain a fingerprint of a table that changes whenever the table's contents or
+    definition change.
+
+    Args:
+        engine: The engine to use for connecting to the database.
+        table: The table to fingerprint.
+
+    Returns:
+        The fingerprint or ``None`` if the table cannot be fingerprinted.
+    """
+    identity = table_identity(engine, table)
+    if identity is None:
+        return None
+    if isinstance(table, sa.Alias):
+        table = table.element  # type: ignore
+    try:
+        fingerprint = cast(DialectProtocol, engine.dialect).get_table_fingerprint(
+            engine, cast(sa.Table, table)
+        )
+    except NotImplementedError:
+        return None
+    if fingerprint is None:
+        return None
+    return ResultCache.key(identity=identity, fingerprint=fingerprint)
+
+
+# -------------------------------------------------------------------------------------------------
+
+
+def _default_directory() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "sqlcompyre"
@@ -1,21 +1,28 @@
 # Copyright (c) QuantCo 2024-2025
 # SPDX-License-Identifier: BSD-3-Clause
 
+import contextvars
 import functools
 import logging
 import sys
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Literal, TypeVar, cast
 
 import click
 import sqlalchemy as sa
 
 import sqlcompyre as sc
-from sqlcompyre import Config
+from sqlcompyre import Config, QueryLog, ResultCache
+from sqlcompyre.analysis import TableComparison, cancel_statements
 from sqlcompyre.config.validation import read_config
 from sqlcompyre.report.formatters import get_formatter
 from sqlcompyre.report.writers import Writer, get_writer
+from sqlcompyre.results.row_matches import RowMatchQuery
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -114,6 +121,56 @@ def main(ctx: click.Context, format: str | None, writer: str):
     show_default="$COMPYRE_DB_CONNECTION_STRING",
     help="The connection string to connect to a database.",
 )
+@click.option(
+    "--strategy",
+    type=click.Choice(["join", "checksum"]),
+    default="join",
+    show_default=True,
+    help="The strategy for matching rows. 'checksum' compares checksums of buckets of rows "
+    "instead of joining the tables and does not compute column matches.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="A directory for caching comparison results and reflected table definitions "
+    "across runs. Results are only cached for tables whose contents can be fingerprinted.",
+)
+@click.option(
+    "--profile/--no-profile",
+    default=False,
+    show_default=True,
+    help="Whether to print the time spent on the queries for each computed statistic "
+    "after the report.",
+)
+@click.option(
+    "--timeout",
+    type=float,
+    default=None,
+    help="The maximum number of seconds that a single query may run. Report sections whose "
+    "queries time out are marked as skipped.",
+)
+@click.option(
+    "--export-mismatches",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="A directory to export all unjoined and unequal rows to, one file per kind of "
+    "mismatch.",
+)
+@click.option(
+    "--export-format",
+    type=click.Choice(["csv", "parquet"]),
+    default="csv",
+    show_default=True,
+    help="The file format for exported rows. 'parquet' requires pyarrow.",
+)
+@click.option(
+    "--top-changes",
+    type=int,
+    default=0,
+    show_default=True,
+    help="The number of most common changes to report for each column.",
+)
 @table_comparison_options
 @click.pass_obj
 def tables(
@@ -121,6 +178,13 @@ def tables(
     left_table: str,
     right_table: str,
     database_connection_string: str,
+    strategy: Literal["join", "checksum"],
+    cache_dir: Path | None,
+    profile: bool,
+    timeout: float | None,
+    export_mismatches: Path | None,
+    export_format: Literal["csv", "parquet"],
+    top_changes: int,
     join_columns: str | None,
     hide_matching_columns: bool,
     float_precision: float,
@@ -140,13 +204,23 @@ def tables(
         collation=collation,
         ignore_casing=ignore_casing,
         infer_primary_keys=infer_primary_keys,
+        cache=ResultCache(cache_dir) if cache_dir is not None else None,
+        timeout=timeout,
+    )
+    report = _run_cancellable(
+        lambda: comparison.summary_report(strategy=strategy, top_changes=top_changes)
     )
-    report = comparison.summary_report()
 
     # Write the report
     obj.writer.write(
         {"comparison": report}, hide_matching_columns=hide_matching_columns
     )
+    if export_mismatches is not None:
+        _run_cancellable(
+            lambda: _export_mismatches(comparison, export_mismatches, export_format)
+        )
+    if profile:
+        _echo_profile(comparison.query_log)
 
 
 @main.command()
@@ -223,6 +297,36 @@ def tables(
     default=None,
     help="A configuration file to read additional options for comparison.",
 )
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="A directory for caching comparison results and reflected table definitions "
+    "across runs. Results are only cached for tables whose contents can be fingerprinted.",
+)
+@click.option(
+    "--profile/--no-profile",
+    default=False,
+    show_default=True,
+    help="Whether to print the time spent on the queries for each computed statistic "
+    "after the report.",
+)
+@click.option(
+    "--timeout",
+    type=float,
+    default=None,
+    help="The maximum number of seconds that a single query may run. Report sections whose "
+    "queries time out are marked as skipped.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="The number of tables to compare concurrently. "
+    "Only applicable when --compare-tables is set.",
+)
 @click.pass_obj
 def schemas(
     obj: CliConfig,
@@ -239,6 +343,10 @@ def schemas(
     infer_primary_keys: bool,
     sort_output_by: Literal["name", "creation_timestamp"],
     config: Path | None,
+    cache_dir: Path | None,
+    profile: bool,
+    timeout: float | None,
+    jobs: int,
 ):
     """Compare two schemas/databases in a SQL database."""
     # Find tables/column that are ignored
@@ -246,8 +354,11 @@ def schemas(
     if config is not None:
         cfg = read_config(config)
 
-    # Generate comparison and report for the schema
-    engine = sa.create_engine(database_connection_string)
+    # Generate comparison and report for the schema. Every concurrent table comparison
+    # requires its own connection.
+    engine = sa.create_engine(
+        database_connection_string, **({"pool_size": jobs} if jobs > 1 else {})
+    )
     comparison = sc.compare_schemas(
         engine,
         left_schema,
@@ -256,18 +367,23 @@ def schemas(
         float_precision=float_precision,
         collation=collation,
         ignore_casing=ignore_casing,
+        cache=ResultCache(cache_dir) if cache_dir is not None else None,
+        timeout=timeout,
     )
     report = comparison.summary_report()
 
     # Write the results
     if compare_tables:
-        reports = comparison.table_reports(
-            ignore_tables=cfg.ignore_tables if cfg else [],
-            ignore_table_columns=cfg.ignore_table_columns if cfg else {},
-            skip_equal=skip_equal,
-            infer_primary_keys=infer_primary_keys,
-            sort_by=sort_output_by,
-            verbose=True,
+        reports = _run_cancellable(
+            lambda: comparison.table_reports(
+                ignore_tables=cfg.ignore_tables if cfg else [],
+                ignore_table_columns=cfg.ignore_table_columns if cfg else {},
+                skip_equal=skip_equal,
+                infer_primary_keys=infer_primary_keys,
+                sort_by=sort_output_by,
+                verbose=True,
+                max_workers=jobs,
+            )
         )
         obj.writer.write(
             {
@@ -280,3 +396,59 @@ def schemas(
         obj.writer.write(
             {"comparison": report}, hide_matching_columns=hide_matching_columns
         )
+    if profile:
+        _echo_profile(comparison.query_log)
+
+
+def _export_mismatches(
+    comparison: TableComparison,
+    directory: Path,
+    format: Literal["csv", "parquet"],
+) -> None:
+    try:
+        row_matches = comparison.row_matches
+    except ValueError as exc:
+        raise click.ClickException(f"Mismatched rows cannot be exported: {exc}")
+    directory.mkdir(parents=True, exist_ok=True)
+    kinds: list[RowMatchQuery] = ["unjoined_left", "unjoined_right", "joined_unequal"]
+    for kind in kinds:
+        path = directory / f"{kind}.{format}"
+        n_rows = row_matches.export(
+            kind, path, comparison.connection or comparison.engine, format=format
+        )
+        logging.info("Exported %d rows to '%s'.", n_rows, path)
+
+
+def _echo_profile(query_log: QueryLog) -> None:
+    click.echo(
+        f"\nQuery profile: {len(query_log.entries)} statements, "
+        f"{query_log.duration:.3f}s in total"
+    )
+    for trigger, (count, duration) in query_log.timings().items():
+        click.echo(f"{duration:>10.3f}s {count:>5} {trigger}")
+
+
+def _run_cancellable(fn: Callable[[], T]) -> T:
+    # Run the function in a separate thread such that the main thread can react to Ctrl-C
+    # while a query is running and cancel it on the database server
+    outcome: dict[str, T | BaseException] = {}
+
+    def run() -> None:
+        try:
+            outcome["result"] = fn()
+        except BaseException as exc:
+            outcome["error"] = exc
+
+    thread = threading.Thread(
+        target=contextvars.copy_context().run, args=(run,), daemon=True
+    )
+    thread.start()
+    try:
+        while thread.is_alive():
+            thread.join(timeout=0.1)
+    except KeyboardInterrupt:
+        cancel_statements()
+        raise click.Abort()
+    if "error" in outcome:
+        raise cast(BaseException, outcome["error"])
+    return cast(T, outcome["result"])
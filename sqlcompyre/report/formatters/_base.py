@@ -4,7 +4,14 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
-from sqlcompyre.results import ColumnMatches, Counts, Names, RowMatches
+from sqlcompyre.results import (
+    ColumnMatches,
+    Counts,
+    Names,
+    RowMatches,
+    Skipped,
+    TopChanges,
+)
 
 from ..schema import Metadata, Section
 
@@ -40,6 +47,10 @@ class Formatter(ABC):
             return self._format_table_row_matches(content)
         if isinstance(content, ColumnMatches):
             return self._format_table_column_matches(content, hide_matching_columns)
+        if isinstance(content, TopChanges):
+            return self._format_table_top_changes(content, hide_matching_columns)
+        if isinstance(content, Skipped):
+            return self._format_skipped(content)
         raise NotImplementedError
 
     @abstractmethod
@@ -59,3 +70,13 @@ class Formatter(ABC):
         self, column_matches: ColumnMatches, hide_matching_columns: bool
     ) -> str:
         pass
+
+    @abstractmethod
+    def _format_table_top_changes(
+        self, top_changes: TopChanges, hide_matching_columns: bool
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def _format_skipped(self, skipped: Skipped) -> str:
+        pass
@@ -6,7 +6,14 @@ from typing import Any
 
 import tabulate
 
-from sqlcompyre.results import ColumnMatches, Counts, Names, RowMatches
+from sqlcompyre.results import (
+    ColumnMatches,
+    Counts,
+    Names,
+    RowMatches,
+    Skipped,
+    TopChanges,
+)
 
 from ..schema import Metadata, Section
 from ._base import Formatter
@@ -131,6 +138,7 @@ class TerminalFormatter(Formatter):
     def _format_table_column_matches(
         self, column_matches: ColumnMatches, hide_matching_columns: bool = False
     ) -> str:
+        intervals = column_matches.confidence_intervals
         content = [
             [
                 name,
@@ -140,6 +148,7 @@ class TerminalFormatter(Formatter):
                 if math.isnan(match)
                 else f"{math.floor(match * 10000) / 10000:.2%}",
             ]
+            + ([] if intervals is None else [_format_interval(intervals[name])])
             for name, match in sorted(
                 column_matches.fraction_same.items(), key=lambda x: x[0]
             )
@@ -147,6 +156,25 @@ class TerminalFormatter(Formatter):
         ]
         return self._tabulate(content)
 
+    def _format_table_top_changes(
+        self, top_changes: TopChanges, hide_matching_columns: bool = False
+    ) -> str:
+        content = []
+        for name, changes in sorted(top_changes.changes.items(), key=lambda x: x[0]):
+            if len(changes) == 0:
+                if not hide_matching_columns:
+                    content.append([name, "n/a", ""])
+                continue
+            # Only show the column name for the first change
+            content.extend(
+                [name if i == 0 else "", change, f"{count:,}"]
+                for i, (change, count) in enumerate(changes.items())
+            )
+        return self._tabulate(content)
+
+    def _format_skipped(self, skipped: Skipped) -> str:
+        return f" Skipped: {skipped.reason}"
+
     # ---------------------------------------------------------------------------------------------
 
     def _tabulate(self, content: Any) -> str:
@@ -170,6 +198,13 @@ def _safe_div(lhs: int, rhs: int) -> float:
         return float("nan")
 
 
+def _format_interval(interval: tuple[float, float]) -> str:
+    lower, upper = interval
+    if math.isnan(lower) or math.isnan(upper):
+        return "n/a"
+    return f"[{math.floor(lower * 10000) / 10000:.2%}, {math.ceil(upper * 10000) / 10000:.2%}]"
+
+
 def _colored(text: str, context: str, enable: bool) -> str:
     if not enable:
         return text
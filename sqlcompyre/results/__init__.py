@@ -5,10 +5,14 @@ from .column_matches import ColumnMatches
 from .counts import Counts
 from .names import Names
 from .row_matches import RowMatches
+from .skipped import Skipped
+from .top_changes import TopChanges
 
 __all__ = [
     "ColumnMatches",
     "Counts",
     "Names",
     "RowMatches",
+    "Skipped",
+    "TopChanges",
 ]
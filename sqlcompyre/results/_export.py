@@ -0,0 +1,203 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import contextlib
+import csv
+import itertools
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Literal, cast
+
+import sqlalchemy as sa
+
+from sqlcompyre.analysis.dialects import DialectProtocol
+
+ExportFormat = Literal["parquet", "csv"]
+
+
+def export_query(
+    query: sa.Select,
+    path: str | Path,
+    engine: sa.Engine | sa.Connection,
+    format: ExportFormat,
+    batch_size: int,
+) -> int:
+    """Write the results of a query to a file without loading them into memory at once.
+
+    Args:
+        query: The query whose results to write.
+        path: The path of the file to write.
+        engine: The engine or connection to run the query with.
+        format: The format of the file.
+        batch_size: The number of rows to fetch from the database and write at once.
+
+    Returns:
+        The number of written rows.
+    """
+    match format:
+        case "csv":
+            return _write_csv(query, path, engine, batch_size)
+        case "parquet":
+            return _write_parquet(query, path, engine, batch_size)
+        case _:
+            raise ValueError(f"Unknown export format '{format}'.")
+
+
+def fetch_arrow(
+    query: sa.Select, engine: sa.Engine | sa.Connection, batch_size: int
+) -> Any:
+    """Fetch the results of a query as Arrow record batches.
+
+    Args:
+        query: The query whose results to fetch.
+        engine: The engine or connection to run the query with.
+        batch_size: The (maximum) number of rows per record batch.
+
+    Returns:
+        A ``pyarrow.RecordBatchReader`` providing the results. The query is run until the
+        reader is exhausted.
+    """
+    pa = _import_pyarrow()
+    batches = _record_batches(pa, query, engine, batch_size)
+    # The first item is the schema of the record batches
+    schema = next(batches)
+    return pa.RecordBatchReader.from_batches(schema, batches)
+
+
+# ----------------------------------------------------------------------------------------------- #
+
+
+@contextlib.contextmanager
+def _execute(
+    query: sa.Select,
+    engine: sa.Engine | sa.Connection,
+    batch_size: int,
+    stream: bool = True,
+) -> Iterator[sa.CursorResult]:
+    if batch_size < 1:
+        raise ValueError("The batch size must be at least 1.")
+    with contextlib.ExitStack() as stack:
+        conn = (
+            engine
+            if isinstance(engine, sa.Connection)
+            else stack.enter_context(engine.connect())
+        )
+        # Use a server-side cursor (if supported by the driver) to not fetch all rows at once
+        yield conn.execute(
+            query,
+            execution_options=(
+                {"stream_results": True, "yield_per": batch_size} if stream else {}
+            ),
+        )
+
+
+def _record_batches(
+    pa: Any, query: sa.Select, engine: sa.Engine | sa.Connection, batch_size: int
+) -> Iterator[Any]:
+    dialect = cast(DialectProtocol, engine.dialect)
+    if dialect.supports_arrow_fetch:
+        # Prefer the native Arrow support of the driver. Streaming must not be requested as
+        # SQLAlchemy would otherwise already fetch the first row from the cursor.
+        with _execute(query, engine, batch_size, stream=False) as result:
+            reader = dialect.fetch_arrow(result.cursor, batch_size)
+            yield reader.schema
+            yield from reader
+        return
+
+    # Otherwise, convert the rows. The schema is derived from the column types of the query
+    # where possible such that a batch consisting entirely of NULLs does not determine the type
+    # of a column. Columns whose type can neither be derived from the query nor from the first
+    # batch are converted to strings.
+    with _execute(query, engine, batch_size) as result:
+        partitions = result.partitions()
+        first = next(partitions, None)
+        columns = (
+            [list(c) for c in zip(*first)]
+            if first is not None
+            else [[] for _ in result.keys()]
+        )
+        types = []
+        as_string = set()
+        for i, (column, values) in enumerate(zip(query.selected_columns, columns)):
+            arrow_type = _arrow_type(pa, column.type) or pa.array(values).type
+            if pa.types.is_null(arrow_type):
+                arrow_type = pa.string()
+                as_string.add(i)
+            types.append(arrow_type)
+        schema = pa.schema(list(zip(result.keys(), types)))
+        yield schema
+        for batch in itertools.chain([first] if first is not None else [], partitions):
+            yield pa.record_batch(
+                [
+                    (
+                        [None if v is None else str(v) for v in values]
+                        if i in as_string
+                        else list(values)
+                    )
+                    for i, values in enumerate(zip(*batch))
+                ],
+                schema=schema,
+            )
+
+
+def _write_csv(
+    query: sa.Select,
+    path: str | Path,
+    engine: sa.Engine | sa.Connection,
+    batch_size: int,
+) -> int:
+    n_rows = 0
+    with (
+        _execute(query, engine, batch_size) as result,
+        open(path, "w", newline="") as f,
+    ):
+        writer = csv.writer(f)
+        writer.writerow(result.keys())
+        for batch in result.partitions():
+            writer.writerows(batch)
+            n_rows += len(batch)
+    return n_rows
+
+
+def _write_parquet(
+    query: sa.Select,
+    path: str | Path,
+    engine: sa.Engine | sa.Connection,
+    batch_size: int,
+) -> int:
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    n_rows = 0
+    reader = fetch_arrow(query, engine, batch_size)
+    with pq.ParquetWriter(path, reader.schema) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            n_rows += batch.num_rows
+    return n_rows
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow as pa
+    except ImportError as exc:  # pragma: no cover
+        raise ImportError(
+            "Fetching rows as Arrow record batches requires `pyarrow` to be installed."
+        ) from exc
+    return pa
+
+
+def _arrow_type(pa: Any, type_: sa.types.TypeEngine) -> Any | None:
+    if isinstance(type_, sa.Boolean):
+        return pa.bool_()
+    if isinstance(type_, sa.Integer):
+        return pa.int64()
+    if isinstance(type_, sa.Float):
+        return pa.float64()
+    if isinstance(type_, sa.String):
+        return pa.string()
+    if isinstance(type_, sa.DateTime):
+        return pa.timestamp("us", tz="UTC" if type_.timezone else None)
+    if isinstance(type_, sa.Date):
+        return pa.date32()
+    return None
@@ -2,9 +2,12 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from dataclasses import dataclass
+from typing import Any
 
 import sqlalchemy as sa
 
+from ._export import fetch_arrow
+
 
 @dataclass
 class ColumnMatches:
@@ -16,3 +19,29 @@ class ColumnMatches:
     #: Dictionary mapping the name of the left-table column to a query of all joined rows for
     #: which the column does not have the same value in both tables.
     mismatch_selects: dict[str, sa.Select]
+    #: Dictionary mapping the name of the left-table column to the lower and upper bound of the
+    #: 95% confidence interval of the fraction of matching values. Only available if the
+    #: column matches were computed on a sample of the rows.
+    confidence_intervals: dict[str, tuple[float, float]] | None = None
+
+    def fetch_arrow(
+        self,
+        column: str,
+        engine: sa.Engine | sa.Connection,
+        batch_size: int = 100_000,
+    ) -> Any:
+        """Fetch the joined rows with mismatching values in a column as Arrow record batches.
+        Where supported by the database driver (e.g. for DuckDB), the rows are never
+        converted to Python objects. Requires ``pyarrow``.
+
+        Args:
+            column: The name of the left-table column whose mismatches to fetch.
+            engine: The engine or connection to run the query with.
+            batch_size: The (maximum) number of rows per record batch.
+
+        Returns:
+            A ``pyarrow.RecordBatchReader`` providing the rows.
+        """
+        if column not in self.mismatch_selects:
+            raise ValueError(f"No mismatches are available for column '{column}'.")
+        return fetch_arrow(self.mismatch_selects[column], engine, batch_size)
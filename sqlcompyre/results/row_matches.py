@@ -2,9 +2,18 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal, get_args
 
 import sqlalchemy as sa
 
+from ._export import ExportFormat, export_query, fetch_arrow
+
+#: The names of the queries provided by :class:`RowMatches`.
+RowMatchQuery = Literal[
+    "unjoined_left", "unjoined_right", "joined_equal", "joined_unequal", "joined_total"
+]
+
 
 @dataclass
 class RowMatches:
@@ -30,3 +39,57 @@ class RowMatches:
     joined_unequal: sa.Select
     #: Query for obtaining all rows that were joined, regardless of equality.
     joined_total: sa.Select
+    #: The fraction of join keys that the row matches were computed on if they were computed on
+    #: a sample of the rows.
+    sample_fraction: float | None = None
+
+    def export(
+        self,
+        kind: RowMatchQuery,
+        path: str | Path,
+        engine: sa.Engine | sa.Connection,
+        format: ExportFormat = "csv",
+        batch_size: int = 10_000,
+    ) -> int:
+        """Write the rows of one of the queries to a file. Rows are streamed from the
+        database in batches such that memory usage does not depend on the number of rows.
+
+        Args:
+            kind: The name of the query whose rows to export.
+            path: The path of the file to write.
+            engine: The engine or connection to run the query with. Queries of comparisons
+                that hold on to a connection (e.g. materialized comparisons) must be run via
+                :attr:`~sqlcompyre.analysis.TableComparison.connection`.
+            format: The format of the file. Writing Parquet files requires ``pyarrow``.
+            batch_size: The number of rows to fetch from the database and write at once.
+
+        Returns:
+            The number of exported rows.
+        """
+        return export_query(self._query(kind), path, engine, format, batch_size)
+
+    def fetch_arrow(
+        self,
+        kind: RowMatchQuery,
+        engine: sa.Engine | sa.Connection,
+        batch_size: int = 100_000,
+    ) -> Any:
+        """Fetch the rows of one of the queries as Arrow record batches. Where supported by
+        the database driver (e.g. for DuckDB), the rows are never converted to Python
+        objects. Requires ``pyarrow``.
+
+        Args:
+            kind: The name of the query whose rows to fetch.
+            engine: The engine or connection to run the query with.
+            batch_size: The (maximum) number of rows per record batch.
+
+        Returns:
+            A ``pyarrow.RecordBatchReader`` providing the rows. Use ``read_all()`` to obtain
+            a ``pyarrow.Table``, e.g. to be converted with ``polars.from_arrow``.
+        """
+        return fetch_arrow(self._query(kind), engine, batch_size)
+
+    def _query(self, kind: RowMatchQuery) -> sa.Select:
+        if kind not in get_args(RowMatchQuery):
+            raise ValueError(f"Unknown query '{kind}'.")
+        return getattr(self, kind)
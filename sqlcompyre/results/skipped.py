@@ -0,0 +1,13 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Skipped:
+    """Placeholder for a statistic that could not be computed, e.g. because its queries
+    exceeded the timeout."""
+
+    #: A human-readable description of why the statistic was skipped.
+    reason: str
@@ -0,0 +1,14 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+from dataclasses import dataclass
+
+
+@dataclass
+class TopChanges:
+    """Investigate the most common value changes between database tables."""
+
+    #: Dictionary mapping the name of the left-table column to the most common changes of the
+    #: column's values. Each change (e.g. ``"1 -> 2"``) is mapped to the number of joined rows
+    #: with this change, ordered from the most to the least common change.
+    changes: dict[str, dict[str, int]]
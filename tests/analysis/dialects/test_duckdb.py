@@ -0,0 +1,32 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+
+from tests._shared import TableFactory, dialect_from_env
+
+pytestmark = pytest.mark.skipif(
+    dialect_from_env().name != "duckdb",
+    reason="Tests only run for DuckDB.",
+)
+
+
+def table_columns() -> list[sa.Column]:
+    return [sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False)]
+
+
+def test_get_table_size_estimates(engine: sa.Engine, table_factory: TableFactory):
+    data: list[dict[str, Any]] = [dict(id=i) for i in range(100)]
+    small = table_factory.create("size_estimate_small", table_columns(), data[:10])
+    large = table_factory.create("size_estimate_large", table_columns(), data)
+    missing = sa.Table("size_estimate_missing", sa.MetaData(), *table_columns())
+
+    sizes = engine.dialect.get_table_size_estimates(  # type: ignore
+        engine, [small, large, missing]
+    )
+    assert sizes[0] is not None and sizes[1] is not None
+    assert sizes[0] < sizes[1]
+    assert sizes[2] is None
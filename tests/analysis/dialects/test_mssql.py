@@ -7,7 +7,9 @@ from datetime import datetime
 
 import pytest
 import sqlalchemy as sa
+from sqlalchemy.dialects import mssql
 
+import sqlcompyre as sc
 from sqlcompyre.analysis.dialects import MssqlDialect
 from tests._shared import SchemaFactory, TableFactory, dialect_from_env
 
@@ -82,3 +84,40 @@ def test_get_table_creation_timestamps_different_multipart(
     dialect = MssqlDialect()
     with pytest.raises(ValueError, match="must have the same number of schema parts"):
         dialect.get_table_creation_timestamps(engine, tables=[table2, table1])
+
+
+def test_get_table_size_estimates(
+    engine: sa.Engine,
+    schema_and_tables_and_views: tuple[str, sa.Table, sa.Table, sa.Table],
+):
+    _, table1, table2, view1 = schema_and_tables_and_views
+    sizes = engine.dialect.get_table_size_estimates(  # type: ignore
+        engine,
+        tables=[table2, table1, view1],
+    )
+    assert isinstance(sizes[0], int)
+    assert isinstance(sizes[1], int)
+    assert sizes[2] is None
+
+
+@pytest.mark.parametrize("type_", [sa.UnicodeText(), mssql.NTEXT(), mssql.XML()])
+def test_row_hash_lob_columns(
+    engine: sa.Engine, table_factory: TableFactory, type_: sa.types.TypeEngine
+):
+    # Values of text, ntext, image and xml columns must be hashed as well
+    def create(name: str, documents: list[str]) -> sa.Table:
+        return table_factory.create(
+            name,
+            [
+                sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+                sa.Column("document", type_),
+            ],
+            [dict(id=i, document=d) for i, d in enumerate(documents)],
+        )
+
+    suffix = type(type_).__name__.lower()
+    left = create(f"row_hash_left_{suffix}", ["<a>1</a>", "<a>2</a>", "<a>3</a>"])
+    right = create(f"row_hash_right_{suffix}", ["<a>1</a>", "<a>4</a>", "<a>3</a>"])
+    row_matches = sc.compare_tables(engine, left, right).checksum_diff()
+    assert row_matches.n_joined_unequal == 1
+    assert row_matches.n_joined_equal == 2
@@ -0,0 +1,110 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+import sqlalchemy as sa
+
+from tests._shared import TableFactory
+
+
+def table_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("version", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("name", sa.String(50), nullable=False),
+        sa.Column("score", sa.Float()),
+        sa.Column("created", sa.DateTime()),
+    ]
+
+
+@pytest.fixture(scope="module")
+def table_reflection(table_factory: TableFactory) -> sa.Table:
+    return table_factory.create("reflection", table_columns(), [])
+
+
+def test_reflect_tables(engine: sa.Engine, table_reflection: sa.Table):
+    meta = sa.MetaData()
+    try:
+        tables = engine.dialect.reflect_tables(  # type: ignore
+            engine, table_reflection.schema, meta, views=False
+        )
+    except NotImplementedError:
+        pytest.skip("Dialect does not support bulk reflection.")
+
+    reflected = next(t for t in tables if t.name == table_reflection.name)
+    assert [c.name for c in reflected.primary_key] == ["id", "version"]
+    assert [(c.name, c.nullable) for c in reflected.c if not c.primary_key] == [
+        ("name", False),
+        ("score", True),
+        ("created", True),
+    ]
+    assert isinstance(reflected.c["id"].type, sa.Integer)
+    assert isinstance(reflected.c["name"].type, sa.String)
+    assert isinstance(reflected.c["score"].type, sa.Float)
+    assert isinstance(reflected.c["created"].type, sa.DateTime)
+
+    # Tables that are already present in the metadata are not redefined
+    again = engine.dialect.reflect_tables(  # type: ignore
+        engine, table_reflection.schema, meta, views=False
+    )
+    assert next(t for t in again if t.name == table_reflection.name) is reflected
+
+
+def test_reflect_tables_views(
+    engine: sa.Engine, table_factory: TableFactory, table_reflection: sa.Table
+):
+    view = table_factory.create_view("reflection_view", sa.select(table_reflection))
+    try:
+        with_views = engine.dialect.reflect_tables(  # type: ignore
+            engine, view.schema, sa.MetaData(), views=True
+        )
+    except NotImplementedError:
+        pytest.skip("Dialect does not support bulk reflection.")
+    without_views = engine.dialect.reflect_tables(  # type: ignore
+        engine, view.schema, sa.MetaData(), views=False
+    )
+    assert view.name in {t.name for t in with_views}
+    assert view.name not in {t.name for t in without_views}
+
+
+def test_get_schema_version(
+    engine: sa.Engine, table_factory: TableFactory, table_reflection: sa.Table
+):
+    table = table_factory.create("reflection_versioned", table_columns(), [])
+    try:
+        version = engine.dialect.get_schema_version(  # type: ignore
+            engine, table_reflection.schema
+        )
+    except NotImplementedError:
+        pytest.skip("Dialect does not support versioning schemas.")
+    if version is None:
+        pytest.skip("Schema cannot be versioned.")
+
+    assert (
+        engine.dialect.get_schema_version(engine, table_reflection.schema)  # type: ignore
+        == version
+    )
+    table.drop(engine)
+    assert (
+        engine.dialect.get_schema_version(engine, table_reflection.schema)  # type: ignore
+        != version
+    )
+
+
+def test_reflect_tables_only(
+    engine: sa.Engine, table_factory: TableFactory, table_reflection: sa.Table
+):
+    other = table_factory.create("reflection_other", table_columns(), [])
+    try:
+        tables = engine.dialect.reflect_tables(  # type: ignore
+            engine,
+            table_reflection.schema,
+            sa.MetaData(),
+            views=False,
+            only=[table_reflection.name, "reflection_missing"],
+        )
+    except NotImplementedError:
+        pytest.skip("Dialect does not support bulk reflection.")
+    assert [t.name for t in tables] == [table_reflection.name]
+    assert [c.name for c in tables[0].primary_key] == ["id", "version"]
+    assert other.name not in {t.name for t in tables}
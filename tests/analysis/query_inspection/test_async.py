@@ -0,0 +1,29 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+import sqlcompyre as sc
+
+
+def test_async_row_count(async_engine: AsyncEngine, table_characters: sa.Table):
+    async def inspect() -> None:
+        inspection = await sc.inspect_async(async_engine, table_characters)
+        assert await inspection.row_count() == 8
+        assert await inspection.distinct_row_count() == 7
+        assert await inspection.distinct_row_count("last_name") == 3
+
+    asyncio.run(inspect())
+
+
+def test_async_row_count_table_string(
+    async_engine: AsyncEngine, table_characters: sa.Table
+):
+    async def inspect() -> None:
+        inspection = await sc.inspect_async(async_engine, str(table_characters))
+        assert await inspection.row_count() == 8
+
+    asyncio.run(inspect())
@@ -0,0 +1,35 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+import sqlcompyre as sc
+from tests._shared import TableFactory
+
+
+@pytest.fixture(scope="module")
+def table_async(table_factory: TableFactory) -> sa.Table:
+    return table_factory.create(
+        "schema_async",
+        [sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False)],
+        [dict(id=1), dict(id=2)],
+    )
+
+
+def test_async_compare_matched_table(async_engine: AsyncEngine, table_async: sa.Table):
+    # Asynchronous access is only tested for SQLite whose default schema is "main"
+    async def compare() -> None:
+        comparison = await sc.compare_schemas_async(async_engine, "main", "main")
+        assert table_async.name in comparison.table_names.in_common
+        report = await comparison.summary_report()
+        assert "Table Names" in str(report)
+        table_comparison = comparison.compare_matched_table(table_async.name)
+        row_counts = await table_comparison.row_counts()
+        assert row_counts.left == row_counts.right == 2
+        assert await table_comparison.join_columns() == ["id"]
+
+    asyncio.run(compare())
@@ -1,12 +1,17 @@
 # Copyright (c) QuantCo 2024-2025
 # SPDX-License-Identifier: BSD-3-Clause
 
-from typing import Literal
+from typing import Any, Literal
 
 import pytest
 import sqlalchemy as sa
 
 import sqlcompyre as sc
+from sqlcompyre.analysis import (
+    SchemaComparison,
+    StatementTimeoutError,
+    TableComparison,
+)
 from tests._shared import dialect_from_env
 
 pytestmark = pytest.mark.skipif(
@@ -42,6 +47,42 @@ def test_table_reports_sort_by(
     assert [key for key in reports] == tables
 
 
+def test_table_reports_concurrent(engine: sa.Engine, schema_1: str, schema_2: str):
+    comparison = sc.compare_schemas(engine, schema_1, schema_2)
+    expected = comparison.table_reports(skip_equal=True)
+    reports = comparison.table_reports(skip_equal=True, max_workers=4)
+    assert list(reports.keys()) == list(expected.keys())
+    assert [str(r) for r in reports.values()] == [str(r) for r in expected.values()]
+
+
+def test_table_reports_largest_first(
+    monkeypatch: pytest.MonkeyPatch, engine: sa.Engine, schema_1: str, schema_2: str
+):
+    started: list[str] = []
+    table_report = SchemaComparison._table_report
+
+    def record(self: SchemaComparison, table: str, **kwargs: Any) -> Any:
+        started.append(table)
+        return table_report(self, table, **kwargs)
+
+    monkeypatch.setattr(
+        SchemaComparison,
+        "_estimate_sizes",
+        lambda self, tables: {"table1": 1, "table4": 100},
+    )
+    monkeypatch.setattr(SchemaComparison, "_table_report", record)
+    reports = sc.compare_schemas(engine, schema_1, schema_2).table_reports()
+    assert started == ["table4", "table1"]
+    assert list(reports.keys()) == ["table1", "table4"]
+
+
+def test_table_reports_invalid_max_workers(
+    engine: sa.Engine, schema_1: str, schema_2: str
+):
+    with pytest.raises(ValueError, match="at least 1"):
+        sc.compare_schemas(engine, schema_1, schema_2).table_reports(max_workers=0)
+
+
 def test_table_reports_skip_equal(engine: sa.Engine, schema_1: str, schema_2: str):
     reports = sc.compare_schemas(engine, schema_1, schema_2).table_reports(
         skip_equal=True
@@ -49,6 +90,19 @@ def test_table_reports_skip_equal(engine: sa.Engine, schema_1: str, schema_2: st
     assert len(reports) == 1
 
 
+def test_table_reports_skip_equal_timeout(
+    monkeypatch: pytest.MonkeyPatch, engine: sa.Engine, schema_1: str, schema_2: str
+):
+    def equal(self: TableComparison) -> bool:
+        raise StatementTimeoutError("Statement exceeded its timeout of 1s.")
+
+    monkeypatch.setattr(TableComparison, "equal", property(equal))
+    reports = sc.compare_schemas(engine, schema_1, schema_2).table_reports(
+        skip_equal=True
+    )
+    assert set(reports.keys()) == {"table1", "table4"}
+
+
 def test_table_reports_no_join_columns(engine: sa.Engine, schema_duplicate_table: str):
     reports = sc.compare_schemas(
         engine, schema_duplicate_table, schema_duplicate_table
@@ -0,0 +1,120 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""This file contains tests that verify that asynchronous comparisons yield the same results
+as synchronous ones."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+import sqlcompyre as sc
+from sqlcompyre import QueryLog, ResultCache
+
+
+@pytest.mark.parametrize(
+    "left,right",
+    [
+        ("table_students", "table_students"),
+        ("table_students", "table_students_small"),
+        ("table_students_modified_1", "table_students_modified_2"),
+        ("table_students", "table_students_modified_3"),
+    ],
+)
+def test_async_same_as_sync(
+    engine: sa.Engine,
+    async_engine: AsyncEngine,
+    request: pytest.FixtureRequest,
+    left: str,
+    right: str,
+):
+    left_table = request.getfixturevalue(left)
+    right_table = request.getfixturevalue(right)
+    expected = sc.compare_tables(engine, left_table, right_table)
+
+    async def compare() -> None:
+        comparison = await sc.compare_tables_async(
+            async_engine, left_table, right_table
+        )
+        row_counts, row_matches, column_matches = await asyncio.gather(
+            comparison.row_counts(),
+            comparison.row_matches(),
+            comparison.column_matches(),
+        )
+        assert row_counts == expected.row_counts
+        for field in [
+            "n_unjoined_left",
+            "n_unjoined_right",
+            "n_joined_equal",
+            "n_joined_unequal",
+            "n_joined_total",
+        ]:
+            assert getattr(row_matches, field) == getattr(expected.row_matches, field)
+        assert column_matches.fraction_same == pytest.approx(
+            expected.column_matches.fraction_same
+        )
+        assert await comparison.join_columns() == expected.join_columns
+
+    asyncio.run(compare())
+
+
+def test_async_table_names(
+    async_engine: AsyncEngine, table_students: sa.Table, table_students_small: sa.Table
+):
+    async def compare() -> None:
+        comparison = await sc.compare_tables_async(
+            async_engine, table_students.name, table_students_small.name
+        )
+        assert (await comparison.row_counts()).diff == 1
+
+    asyncio.run(compare())
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"fused": True},
+        {"sample_fraction": 1.0},
+        {"cache": True},
+        {"materialize": True},
+        {"isolation_level": "SERIALIZABLE"},
+        {"query_log": True},
+        {"timeout": 60},
+    ],
+)
+def test_async_options(
+    engine: sa.Engine,
+    async_engine: AsyncEngine,
+    table_students: sa.Table,
+    table_students_modified_3: sa.Table,
+    tmp_path: Path,
+    options: dict[str, Any],
+):
+    if "cache" in options:
+        options = {"cache": ResultCache(tmp_path)}
+    if "query_log" in options:
+        options = {"query_log": QueryLog()}
+    expected = sc.compare_tables(engine, table_students, table_students_modified_3)
+
+    async def compare() -> None:
+        async with await sc.compare_tables_async(
+            async_engine, table_students, table_students_modified_3, **options
+        ) as comparison:
+            row_counts, row_matches, column_matches = await asyncio.gather(
+                comparison.row_counts(),
+                comparison.row_matches(),
+                comparison.column_matches(),
+            )
+        assert row_counts == expected.row_counts
+        assert row_matches.n_joined_unequal == expected.row_matches.n_joined_unequal
+        assert column_matches.fraction_same == pytest.approx(
+            expected.column_matches.fraction_same
+        )
+
+    asyncio.run(compare())
+    if "query_log" in options:
+        assert len(options["query_log"].entries) > 0
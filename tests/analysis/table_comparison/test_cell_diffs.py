@@ -0,0 +1,90 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""This file contains tests that verify the long-format cell diffs."""
+
+import contextlib
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+
+
+@pytest.mark.parametrize("materialize", [False, True])
+def test_cell_diffs_match_mismatch_selects(
+    engine: sa.Engine,
+    table_students: sa.Table,
+    table_students_modified_3: sa.Table,
+    materialize: bool,
+):
+    with sc.compare_tables(
+        engine, table_students, table_students_modified_3, materialize=materialize
+    ) as comp:
+        query = comp.cell_diffs()
+        mismatch_selects = comp.column_matches.mismatch_selects
+        # A materialized diff is only visible on the comparison's connection
+        with contextlib.ExitStack() as stack:
+            conn = comp.connection or stack.enter_context(engine.connect())
+            rows = conn.execute(query).all()
+            expected = {
+                column: len(conn.execute(query).all())
+                for column, query in mismatch_selects.items()
+            }
+
+    assert list(rows[0]._fields) == [
+        *comp.join_columns,
+        "column_name",
+        "left_value",
+        "right_value",
+    ]
+    assert {
+        column: sum(row.column_name == column for row in rows) for column in expected
+    } == expected
+
+
+def test_cell_diffs_same(engine: sa.Engine, table_students: sa.Table):
+    comp = sc.compare_tables(engine, table_students, table_students)
+    with engine.connect() as conn:
+        assert conn.execute(comp.cell_diffs()).all() == []
+
+
+def test_cell_diffs_values(
+    engine: sa.Engine,
+    table_students_modified_1: sa.Table,
+    table_students_modified_2: sa.Table,
+):
+    comp = sc.compare_tables(
+        engine, table_students_modified_1, table_students_modified_2
+    )
+    with engine.connect() as conn:
+        rows = conn.execute(comp.cell_diffs()).all()
+    assert [(row.column_name, row.left_value, row.right_value) for row in rows] == [
+        ("age", "18", "17")
+    ]
+
+
+def test_cell_diffs_keyset_pagination(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    comp = sc.compare_tables(engine, table_students, table_students_modified_3)
+    with engine.connect() as conn:
+        expected = conn.execute(comp.cell_diffs()).all()
+        pages: list[sa.Row] = []
+        after = None
+        while True:
+            page = conn.execute(comp.cell_diffs(after=after, limit=2)).all()
+            if not page:
+                break
+            assert len(page) <= 2
+            pages.extend(page)
+            after = tuple(page[-1])[: len(comp.join_columns) + 1]
+    assert pages == expected
+
+
+def test_cell_diffs_invalid_after(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    comp = sc.compare_tables(engine, table_students, table_students_modified_3)
+    with pytest.raises(ValueError, match="`after`"):
+        comp.cell_diffs(after=(1, "unknown"))
@@ -0,0 +1,142 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""This file contains tests that verify row matches computed via bucketed checksums."""
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+from tests._shared import TableFactory
+
+ROW_MATCH_FIELDS = [
+    "n_unjoined_left",
+    "n_unjoined_right",
+    "n_joined_equal",
+    "n_joined_unequal",
+    "n_joined_total",
+]
+
+
+@pytest.fixture(scope="module")
+def table_numbers(table_factory: TableFactory) -> sa.Table:
+    return table_factory.create(
+        "checksum_numbers",
+        [
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+            sa.Column("value", sa.Integer()),
+        ],
+        [dict(id=i, value=i % 7) for i in range(500)],
+    )
+
+
+@pytest.fixture(scope="module")
+def table_numbers_modified(table_factory: TableFactory) -> sa.Table:
+    return table_factory.create(
+        "checksum_numbers_modified",
+        [
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+            sa.Column("value", sa.Integer()),
+        ],
+        [
+            dict(id=i, value=(i % 7) + (1 if i in (13, 250) else 0))
+            for i in range(3, 505)
+            if i != 42
+        ],
+    )
+
+
+def test_checksum_diff_equal(engine: sa.Engine, table_numbers: sa.Table):
+    comparison = sc.compare_tables(engine, table_numbers, table_numbers)
+    row_matches = comparison.checksum_diff()
+    assert row_matches.n_joined_total == row_matches.n_joined_equal == 500
+    assert row_matches.n_joined_unequal == 0
+    assert row_matches.n_unjoined_left == row_matches.n_unjoined_right == 0
+
+
+@pytest.mark.parametrize(
+    ("n_buckets", "max_bucket_rows"), [(256, 10_000), (4, 1), (2, 3)]
+)
+def test_checksum_diff_same_as_join(
+    engine: sa.Engine,
+    table_numbers: sa.Table,
+    table_numbers_modified: sa.Table,
+    n_buckets: int,
+    max_bucket_rows: int,
+):
+    comparison = sc.compare_tables(engine, table_numbers, table_numbers_modified)
+    checksum_matches = comparison.checksum_diff(n_buckets, max_bucket_rows)
+    assert checksum_matches.n_unjoined_left == 4
+    assert checksum_matches.n_unjoined_right == 5
+    assert checksum_matches.n_joined_unequal == 2
+    for field in ROW_MATCH_FIELDS:
+        assert getattr(checksum_matches, field) == getattr(
+            comparison.row_matches, field
+        )
+
+
+def test_checksum_diff_students(
+    engine: sa.Engine,
+    table_students_modified_1: sa.Table,
+    table_students_modified_2: sa.Table,
+):
+    comparison = sc.compare_tables(
+        engine, table_students_modified_1, table_students_modified_2
+    )
+    row_matches = comparison.checksum_diff(n_buckets=2, max_bucket_rows=1)
+    assert row_matches.n_unjoined_left == row_matches.n_unjoined_right == 1
+    assert row_matches.n_joined_equal == 2
+    assert row_matches.n_joined_unequal == 1
+
+
+def test_checksum_diff_invalid_buckets(engine: sa.Engine, table_students: sa.Table):
+    comparison = sc.compare_tables(engine, table_students, table_students)
+    with pytest.raises(ValueError):
+        comparison.checksum_diff(n_buckets=1)
+
+
+def test_checksum_summary_report(
+    engine: sa.Engine, table_numbers: sa.Table, table_numbers_modified: sa.Table
+):
+    comparison = sc.compare_tables(engine, table_numbers, table_numbers_modified)
+    report = comparison.summary_report(strategy="checksum")
+    assert [section.name for section in report.sections] == [
+        "Column Names",
+        "Row Counts",
+        "Row Matches",
+    ]
+    assert report.sections[1].content == comparison.row_counts
+
+
+@pytest.mark.parametrize(
+    ("left_type", "right_type"),
+    [
+        (sa.Integer(), sa.Float()),
+        (sa.Integer(), sa.BigInteger()),
+        (sa.Numeric(10, 2), sa.Numeric(18, 4)),
+    ],
+)
+def test_checksum_diff_types_differ(
+    engine: sa.Engine,
+    table_factory: TableFactory,
+    left_type: sa.types.TypeEngine,
+    right_type: sa.types.TypeEngine,
+):
+    def create(name: str, type_: sa.types.TypeEngine) -> sa.Table:
+        return table_factory.create(
+            name,
+            [
+                sa.Column("id", type_, primary_key=True, autoincrement=False),
+                sa.Column("value", type_),
+            ],
+            [dict(id=i, value=i % 7) for i in range(1000)],
+        )
+
+    suffix = f"{type(left_type).__name__}_{type(right_type).__name__}".lower()
+    left = create(f"checksum_types_left_{suffix}", left_type)
+    right = create(f"checksum_types_right_{suffix}", right_type)
+    comparison = sc.compare_tables(engine, left, right)
+    row_matches = comparison.checksum_diff()
+    for field in ROW_MATCH_FIELDS:
+        assert getattr(row_matches, field) == getattr(comparison.row_matches, field)
+    assert row_matches.n_joined_equal == 1000
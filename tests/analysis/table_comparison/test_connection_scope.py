@@ -0,0 +1,112 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""This file contains tests that verify that all queries of a comparison are run on the
+connection held by its scope."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+from sqlcompyre.analysis import TableComparison
+
+
+@contextmanager
+def _record_connections(engine: sa.Engine) -> Iterator[set[int]]:
+    connections: set[int] = set()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        connections.add(id(conn.connection.dbapi_connection))
+
+    sa.event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield connections
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", record)
+
+
+def _compute(comparison: TableComparison) -> None:
+    _ = comparison.row_counts
+    _ = comparison.row_matches
+    _ = comparison.column_matches
+    _ = comparison.get_top_changes("name")
+
+
+def test_scope_single_connection(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    with sc.compare_tables(engine, table_students, table_students_modified_3) as comp:
+        assert comp.connection is not None
+        with _record_connections(engine) as connections:
+            _compute(comp)
+        assert connections == {id(comp.connection.connection.dbapi_connection)}
+    assert comp.connection is None
+
+
+def test_scope_not_held_by_default(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    comparison = sc.compare_tables(engine, table_students, table_students_modified_3)
+    _compute(comparison)
+    assert comparison.connection is None
+
+
+@pytest.mark.skip_dialect("duckdb")
+def test_scope_isolation_level(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    comparison = sc.compare_tables(
+        engine,
+        table_students,
+        table_students_modified_3,
+        isolation_level="SERIALIZABLE",
+    )
+    expected = sc.compare_tables(engine, table_students, table_students_modified_3)
+    assert comparison.row_counts == expected.row_counts
+    assert comparison.connection is not None
+    assert comparison.connection.get_isolation_level() == "SERIALIZABLE"
+    assert comparison.connection.in_transaction()
+    assert comparison.column_matches.fraction_same == pytest.approx(
+        expected.column_matches.fraction_same
+    )
+    comparison.close()
+    assert comparison.connection is None
+
+
+def test_scope_isolation_level_partitions(engine: sa.Engine, table_students: sa.Table):
+    with pytest.raises(ValueError):
+        sc.compare_tables(
+            engine,
+            table_students,
+            table_students,
+            partitions=2,
+            isolation_level="SERIALIZABLE",
+        )
+
+
+def test_scope_partitions_use_dedicated_connections(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    expected = sc.compare_tables(engine, table_students, table_students_modified_3)
+    with sc.compare_tables(
+        engine, table_students, table_students_modified_3, partitions=3
+    ) as comparison:
+        assert comparison.row_matches.n_joined_equal == (
+            expected.row_matches.n_joined_equal
+        )
+
+
+def test_scope_query_inspection(engine: sa.Engine, table_students: sa.Table):
+    inspection = sc.inspect_table(engine, table_students)
+    with inspection.scope:
+        assert inspection.scope.connection is not None
+        with _record_connections(engine) as connections:
+            _ = inspection.row_count
+            _ = inspection.column_stats("name").min
+        assert connections == {
+            id(inspection.scope.connection.connection.dbapi_connection)
+        }
+    assert inspection.scope.connection is None
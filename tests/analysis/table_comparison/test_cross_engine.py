@@ -0,0 +1,187 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""This file contains tests that verify comparisons of tables accessed via different
+engines."""
+
+import copy
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+from sqlcompyre.analysis._merge_join import (
+    MergeJoinStatistics,
+    exact_comparator,
+    float_comparator,
+    merge_join,
+)
+from tests._shared import TableFactory
+
+from .conftest import STUDENT_DATA, base_columns
+
+
+@pytest.fixture(scope="module")
+def other_engine() -> sa.Engine:
+    return sa.create_engine("sqlite://")
+
+
+@pytest.fixture(scope="module")
+def other_table_students(other_engine: sa.Engine) -> sa.Table:
+    return TableFactory(other_engine, None).create(
+        "students", base_columns(), STUDENT_DATA
+    )
+
+
+@pytest.fixture(scope="module")
+def other_table_students_modified(other_engine: sa.Engine) -> sa.Table:
+    data = copy.deepcopy(STUDENT_DATA[1:])
+    data[0]["age"] = 21
+    data[1]["gpa"] = data[1]["gpa"] + 0.001  # type: ignore
+    data.append(dict(id=6, name="Harper", age=19, gpa=3.12))
+    return TableFactory(other_engine, None).create(
+        "students_modified", base_columns(), data
+    )
+
+
+def test_cross_engine_equal(
+    engine: sa.Engine,
+    other_engine: sa.Engine,
+    table_students: sa.Table,
+    other_table_students: sa.Table,
+):
+    comparison = sc.compare_tables(
+        None,
+        table_students,
+        other_table_students,
+        left_engine=engine,
+        right_engine=other_engine,
+        join_columns=["id"],
+        # Some database systems store floats with single precision
+        float_precision=1e-4,
+    )
+    assert comparison.equal
+    assert comparison.row_counts.left == comparison.row_counts.right == 5
+    assert all(v == 1 for v in comparison.column_matches.fraction_same.values())
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_cross_engine_different(
+    engine: sa.Engine,
+    other_engine: sa.Engine,
+    table_students: sa.Table,
+    other_table_students_modified: sa.Table,
+    batch_size: int,
+):
+    comparison = sc.compare_tables(
+        engine,
+        table_students,
+        other_table_students_modified,
+        right_engine=other_engine,
+        join_columns=["id"],
+        float_precision=1e-4,
+        batch_size=batch_size,
+    )
+    assert comparison.row_counts.left == 5
+    assert comparison.row_counts.right == 5
+    row_matches = comparison.row_matches
+    assert row_matches.n_unjoined_left == 1
+    assert row_matches.n_unjoined_right == 1
+    assert row_matches.n_joined_total == 4
+    assert row_matches.n_joined_unequal == 2
+    assert comparison.column_matches.fraction_same == {
+        "name": 1.0,
+        "age": 0.75,
+        "gpa": 0.75,
+    }
+    assert not comparison.equal
+
+
+def test_cross_engine_float_precision(
+    engine: sa.Engine,
+    other_engine: sa.Engine,
+    table_students: sa.Table,
+    other_table_students_modified: sa.Table,
+):
+    comparison = sc.compare_tables(
+        engine,
+        table_students,
+        other_table_students_modified,
+        right_engine=other_engine,
+        join_columns=["id"],
+        float_precision=0.01,
+    )
+    assert comparison.column_matches.fraction_same["gpa"] == 1.0
+
+
+def test_cross_engine_table_names(
+    engine: sa.Engine,
+    other_engine: sa.Engine,
+    table_students: sa.Table,
+    other_table_students: sa.Table,
+):
+    comparison = sc.compare_tables(
+        engine,
+        str(table_students),
+        "students",
+        right_engine=other_engine,
+        join_columns=["id"],
+        float_precision=1e-4,
+    )
+    assert comparison.row_matches.n_joined_equal == 5
+
+
+def test_cross_engine_requires_engine(table_students: sa.Table):
+    with pytest.raises(ValueError):
+        sc.compare_tables(None, table_students, table_students)
+
+
+def test_cross_engine_unsupported(
+    engine: sa.Engine,
+    other_engine: sa.Engine,
+    table_students: sa.Table,
+    other_table_students: sa.Table,
+):
+    with pytest.raises(ValueError):
+        sc.compare_tables(
+            engine,
+            table_students,
+            other_table_students,
+            right_engine=other_engine,
+            fused=True,
+        )
+    comparison = sc.compare_tables(
+        engine,
+        table_students,
+        other_table_students,
+        right_engine=other_engine,
+        join_columns=["id"],
+    )
+    with pytest.raises(ValueError):
+        comparison.get_top_changes("age")
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_merge_join_batches(batch_size: int):
+    left = [(1, "a", 1.0), (2, "b", 2.0), (3, "c", None), (5, "e", 5.0)]
+    right = [(1, "a", 1.0), (2, "x", 2.0), (3, "c", 3.0), (4, "d", 4.0), (5, "e", 5.0)]
+    stats = merge_join(
+        iter(left),
+        iter(right),
+        n_keys=1,
+        comparators=[exact_comparator, float_comparator(1e-6)],
+        batch_size=batch_size,
+    )
+    assert stats == MergeJoinStatistics(
+        n_left=4, n_right=5, n_joined=4, n_joined_unequal=2, n_equal=[3, 3]
+    )
+
+    # Without compared columns, all joined rows are equal
+    stats = merge_join(
+        iter([(k,) for k, *_ in left]),
+        iter([(k,) for k, *_ in right]),
+        n_keys=1,
+        comparators=[],
+        batch_size=batch_size,
+    )
+    assert stats.n_joined_unequal == 0
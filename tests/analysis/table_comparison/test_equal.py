@@ -1,13 +1,15 @@
 # Copyright (c) QuantCo 2024-2025
 # SPDX-License-Identifier: BSD-3-Clause
 
+import itertools
 from typing import Any
 
 import pytest
 import sqlalchemy as sa
 
 import sqlcompyre as sc
-from tests._shared import TableFactory
+from sqlcompyre.analysis.dialects.sqlite import _hash
+from tests._shared import TableFactory, dialect_from_env
 
 # -------------------------------------------------------------------------------------------------
 # TABLES
@@ -103,3 +105,93 @@ def test_equal_err_no_join_columns_duplicates(
         engine, table_with_duplicates_1, table_with_duplicates_2
     )
     assert not comparison.equal
+
+
+def test_equal_short_circuit(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    comparison = sc.compare_tables(engine, table_students, table_students_modified_3)
+    assert not comparison.equal
+    # Row matches are not computed and at most one row is fetched per probe
+    assert "row_matches" not in comparison.__dict__
+    probes = [e for e in comparison.query_log.entries if e.trigger == "equal"]
+    assert all(e.rows is not None and e.rows <= 1 for e in probes)
+
+
+def test_equal_uses_row_matches(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    comparison = sc.compare_tables(engine, table_students, table_students_modified_3)
+    _ = comparison.row_matches
+    comparison.query_log.clear()
+    assert not comparison.equal
+    assert len(comparison.query_log.entries) == 0
+
+
+@pytest.mark.skipif(
+    not dialect_from_env().strong_row_hash,
+    reason="Database system does not provide a strong row hash.",
+)
+def test_equal_no_join_columns_fingerprint(
+    engine: sa.Engine, table_with_duplicates_1: sa.Table
+):
+    comparison = sc.compare_tables(
+        engine, table_with_duplicates_1, table_with_duplicates_1
+    )
+    assert comparison.equal
+    # The equal fingerprints render the exact comparison unnecessary
+    statements = [
+        e.statement.upper()
+        for e in comparison.query_log.entries
+        if e.trigger == "equal"
+    ]
+    assert not any("EXCEPT" in statement for statement in statements)
+
+
+@pytest.mark.skipif(
+    dialect_from_env().name != "sqlite",
+    reason="Colliding row hashes are only known for SQLite.",
+)
+def test_equal_no_join_columns_fingerprint_collision(
+    engine: sa.Engine, table_factory: TableFactory
+):
+    # Find two pairs of distinct values whose row hashes have the same sum
+    sums: dict[int, tuple[int, int]] = {}
+    for a in itertools.count():
+        for b in range(a):
+            total = _hash(a) + _hash(b)
+            if total in sums and not {a, b} & set(sums[total]):
+                break
+            sums.setdefault(total, (a, b))
+        else:
+            continue
+        break
+    c, d = sums[total]
+
+    left = table_factory.create(
+        "equal_fingerprint_collision_1",
+        table_columns(),
+        [dict(id=a), dict(id=b)],
+    )
+    right = table_factory.create(
+        "equal_fingerprint_collision_2",
+        table_columns(),
+        [dict(id=c), dict(id=d)],
+    )
+    comparison = sc.compare_tables(engine, left, right)
+    assert not comparison.equal
+
+
+def test_equal_no_join_columns_fingerprint_type_mismatch(
+    engine: sa.Engine, table_factory: TableFactory
+):
+    # Value-equal columns of different types hash differently
+    data: list[dict[str, Any]] = [dict(value=1), dict(value=2), dict(value=2)]
+    integers = table_factory.create(
+        "equal_fingerprint_integer", [sa.Column("value", sa.Integer())], data
+    )
+    floats = table_factory.create(
+        "equal_fingerprint_float", [sa.Column("value", sa.Float())], data
+    )
+    comparison = sc.compare_tables(engine, integers, floats)
+    assert comparison.equal
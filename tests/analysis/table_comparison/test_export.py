@@ -0,0 +1,120 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import csv
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+from sqlcompyre.results._export import fetch_arrow
+
+
+def test_export_csv(
+    engine: sa.Engine,
+    table_students: sa.Table,
+    table_students_modified_3: sa.Table,
+    tmp_path: Path,
+):
+    row_matches = sc.compare_tables(
+        engine, table_students, table_students_modified_3
+    ).row_matches
+    path = tmp_path / "joined_unequal.csv"
+    n_rows = row_matches.export("joined_unequal", path, engine, batch_size=1)
+    assert n_rows == row_matches.n_joined_unequal
+
+    with path.open() as f:
+        rows = list(csv.reader(f))
+    with engine.connect() as conn:
+        result = conn.execute(row_matches.joined_unequal)
+        assert rows[0] == list(result.keys())
+        assert len(rows) - 1 == len(result.fetchall())
+
+
+def test_export_parquet(
+    engine: sa.Engine,
+    table_students: sa.Table,
+    table_students_modified_3: sa.Table,
+    tmp_path: Path,
+):
+    pq = pytest.importorskip("pyarrow.parquet")
+    row_matches = sc.compare_tables(
+        engine, table_students, table_students_modified_3
+    ).row_matches
+    for kind in ["unjoined_left", "unjoined_right", "joined_equal", "joined_unequal"]:
+        path = tmp_path / f"{kind}.parquet"
+        n_rows = row_matches.export(
+            kind,  # type: ignore
+            path,
+            engine,
+            format="parquet",
+            batch_size=2,
+        )
+        table = pq.read_table(path)
+        assert table.num_rows == n_rows
+        assert table.column_names == list(
+            row_matches.joined_total.selected_columns.keys()
+            if kind.startswith("joined")
+            else getattr(row_matches, kind).selected_columns.keys()
+        )
+
+
+def test_export_invalid_kind(
+    engine: sa.Engine,
+    table_students: sa.Table,
+    table_students_modified_3: sa.Table,
+    tmp_path: Path,
+):
+    row_matches = sc.compare_tables(
+        engine, table_students, table_students_modified_3
+    ).row_matches
+    with pytest.raises(ValueError, match="Unknown query"):
+        row_matches.export("n_joined_equal", tmp_path / "out.csv", engine)  # type: ignore
+
+
+def test_fetch_arrow_row_matches(
+    engine: sa.Engine,
+    table_students: sa.Table,
+    table_students_modified_3: sa.Table,
+):
+    pytest.importorskip("pyarrow")
+    row_matches = sc.compare_tables(
+        engine, table_students, table_students_modified_3
+    ).row_matches
+    for kind in ["unjoined_left", "unjoined_right", "joined_equal", "joined_unequal"]:
+        table = row_matches.fetch_arrow(kind, engine, batch_size=2).read_all()  # type: ignore
+        assert table.num_rows == getattr(row_matches, f"n_{kind}")
+        assert table.column_names == list(
+            getattr(row_matches, kind).selected_columns.keys()
+        )
+
+
+def test_fetch_arrow_column_matches(
+    engine: sa.Engine,
+    table_students: sa.Table,
+    table_students_modified_3: sa.Table,
+):
+    pytest.importorskip("pyarrow")
+    comparison = sc.compare_tables(engine, table_students, table_students_modified_3)
+    column_matches = comparison.column_matches
+    for column, query in column_matches.mismatch_selects.items():
+        table = column_matches.fetch_arrow(column, engine).read_all()
+        with engine.connect() as conn:
+            assert table.num_rows == len(conn.execute(query).fetchall())
+
+    with pytest.raises(ValueError, match="No mismatches"):
+        column_matches.fetch_arrow("unknown", engine)
+
+
+def test_fetch_arrow_untyped_null_batch(engine: sa.Engine, table_students: sa.Table):
+    pytest.importorskip("pyarrow")
+    # The type of the column is unknown and its values in the first batch are all NULL
+    value = sa.type_coerce(
+        sa.case((table_students.c["id"] > 2, table_students.c["age"])),
+        sa.types.NullType(),
+    ).label("value")
+    query = sa.select(table_students.c["id"], value).order_by(table_students.c["id"])
+    table = fetch_arrow(query, engine, batch_size=2).read_all()
+    assert table.num_rows == 5
+    assert table.column("value").null_count == 2
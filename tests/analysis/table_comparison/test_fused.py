@@ -0,0 +1,68 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""This file contains tests that verify that the fused execution mode yields the same results
+as the regular execution mode."""
+
+import math
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+
+
+@pytest.mark.parametrize(
+    "left,right",
+    [
+        ("table_students", "table_students"),
+        ("table_students", "table_students_small"),
+        ("table_students_modified_1", "table_students_modified_2"),
+        ("table_students", "table_students_modified_3"),
+    ],
+)
+def test_fused_same_as_regular(
+    engine: sa.Engine, request: pytest.FixtureRequest, left: str, right: str
+):
+    left_table = request.getfixturevalue(left)
+    right_table = request.getfixturevalue(right)
+    regular = sc.compare_tables(engine, left_table, right_table)
+    fused = sc.compare_tables(engine, left_table, right_table, fused=True)
+
+    assert fused.row_counts == regular.row_counts
+    for field in [
+        "n_unjoined_left",
+        "n_unjoined_right",
+        "n_joined_equal",
+        "n_joined_unequal",
+        "n_joined_total",
+    ]:
+        assert getattr(fused.row_matches, field) == getattr(regular.row_matches, field)
+    assert fused.column_matches.fraction_same == pytest.approx(
+        regular.column_matches.fraction_same
+    )
+
+
+def test_fused_no_joined_rows(
+    engine: sa.Engine, table_students: sa.Table, table_students_small: sa.Table
+):
+    comparison = sc.compare_tables(
+        engine,
+        sa.select(table_students).where(table_students.c["id"] == 1),
+        table_students_small,
+        join_columns=["id"],
+        fused=True,
+    )
+    assert comparison.row_counts.left == 1
+    assert comparison.row_counts.right == 4
+    assert comparison.row_matches.n_joined_total == 0
+    assert comparison.row_matches.n_unjoined_left == 1
+    assert comparison.row_matches.n_unjoined_right == 4
+    assert all(math.isnan(v) for v in comparison.column_matches.fraction_same.values())
+
+
+def test_fused_without_join_columns(engine: sa.Engine, table_students: sa.Table):
+    comparison = sc.compare_tables(
+        engine, sa.select(table_students), sa.select(table_students), fused=True
+    )
+    assert comparison.row_counts.left == comparison.row_counts.right == 5
@@ -0,0 +1,128 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""This file contains tests that verify that incremental comparisons via a watermark column
+yield the same results as regular comparisons."""
+
+import datetime as dt
+import decimal
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+from sqlcompyre import ResultCache
+from sqlcompyre.analysis._incremental import IncrementalState
+from tests._shared import TableFactory
+
+
+def _columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("value", sa.Integer()),
+        sa.Column("updated_at", sa.Integer()),
+    ]
+
+
+def _assert_same_as_regular(
+    engine: sa.Engine, left: sa.Table, right: sa.Table, cache: ResultCache
+):
+    regular = sc.compare_tables(engine, left, right, ignore_columns=["updated_at"])
+    incremental = sc.compare_tables(
+        engine,
+        left,
+        right,
+        ignore_columns=["updated_at"],
+        cache=cache,
+        watermark_column="updated_at",
+    )
+    assert incremental.row_counts == regular.row_counts
+    for field in [
+        "n_unjoined_left",
+        "n_unjoined_right",
+        "n_joined_equal",
+        "n_joined_unequal",
+        "n_joined_total",
+    ]:
+        assert getattr(incremental.row_matches, field) == getattr(
+            regular.row_matches, field
+        )
+    assert incremental.column_matches.fraction_same == pytest.approx(
+        regular.column_matches.fraction_same
+    )
+
+
+def test_incremental_same_as_regular(
+    engine: sa.Engine, table_factory: TableFactory, tmp_path: Path
+):
+    left = table_factory.create(
+        "incremental_left",
+        _columns(),
+        [dict(id=i, value=i, updated_at=1) for i in range(20)],
+    )
+    right = table_factory.create(
+        "incremental_right",
+        _columns(),
+        [dict(id=i, value=i + int(i == 3), updated_at=1) for i in range(2, 22)],
+    )
+    cache = ResultCache(tmp_path)
+
+    # Initial comparison of all rows
+    _assert_same_as_regular(engine, left, right, cache)
+
+    # Updates and insertions
+    with engine.begin() as conn:
+        conn.execute(
+            right.update().where(right.c["id"] == 3).values(value=3, updated_at=2)
+        )
+        conn.execute(
+            right.update().where(right.c["id"] == 5).values(value=-1, updated_at=2)
+        )
+        conn.execute(left.insert().values(id=100, value=100, updated_at=2))
+    _assert_same_as_regular(engine, left, right, cache)
+
+    # Deletions
+    with engine.begin() as conn:
+        conn.execute(left.delete().where(left.c["id"] == 7))
+    _assert_same_as_regular(engine, left, right, cache)
+
+
+def test_incremental_requires_cache(engine: sa.Engine, table_factory: TableFactory):
+    table = table_factory.create("incremental_no_cache", _columns(), [])
+    with pytest.raises(ValueError):
+        sc.compare_tables(engine, table, table, watermark_column="updated_at")
+
+
+@pytest.mark.parametrize("options", [{"fused": True}, {"partitions": 2}])
+def test_incremental_conflicting_modes(
+    engine: sa.Engine, table_factory: TableFactory, tmp_path: Path, options: dict
+):
+    name = f"incremental_{'_'.join(options)}"
+    table = table_factory.create(name, _columns(), [])
+    with pytest.raises(ValueError, match="Incremental"):
+        sc.compare_tables(
+            engine,
+            table,
+            table,
+            watermark_column="updated_at",
+            cache=ResultCache(tmp_path),
+            **options,
+        )
+
+
+def test_incremental_state_watermarks(tmp_path: Path):
+    state = IncrementalState(tmp_path / "state.sqlite3", n_columns=0)
+    assert state.watermarks() is None
+    watermarks = (dt.datetime(2026, 1, 2, 3, 4, 5), decimal.Decimal("1.50"))
+    state.update([("1", *watermarks, 1, 1, 0)], full=True)
+    assert state.watermarks() == watermarks
+
+    # Watermarks are persisted as JSON rather than as pickles
+    with sqlite3.connect(tmp_path / "state.sqlite3") as conn:
+        row = conn.execute(
+            "SELECT left_watermark, right_watermark FROM meta"
+        ).fetchone()
+    assert json.loads(row[0]) == {"type": "datetime", "value": "2026-01-02T03:04:05"}
@@ -0,0 +1,110 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""This file contains tests that verify that comparisons based on a materialized diff yield
+the same results as regular comparisons."""
+
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+from sqlcompyre import ResultCache
+
+
+@pytest.mark.parametrize(
+    "left,right",
+    [
+        ("table_students", "table_students"),
+        ("table_students", "table_students_small"),
+        ("table_students_modified_1", "table_students_modified_2"),
+        ("table_students", "table_students_modified_3"),
+    ],
+)
+def test_materialize_same_as_regular(
+    engine: sa.Engine, request: pytest.FixtureRequest, left: str, right: str
+):
+    left_table = request.getfixturevalue(left)
+    right_table = request.getfixturevalue(right)
+    regular = sc.compare_tables(engine, left_table, right_table)
+    with sc.compare_tables(
+        engine, left_table, right_table, materialize=True
+    ) as materialized:
+        assert materialized.row_counts == regular.row_counts
+        for field in [
+            "n_unjoined_left",
+            "n_unjoined_right",
+            "n_joined_equal",
+            "n_joined_unequal",
+            "n_joined_total",
+        ]:
+            assert getattr(materialized.row_matches, field) == getattr(
+                regular.row_matches, field
+            )
+        assert materialized.column_matches.fraction_same == pytest.approx(
+            regular.column_matches.fraction_same
+        )
+
+        assert materialized.connection is not None
+        for field in [
+            "unjoined_left",
+            "unjoined_right",
+            "joined_equal",
+            "joined_unequal",
+            "joined_total",
+        ]:
+            query = getattr(materialized.row_matches, field)
+            assert "sqlcompyre_diff" in str(query)
+            rows = materialized.connection.execute(query).all()
+            with engine.connect() as conn:
+                expected_rows = conn.execute(getattr(regular.row_matches, field)).all()
+            assert sorted(rows) == sorted(expected_rows)
+
+        for column, query in regular.column_matches.mismatch_selects.items():
+            with engine.connect() as conn:
+                expected = conn.execute(
+                    sa.select(sa.func.count()).select_from(query.subquery())
+                )
+                n_expected = expected.scalar_one()
+            n_actual = materialized.connection.execute(
+                sa.select(sa.func.count()).select_from(
+                    materialized.column_matches.mismatch_selects[column].subquery()
+                )
+            ).scalar_one()
+            assert n_actual == n_expected
+            assert materialized.get_top_changes(column) == regular.get_top_changes(
+                column
+            )
+
+    assert materialized.connection is None
+
+
+def test_materialize_close_recompute(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    comparison = sc.compare_tables(
+        engine, table_students, table_students_modified_3, materialize=True
+    )
+    expected = comparison.column_matches.fraction_same
+    comparison.close()
+    assert comparison.connection is None
+    assert comparison.get_top_changes("name", n=10) is not None
+    assert comparison.connection is not None
+    comparison.close()
+    assert expected == comparison.column_matches.fraction_same
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"fused": True}, {"partitions": 2}, {"watermark_column": "age", "cache": None}],
+)
+def test_materialize_conflicting_modes(
+    engine: sa.Engine, table_students: sa.Table, tmp_path: Path, options: dict
+):
+    if "cache" in options:
+        options = {**options, "cache": ResultCache(tmp_path)}
+    with pytest.raises(ValueError, match="Materialized"):
+        sc.compare_tables(
+            engine, table_students, table_students, materialize=True, **options
+        )
@@ -4,12 +4,15 @@
 """This file contains tests that verify SQLCompyre's behavior when tables contain no
 matching primary keys."""
 
+from pathlib import Path
 from typing import Any
 
 import pytest
 import sqlalchemy as sa
 
 import sqlcompyre as sc
+from sqlcompyre import ResultCache
+from sqlcompyre.analysis import TableComparison
 from tests._shared import TableFactory
 
 # -------------------------------------------------------------------------------------------------
@@ -120,9 +123,69 @@ def test_no_pk_row_matches_nullable_columns(
     comparison = sc.compare_tables(
         engine, table_lhs_nullable, table_rhs_nullable, infer_primary_keys=True
     )
-    assert comparison.join_columns == ["id", "other_without_null"]
+    assert comparison.join_columns == ["id"]
 
-    # When joining on ID and other_without_null, this should cause...
+    # When joining on ID, this should cause...
     row_matches = comparison.row_matches
     assert row_matches.n_joined_equal == 1
     assert row_matches.n_joined_unequal == 1
+
+
+def test_no_pk_null_counts_single_query(
+    engine: sa.Engine, table_lhs_nullable: sa.Table, table_rhs_nullable: sa.Table
+):
+    comparison = sc.compare_tables(
+        engine, table_lhs_nullable, table_rhs_nullable, infer_primary_keys=True
+    )
+    _ = comparison.join_columns
+    assert comparison._null_counts == (
+        {"other_with_null": 1, "other_without_null": 0},
+        {"other_with_null": 0, "other_without_null": 0},
+    )
+    # One query per table for the NULL counts, one per table for the distinct counts
+    assert len(comparison.query_log.entries) == 4
+
+
+@pytest.fixture(scope="module")
+def table_composite_key(table_factory: TableFactory) -> sa.Table:
+    data: list[dict[str, Any]] = [
+        dict(id=1, other_with_null=1, other_without_null=1),
+        dict(id=1, other_with_null=2, other_without_null=2),
+        dict(id=2, other_with_null=1, other_without_null=1),
+        dict(id=2, other_with_null=2, other_without_null=1),
+    ]
+    return table_factory.create("no_pk_composite_key", nullable_table_columns(), data)
+
+
+def test_no_pk_minimal_composite_key(engine: sa.Engine, table_composite_key: sa.Table):
+    comparison = sc.compare_tables(
+        engine, table_composite_key, table_composite_key, infer_primary_keys=True
+    )
+    assert comparison.join_columns == ["id", "other_with_null"]
+    assert comparison.equal
+
+
+def test_no_pk_inferred_key_persisted(
+    engine: sa.Engine,
+    table_lhs_nullable: sa.Table,
+    table_rhs_nullable: sa.Table,
+    tmp_path: Path,
+):
+    def compare() -> TableComparison:
+        return sc.compare_tables(
+            engine,
+            table_lhs_nullable,
+            table_rhs_nullable,
+            infer_primary_keys=True,
+            cache=ResultCache(tmp_path),
+        )
+
+    assert compare().join_columns == ["id"]
+
+    # The persisted key is only validated rather than discovered again
+    comparison = compare()
+    assert comparison.join_columns == ["id"]
+    assert "_null_counts" not in comparison.__dict__
+    assert not any(
+        "DISTINCT" in e.statement.upper() for e in comparison.query_log.entries
+    )
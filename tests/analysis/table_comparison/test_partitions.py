@@ -0,0 +1,79 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""This file contains tests that verify that comparing tables in key-range partitions yields the
+same results as the regular execution mode."""
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+
+
+@pytest.mark.parametrize("partitions", [2, 3, 10])
+@pytest.mark.parametrize(
+    "left,right",
+    [
+        ("table_students", "table_students"),
+        ("table_students", "table_students_small"),
+        ("table_students_modified_1", "table_students_modified_2"),
+        ("table_students", "table_students_modified_3"),
+    ],
+)
+def test_partitions_same_as_regular(
+    engine: sa.Engine,
+    request: pytest.FixtureRequest,
+    left: str,
+    right: str,
+    partitions: int,
+):
+    left_table = request.getfixturevalue(left)
+    right_table = request.getfixturevalue(right)
+    regular = sc.compare_tables(engine, left_table, right_table)
+    partitioned = sc.compare_tables(
+        engine, left_table, right_table, partitions=partitions
+    )
+
+    assert partitioned.row_counts == regular.row_counts
+    for field in [
+        "n_unjoined_left",
+        "n_unjoined_right",
+        "n_joined_equal",
+        "n_joined_unequal",
+        "n_joined_total",
+    ]:
+        assert getattr(partitioned.row_matches, field) == getattr(
+            regular.row_matches, field
+        )
+    assert partitioned.column_matches.fraction_same == pytest.approx(
+        regular.column_matches.fraction_same
+    )
+
+
+def test_partitions_right_keys_out_of_range(
+    engine: sa.Engine, table_students: sa.Table
+):
+    # The keys of the right table exceed the range of keys of the left table
+    comparison = sc.compare_tables(
+        engine,
+        sa.select(table_students).where(table_students.c["id"] <= 2),
+        table_students,
+        join_columns=["id"],
+        partitions=2,
+    )
+    assert comparison.row_counts.left == 2
+    assert comparison.row_counts.right == 5
+    assert comparison.row_matches.n_joined_equal == 2
+    assert comparison.row_matches.n_unjoined_right == 3
+
+
+def test_partitions_invalid(engine: sa.Engine, table_students: sa.Table):
+    with pytest.raises(ValueError):
+        sc.compare_tables(engine, table_students, table_students, partitions=0)
+
+
+def test_partitions_fused(engine: sa.Engine, table_students: sa.Table):
+    with pytest.raises(ValueError, match="partitions"):
+        sc.compare_tables(
+            engine, table_students, table_students, partitions=2, fused=True
+        )
@@ -0,0 +1,88 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+from sqlcompyre import QueryLog
+
+
+def test_query_log_triggers(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    comparison = sc.compare_tables(engine, table_students, table_students_modified_3)
+    _ = comparison.row_counts
+    assert [e.trigger for e in comparison.query_log.entries] == [
+        "row_counts",
+        "row_counts",
+    ]
+    assert all(e.rows == 1 for e in comparison.query_log.entries)
+    assert all(e.duration >= 0 for e in comparison.query_log.entries)
+    assert all("count" in e.statement.lower() for e in comparison.query_log.entries)
+
+    comparison.summary_report()
+    triggers = set(comparison.query_log.timings())
+    assert "summary_report/row_matches" in triggers
+    assert "summary_report/column_matches" in triggers
+    assert "row_counts" in triggers
+
+
+def test_query_log_rows(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    comparison = sc.compare_tables(engine, table_students, table_students_modified_3)
+    changes = comparison.get_top_changes("name", n=10)
+    (entry,) = comparison.query_log.entries
+    assert entry.trigger == "get_top_changes"
+    assert entry.rows == len(changes)
+
+
+def test_query_log_shared(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    query_log = QueryLog()
+    comparison = sc.compare_tables(
+        engine, table_students, table_students_modified_3, query_log=query_log
+    )
+    inspection = sc.inspect(engine, table_students, query_log=query_log)
+    _ = comparison.row_counts
+    _ = inspection.row_count
+    _ = inspection.column_stats("age").max
+    assert [e.trigger for e in query_log.entries] == [
+        "row_counts",
+        "row_counts",
+        "row_count",
+        "max",
+    ]
+
+    # Statements outside of properties are not recorded
+    with engine.connect() as conn:
+        conn.execute(sa.select(sa.func.count()).select_from(table_students))
+    assert len(query_log.entries) == 4
+
+
+def test_query_log_partitions(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    comparison = sc.compare_tables(
+        engine, table_students, table_students_modified_3, partitions=2
+    )
+    _ = comparison.row_matches
+    timings = comparison.query_log.timings()
+    # One query for the split points, one query per partition
+    assert timings["row_matches"][0] == 3
+
+
+def test_query_log_explain(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    comparison = sc.compare_tables(
+        engine,
+        table_students,
+        table_students_modified_3,
+        query_log=QueryLog(explain=True),
+    )
+    _ = comparison.column_matches
+    assert len(comparison.query_log.entries) > 0
+    for entry in comparison.query_log.entries:
+        assert entry.plan
@@ -0,0 +1,180 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""This file contains tests that verify row and column matches computed on a sample of the
+rows."""
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+from tests._shared import TableFactory
+
+N_ROWS = 2000
+
+
+@pytest.fixture(scope="module")
+def table_values(table_factory: TableFactory) -> sa.Table:
+    return table_factory.create(
+        "sampling_values",
+        [
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+            sa.Column("value", sa.Integer()),
+        ],
+        [dict(id=i, value=i % 7) for i in range(N_ROWS)],
+    )
+
+
+@pytest.fixture(scope="module")
+def table_values_modified(table_factory: TableFactory) -> sa.Table:
+    return table_factory.create(
+        "sampling_values_modified",
+        [
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+            sa.Column("value", sa.Integer()),
+        ],
+        # Every fourth value is different
+        [dict(id=i, value=(i % 7) + int(i % 4 == 0)) for i in range(N_ROWS)],
+    )
+
+
+def test_sampling_full_same_as_regular(
+    engine: sa.Engine, table_values: sa.Table, table_values_modified: sa.Table
+):
+    regular = sc.compare_tables(engine, table_values, table_values_modified)
+    sampled = sc.compare_tables(
+        engine, table_values, table_values_modified, sample_fraction=1.0
+    )
+    assert sampled.row_matches.n_joined_total == regular.row_matches.n_joined_total
+    assert sampled.row_matches.n_joined_equal == regular.row_matches.n_joined_equal
+    assert sampled.row_matches.sample_fraction == 1.0
+    assert sampled.column_matches.fraction_same == pytest.approx(
+        regular.column_matches.fraction_same
+    )
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_sampling_fraction(
+    engine: sa.Engine,
+    table_values: sa.Table,
+    table_values_modified: sa.Table,
+    fused: bool,
+):
+    comparison = sc.compare_tables(
+        engine, table_values, table_values_modified, sample_fraction=0.2, fused=fused
+    )
+
+    # Row counts are exact, row matches are restricted to the (same) sample on both sides
+    assert comparison.row_counts.left == comparison.row_counts.right == N_ROWS
+    row_matches = comparison.row_matches
+    assert 0 < row_matches.n_joined_total < N_ROWS
+    assert row_matches.n_unjoined_left == row_matches.n_unjoined_right == 0
+
+    # The confidence interval should contain the actual fraction of matching values
+    column_matches = comparison.column_matches
+    assert column_matches.confidence_intervals is not None
+    lower, upper = column_matches.confidence_intervals["value"]
+    assert lower <= column_matches.fraction_same["value"] <= upper
+    assert lower <= 0.75 <= upper
+
+
+@pytest.fixture(scope="module")
+def table_values_extended(table_factory: TableFactory) -> sa.Table:
+    return table_factory.create(
+        "sampling_values_extended",
+        [
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+            sa.Column("value", sa.Integer()),
+        ],
+        # Same values as `table_values` but with additional rows
+        [dict(id=i, value=i % 7) for i in range(N_ROWS + 50)],
+    )
+
+
+def test_sampling_equal_exact(
+    engine: sa.Engine, table_values: sa.Table, table_values_extended: sa.Table
+):
+    comparison = sc.compare_tables(
+        engine, table_values, table_values_extended, sample_fraction=0.01
+    )
+    assert comparison.row_counts.left != comparison.row_counts.right
+    assert not comparison.equal
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_sampling_equal_ignores_sampled_row_matches(
+    engine: sa.Engine,
+    table_values: sa.Table,
+    table_values_extended: sa.Table,
+    fused: bool,
+):
+    comparison = sc.compare_tables(
+        engine, table_values, table_values_extended, sample_fraction=0.01, fused=fused
+    )
+    # Row matches of the sample must not be used to determine equality
+    assert comparison.row_matches.sample_fraction == 0.01
+    assert not comparison.equal
+
+
+@pytest.mark.parametrize(
+    ("left_type", "right_type"),
+    [
+        (sa.Integer(), sa.Float()),
+        (sa.Integer(), sa.BigInteger()),
+        (sa.Numeric(10, 2), sa.Numeric(18, 4)),
+    ],
+)
+def test_sampling_key_types_differ(
+    engine: sa.Engine,
+    table_factory: TableFactory,
+    left_type: sa.types.TypeEngine,
+    right_type: sa.types.TypeEngine,
+):
+    def create(name: str, key_type: sa.types.TypeEngine) -> sa.Table:
+        return table_factory.create(
+            name,
+            [
+                sa.Column("id", key_type, primary_key=True, autoincrement=False),
+                sa.Column("value", sa.Integer()),
+            ],
+            [dict(id=i, value=i % 7) for i in range(1000)],
+        )
+
+    suffix = f"{type(left_type).__name__}_{type(right_type).__name__}".lower()
+    left = create(f"sampling_keys_left_{suffix}", left_type)
+    right = create(f"sampling_keys_right_{suffix}", right_type)
+    comparison = sc.compare_tables(engine, left, right, sample_fraction=0.5)
+
+    # The same keys must be sampled on both sides
+    row_matches = comparison.row_matches
+    assert 0 < row_matches.n_joined_total < 1000
+    assert row_matches.n_unjoined_left == row_matches.n_unjoined_right == 0
+    assert row_matches.n_joined_equal == row_matches.n_joined_total
+    assert comparison.equal
+
+
+def test_sampling_deterministic(engine: sa.Engine, table_values: sa.Table):
+    first = sc.compare_tables(engine, table_values, table_values, sample_fraction=0.1)
+    second = sc.compare_tables(engine, table_values, table_values, sample_fraction=0.1)
+    assert first.row_matches.n_joined_total == second.row_matches.n_joined_total
+
+
+def test_sampling_report(
+    engine: sa.Engine, table_values: sa.Table, table_values_modified: sa.Table
+):
+    comparison = sc.compare_tables(
+        engine, table_values, table_values_modified, sample_fraction=0.5
+    )
+    report = str(comparison.summary_report())
+    assert "50.00% sample" in report
+    assert "[" in report.split("Column Matches")[1]
+
+
+@pytest.mark.parametrize("sample_fraction", [0.0, 1.5])
+def test_sampling_invalid_fraction(
+    engine: sa.Engine, table_values: sa.Table, sample_fraction: float
+):
+    with pytest.raises(ValueError):
+        sc.compare_tables(
+            engine, table_values, table_values, sample_fraction=sample_fraction
+        )
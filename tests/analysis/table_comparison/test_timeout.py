@@ -0,0 +1,90 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import time
+from typing import Any, cast
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+from sqlcompyre.analysis import StatementTimeoutError, TableComparison
+from sqlcompyre.analysis.dialects import DialectProtocol
+from sqlcompyre.analysis.timeout import _RunningStatement, attach, statement_timeout
+from sqlcompyre.results import ColumnMatches, Skipped
+
+_SLOW_QUERY = sa.text(
+    "WITH RECURSIVE r(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM r WHERE i < 1000000000) "
+    "SELECT count(*) FROM r"
+)
+
+
+@pytest.mark.skip_dialect("mssql")
+def test_statement_timeout(engine: sa.Engine):
+    attach(engine)
+    start = time.perf_counter()
+    with engine.connect() as conn:
+        with pytest.raises(StatementTimeoutError, match="timeout of 0.2s"):
+            with statement_timeout(0.2):
+                conn.execute(_SLOW_QUERY)
+        conn.rollback()
+        # The connection can still be used after the statement has been cancelled
+        assert conn.execute(sa.text("SELECT 1")).scalar() == 1
+    assert time.perf_counter() - start < 10
+
+
+def test_statement_timeout_after_stop():
+    cancelled = []
+
+    class Dialect:
+        name = "test"
+
+        def cancel(self, dbapi_connection: Any, cursor: Any) -> None:
+            cancelled.append(cursor)
+
+    running = _RunningStatement(
+        dialect=cast(DialectProtocol, Dialect()),
+        dbapi_connection=None,
+        cursor="cursor",
+        timeout=60,
+    )
+    running.start()
+    running.stop()
+    # A timer firing after the statement ended must not interrupt the connection
+    running.cancel()
+    assert cancelled == []
+    assert not running.cancelled
+
+
+def test_statement_timeout_fast_query(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    comparison = sc.compare_tables(
+        engine, table_students, table_students_modified_3, timeout=60
+    )
+    report = comparison.summary_report()
+    assert not any(isinstance(s.content, Skipped) for s in report.sections)
+
+
+def test_timeout_positive(
+    engine: sa.Engine, table_students: sa.Table, table_students_modified_3: sa.Table
+):
+    with pytest.raises(ValueError, match="positive"):
+        sc.compare_tables(engine, table_students, table_students_modified_3, timeout=0)
+
+
+def test_summary_report_skipped(
+    monkeypatch: pytest.MonkeyPatch,
+    engine: sa.Engine,
+    table_students: sa.Table,
+    table_students_modified_3: sa.Table,
+):
+    def row_matches(self: TableComparison):
+        raise StatementTimeoutError("Statement exceeded its timeout of 1s.")
+
+    monkeypatch.setattr(TableComparison, "row_matches", property(row_matches))
+    comparison = sc.compare_tables(engine, table_students, table_students_modified_3)
+    sections = {s.name: s.content for s in comparison.summary_report().sections}
+    assert sections["Row Matches"] == Skipped("Statement exceeded its timeout of 1s.")
+    assert sections["Row Counts"] == comparison.row_counts
+    assert isinstance(sections["Column Matches"], ColumnMatches)
@@ -3,6 +3,7 @@
 
 """This file contains tests that verify the "top changes" comparison."""
 
+import pytest
 import sqlalchemy as sa
 
 import sqlcompyre as sc
@@ -23,3 +24,56 @@ def test_column_matches_changes_different(
         engine, table_students_modified_1, table_students_modified_2
     )
     assert comp.get_top_changes("age") == {"18 -> 17": 1}
+
+
+def test_all_top_changes_same(engine: sa.Engine, table_students: sa.Table):
+    comp = sc.compare_tables(engine, table_students, table_students)
+    top_changes = comp.get_all_top_changes()
+    assert top_changes.changes == {"age": {}, "gpa": {}, "name": {}}
+
+
+@pytest.mark.parametrize("materialize", [False, True])
+def test_all_top_changes_same_as_single(
+    engine: sa.Engine,
+    table_students: sa.Table,
+    table_students_modified_3: sa.Table,
+    materialize: bool,
+):
+    comp = sc.compare_tables(
+        engine, table_students, table_students_modified_3, materialize=materialize
+    )
+    top_changes = comp.get_all_top_changes(n=1)
+    for column, changes in top_changes.changes.items():
+        assert len(changes) <= 1
+        assert sum(changes.values()) == sum(comp.get_top_changes(column, n=1).values())
+    comp.close()
+
+
+def test_all_top_changes_single_join(
+    engine: sa.Engine,
+    table_students_modified_1: sa.Table,
+    table_students_modified_2: sa.Table,
+):
+    comp = sc.compare_tables(
+        engine, table_students_modified_1, table_students_modified_2
+    )
+    comp.query_log.clear()
+    top_changes = comp.get_all_top_changes()
+    assert len(comp.query_log.entries) == 1
+    # The tables are joined once and the unpivoted column names are cross joined
+    assert comp.query_log.entries[0].statement.upper().count(" JOIN ") == 2
+    for column, changes in top_changes.changes.items():
+        assert changes == comp.get_top_changes(column)
+
+
+def test_all_top_changes_report(
+    engine: sa.Engine,
+    table_students_modified_1: sa.Table,
+    table_students_modified_2: sa.Table,
+):
+    comp = sc.compare_tables(
+        engine, table_students_modified_1, table_students_modified_2
+    )
+    report = str(comp.summary_report(top_changes=3))
+    assert "Top Changes" in report
+    assert "18 -> 17" in report
@@ -68,6 +68,22 @@ def test_compare_schemas_with_tables(
 
     assert len(run_skipped.stdout) < len(run_unskipped.stdout)
 
+    run_concurrent = script_runner.run(
+        [
+            "compyre",
+            "schemas",
+            schema_1,
+            schema_2,
+            "-s",
+            connection_string_raw_string,
+            "--compare-tables",
+            "--jobs",
+            "2",
+        ]
+    )
+    assert run_concurrent.returncode == 0
+    assert run_concurrent.stdout == run_unskipped.stdout
+
 
 @pytest.mark.parametrize(
     ("config", "output_sections"),
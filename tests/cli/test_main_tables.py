@@ -1,6 +1,8 @@
 # Copyright (c) QuantCo 2024-2024
 # SPDX-License-Identifier: BSD-3-Clause
 
+from pathlib import Path
+
 import sqlalchemy as sa
 from pytest_console_scripts import ScriptRunner
 
@@ -38,3 +40,130 @@ def test_compare_tables_only_pk(
         ]
     )
     assert run.returncode == 0
+
+
+def test_compare_tables_checksum(
+    script_runner: ScriptRunner,
+    connection_string_raw_string: str,
+    table_1: sa.Table,
+    table_2: sa.Table,
+):
+    run = script_runner.run(
+        [
+            "compyre",
+            "tables",
+            str(table_1),
+            str(table_2),
+            "-s",
+            connection_string_raw_string,
+            "--strategy",
+            "checksum",
+            "--join-columns",
+            "id",
+        ]
+    )
+    assert run.returncode == 0
+    assert "Row Matches" in run.stdout
+    assert "Column Matches" not in run.stdout
+
+
+def test_compare_tables_cache_dir(
+    script_runner: ScriptRunner,
+    connection_string_raw_string: str,
+    table_1: sa.Table,
+    table_2: sa.Table,
+    tmp_path: Path,
+):
+    for _ in range(2):
+        run = script_runner.run(
+            [
+                "compyre",
+                "tables",
+                str(table_1),
+                str(table_2),
+                "-s",
+                connection_string_raw_string,
+                "--join-columns",
+                "id",
+                "--cache-dir",
+                str(tmp_path / "cache"),
+            ]
+        )
+        assert run.returncode == 0
+
+
+def test_compare_tables_profile(
+    script_runner: ScriptRunner,
+    connection_string_raw_string: str,
+    table_1: sa.Table,
+    table_2: sa.Table,
+):
+    run = script_runner.run(
+        [
+            "compyre",
+            "tables",
+            str(table_1),
+            str(table_2),
+            "-s",
+            connection_string_raw_string,
+            "--join-columns",
+            "id",
+            "--profile",
+        ]
+    )
+    assert run.returncode == 0
+    assert "Query profile" in run.stdout
+    assert "summary_report/row_counts" in run.stdout
+
+
+def test_compare_tables_timeout(
+    script_runner: ScriptRunner,
+    connection_string_raw_string: str,
+    table_1: sa.Table,
+    table_2: sa.Table,
+):
+    run = script_runner.run(
+        [
+            "compyre",
+            "tables",
+            str(table_1),
+            str(table_2),
+            "-s",
+            connection_string_raw_string,
+            "--join-columns",
+            "id",
+            "--timeout",
+            "60",
+        ]
+    )
+    assert run.returncode == 0
+    assert "Skipped" not in run.stdout
+
+
+def test_compare_tables_export_mismatches(
+    script_runner: ScriptRunner,
+    connection_string_raw_string: str,
+    table_1: sa.Table,
+    table_2: sa.Table,
+    tmp_path: Path,
+):
+    run = script_runner.run(
+        [
+            "compyre",
+            "tables",
+            str(table_1),
+            str(table_2),
+            "-s",
+            connection_string_raw_string,
+            "--join-columns",
+            "id",
+            "--export-mismatches",
+            str(tmp_path / "mismatches"),
+        ]
+    )
+    assert run.returncode == 0
+    assert {p.name for p in (tmp_path / "mismatches").iterdir()} == {
+        "unjoined_left.csv",
+        "unjoined_right.csv",
+        "joined_unequal.csv",
+    }
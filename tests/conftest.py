@@ -5,6 +5,7 @@ import os
 
 import pytest
 import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from tests._shared import SchemaFactory, TableFactory, dialect_from_env
 
@@ -39,6 +40,17 @@ def engine(connection_string: sa.URL) -> sa.Engine:
     return sa.create_engine(connection_string)
 
 
+@pytest.fixture(scope="session")
+def async_engine(connection_string: sa.URL) -> AsyncEngine:
+    if connection_string.get_backend_name() != "sqlite":
+        pytest.skip("Asynchronous access is only tested for SQLite.")
+    pytest.importorskip("aiosqlite")
+    # Pooled connections are bound to the event loop they were created in
+    return create_async_engine(
+        connection_string.set(drivername="sqlite+aiosqlite"), poolclass=sa.NullPool
+    )
+
+
 # -------------------------------------------------------------------------------------------------
 # SCHEMA FACTORIES
 # -------------------------------------------------------------------------------------------------
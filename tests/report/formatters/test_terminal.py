@@ -6,7 +6,14 @@ from pytest_lazyfixture import lazy_fixture
 
 from sqlcompyre.report.formatters import TerminalFormatter
 from sqlcompyre.report.schema import Metadata, Section
-from sqlcompyre.results import ColumnMatches, Counts, Names, RowMatches
+from sqlcompyre.results import (
+    ColumnMatches,
+    Counts,
+    Names,
+    RowMatches,
+    Skipped,
+    TopChanges,
+)
 
 
 @pytest.fixture()
@@ -160,3 +167,84 @@ def test_terminal_formatter_column_matches(
         hide_matching_columns=hide_matching_columns,
     )
     assert actual == expected
+
+
+def test_terminal_formatter_column_matches_confidence_intervals(
+    expected_header: str, metadata: Metadata
+):
+    column_matches = ColumnMatches(
+        fraction_same={"col1": 1.0, "col2": 0.5},
+        mismatch_selects={},
+        confidence_intervals={"col1": (0.98765, 1.0), "col2": (0.40001, 0.59999)},
+    )
+    formatter = TerminalFormatter(colored=False)
+    actual = formatter.format(metadata, [Section("Column Matches", column_matches)])
+    expected = """
+Column Matches
+==============
+ col1 | 100.00% | [98.76%, 100.00%]
+ col2 |  50.00% |  [40.00%, 60.00%]"""
+    assert actual == expected_header + expected
+
+
+# -------------------------------------------------------------------------------------------------
+# TOP CHANGES
+# -------------------------------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("hide_matching_columns", "expected"),
+    [
+        (
+            False,
+            """
+Top Changes
+===========
+ col1 |    1 -> 2 | 1,000
+      | NULL -> 3 |    12
+ col2 |       n/a |""",
+        ),
+        (
+            True,
+            """
+Top Changes
+===========
+ col1 |    1 -> 2 | 1,000
+      | NULL -> 3 |    12""",
+        ),
+    ],
+)
+def test_terminal_formatter_top_changes(
+    expected_header: str,
+    metadata: Metadata,
+    hide_matching_columns: bool,
+    expected: str,
+):
+    top_changes = TopChanges(
+        changes={"col2": {}, "col1": {"1 -> 2": 1000, "NULL -> 3": 12}}
+    )
+    formatter = TerminalFormatter(colored=False)
+    actual = formatter.format(
+        metadata,
+        [Section("Top Changes", top_changes)],
+        hide_matching_columns=hide_matching_columns,
+    )
+    assert actual == expected_header + expected
+
+
+# -------------------------------------------------------------------------------------------------
+# SKIPPED
+# -------------------------------------------------------------------------------------------------
+
+
+def test_terminal_formatter_skipped(expected_header: str, metadata: Metadata):
+    formatter = TerminalFormatter(colored=False)
+    actual = formatter.format(
+        metadata,
+        [Section("Row Matches", Skipped("Statement exceeded its timeout of 1s."))],
+    )
+    expected = """
+Row Matches
+===========
+ Skipped: Statement exceeded its timeout of 1s."""
+    assert actual == expected_header + expected
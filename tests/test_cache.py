@@ -0,0 +1,216 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+from sqlcompyre import ResultCache
+from tests._shared import TableFactory
+
+# -------------------------------------------------------------------------------------------------
+# CACHE
+# -------------------------------------------------------------------------------------------------
+
+
+def test_cache_get_set(tmp_path: Path):
+    cache = ResultCache(tmp_path)
+    key = cache.key(result="test", value=1)
+    assert cache.get(key) is None
+    cache.set(key, {"a": 1})
+    assert cache.get(key) == {"a": 1}
+    assert cache.get(cache.key(result="test", value=2)) is None
+
+
+def test_cache_max_age(tmp_path: Path):
+    cache = ResultCache(tmp_path, max_age=timedelta(seconds=-1))
+    key = cache.key(result="test")
+    cache.set(key, 1)
+    assert cache.get(key) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_max_size(tmp_path: Path):
+    cache = ResultCache(tmp_path, max_size=8)
+    cache.set(cache.key(result="first"), "abc")
+    cache.set(cache.key(result="second"), "def")
+    assert cache.get(cache.key(result="first")) is None
+    assert cache.get(cache.key(result="second")) == "def"
+
+
+def test_cache_clear(tmp_path: Path):
+    cache = ResultCache(tmp_path)
+    cache.set(cache.key(result="test"), 1)
+    cache.clear()
+    assert cache.get(cache.key(result="test")) is None
+
+
+# -------------------------------------------------------------------------------------------------
+# TABLE COMPARISON
+# -------------------------------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def table_cached(table_factory: TableFactory) -> sa.Table:
+    return table_factory.create(
+        "cached",
+        [
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+            sa.Column("value", sa.Integer()),
+        ],
+        [dict(id=i, value=i % 3) for i in range(10)],
+    )
+
+
+@pytest.fixture(scope="module")
+def table_cached_modified(table_factory: TableFactory) -> sa.Table:
+    return table_factory.create(
+        "cached_modified",
+        [
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+            sa.Column("value", sa.Integer()),
+        ],
+        [dict(id=i, value=i % 2) for i in range(1, 12)],
+    )
+
+
+@pytest.mark.skip_dialect("mssql")
+def test_table_comparison_cache_hit(
+    engine: sa.Engine,
+    table_cached: sa.Table,
+    table_cached_modified: sa.Table,
+    tmp_path: Path,
+):
+    cache = ResultCache(tmp_path)
+    expected = sc.compare_tables(
+        engine, table_cached, table_cached_modified, cache=cache
+    )
+    expected_results = (
+        expected.row_counts,
+        expected.row_matches.n_joined_equal,
+        expected.column_matches.fraction_same,
+    )
+    assert len(list(tmp_path.iterdir())) == 3
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", record)
+    try:
+        comparison = sc.compare_tables(
+            engine, table_cached, table_cached_modified, cache=cache
+        )
+        actual_results = (
+            comparison.row_counts,
+            comparison.row_matches.n_joined_equal,
+            comparison.column_matches.fraction_same,
+        )
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", record)
+
+    assert actual_results == expected_results
+    assert statements == []
+    assert comparison.row_matches.joined_unequal is not None
+    assert set(comparison.column_matches.mismatch_selects) == {"value"}
+
+
+@pytest.mark.skip_dialect("mssql")
+def test_table_comparison_cache_invalidated(
+    engine: sa.Engine, table_factory: TableFactory, tmp_path: Path
+):
+    table = table_factory.create(
+        "cached_invalidated",
+        [sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False)],
+        [dict(id=i) for i in range(10)],
+    )
+    cache = ResultCache(tmp_path)
+    comparison = sc.compare_tables(engine, table, table, cache=cache)
+    assert comparison.row_counts.left == 10
+
+    with engine.begin() as conn:
+        conn.execute(table.insert().values(id=100))
+
+    comparison = sc.compare_tables(engine, table, table, cache=cache)
+    assert comparison.row_counts.left == 11
+
+
+def test_table_comparison_query_not_cached(
+    engine: sa.Engine, table_cached: sa.Table, tmp_path: Path
+):
+    cache = ResultCache(tmp_path)
+    comparison = sc.compare_tables(
+        engine, sa.select(table_cached), table_cached, join_columns=["id"], cache=cache
+    )
+    assert comparison.row_matches.n_joined_equal == 10
+    assert not tmp_path.exists() or list(tmp_path.iterdir()) == []
+
+
+# -------------------------------------------------------------------------------------------------
+# REFLECTION
+# -------------------------------------------------------------------------------------------------
+
+
+def _skip_unless_schema_version(engine: sa.Engine, schema: str | None) -> None:
+    try:
+        version = engine.dialect.get_schema_version(engine, schema)  # type: ignore
+    except NotImplementedError:
+        pytest.skip("Dialect does not support versioning schemas.")
+    if version is None:
+        pytest.skip("Schema cannot be versioned.")
+
+
+def test_reflection_cache_hit(
+    engine: sa.Engine,
+    table_cached: sa.Table,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _skip_unless_schema_version(engine, table_cached.schema)
+    cache = ResultCache(tmp_path)
+    expected = sc.inspect_table(engine, str(table_cached), cache=cache)
+    (path,) = tmp_path.iterdir()
+    # Table definitions are cached as JSON descriptions
+    description = json.loads(path.read_text())
+    assert [c["name"] for c in description["columns"]] == ["id", "value"]
+    assert description["primary_keys"] == {table_cached.name: ["id"]}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Tables must not be reflected.")
+
+    monkeypatch.setattr(type(engine.dialect), "reflect_tables", fail)
+    monkeypatch.setattr(sa.MetaData, "reflect", fail)
+    # Use a new engine as tables are shared across reflections on the same engine
+    inspection = sc.inspect_table(
+        sa.create_engine(engine.url), str(table_cached), cache=cache
+    )
+    assert inspection.row_count == expected.row_count == 10
+    assert [c.name for c in inspection.query.primary_key] == ["id"]  # type: ignore
+    assert [type(c.type) for c in inspection.query.columns] == [  # type: ignore
+        type(c.type)
+        for c in expected.query.columns  # type: ignore
+    ]
+
+
+def test_reflection_cache_invalidated(
+    engine: sa.Engine,
+    table_factory: TableFactory,
+    table_cached: sa.Table,
+    tmp_path: Path,
+):
+    _skip_unless_schema_version(engine, table_cached.schema)
+    cache = ResultCache(tmp_path)
+    sc.inspect_table(engine, str(table_cached), cache=cache)
+
+    table = table_factory.create(
+        "cached_reflection",
+        [sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False)],
+        [dict(id=1)],
+    )
+    inspection = sc.inspect_table(engine, str(table), cache=cache)
+    assert inspection.row_count == 1
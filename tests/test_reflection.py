@@ -0,0 +1,82 @@
+# Copyright (c) QuantCo 2026-2026
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+import sqlalchemy as sa
+
+import sqlcompyre as sc
+from sqlcompyre.analysis._reflection import LazyTables, reflect
+from tests._shared import TableFactory
+
+
+def table_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("value", sa.String(20)),
+    ]
+
+
+@pytest.fixture(scope="module")
+def table_shared(table_factory: TableFactory) -> sa.Table:
+    return table_factory.create("reflection_shared", table_columns(), [dict(id=1)])
+
+
+def test_reflect_only(engine: sa.Engine, table_shared: sa.Table):
+    tables = reflect(
+        engine,
+        table_shared.schema,
+        views=True,
+        only=[table_shared.name, "reflection_missing"],
+    )
+    assert [t.name for t in tables] == [table_shared.name]
+    assert [c.name for c in tables[0].columns] == ["id", "value"]
+
+
+def test_reflect_shared_across_calls(
+    engine: sa.Engine, table_factory: TableFactory, table_shared: sa.Table
+):
+    try:
+        version = engine.dialect.get_schema_version(  # type: ignore
+            engine, table_shared.schema
+        )
+    except NotImplementedError:
+        version = None
+    if version is None:
+        pytest.skip("Tables are only shared for schemas that can be versioned.")
+
+    other = table_factory.create("reflection_shared_other", table_columns(), [])
+    first = sc.inspect_table(engine, str(table_shared)).query
+    second = sc.inspect_table(engine, str(table_shared)).query
+    assert first is second
+
+    # Changes of the schema cause tables to be reflected anew
+    other.drop(engine)
+    third = sc.inspect_table(engine, str(table_shared)).query
+    assert third is not first
+    assert [c.name for c in third.columns] == ["id", "value"]  # type: ignore
+
+
+def test_lazy_tables(
+    engine: sa.Engine, table_shared: sa.Table, monkeypatch: pytest.MonkeyPatch
+):
+    tables = LazyTables(
+        sa.create_engine(engine.url),
+        {"shared": (table_shared.schema, table_shared.name)},
+    )
+    assert list(tables) == ["shared"]
+    assert len(tables) == 1
+    placeholder = tables.placeholder("shared")
+    assert str(placeholder) == str(table_shared)
+    assert len(placeholder.columns) == 0
+
+    table = tables["shared"]
+    assert [c.name for c in table.primary_key] == ["id"]
+    assert tables.placeholder("shared") is table
+
+    # Tables are only reflected once
+    def fail(*args, **kwargs):
+        raise AssertionError("Tables must not be reflected.")
+
+    monkeypatch.setattr(type(engine.dialect), "reflect_tables", fail)
+    monkeypatch.setattr(sa.MetaData, "reflect", fail)
+    assert tables["shared"] is table